@@ -9,6 +9,9 @@ Supports: BTCXAU, BTCUSD, XAUUSD + 10 Forex pairs (24/7 Trading)
 __version__ = "2.0.0"
 __author__ = "A6-9V"
 
+import asyncio
+import importlib
+
 from .autonomous_agent import AutonomousAgent
 from .self_manager import SelfManager
 from .decision_engine import DecisionEngine
@@ -17,7 +20,29 @@ from .forex_indicators import ForexIndicators, IndicatorConfig, calculate_forex_
 from .trading_scheduler import TradingScheduler, TradingSession, trading_scheduler, initialize_scheduler
 from .crypto_gold_trader import CryptoGoldTrader, CryptoGoldPair, crypto_gold_trader, analyze_all_crypto_gold_pairs
 
+
+
+def install_fast_loop() -> str:
+    """
+    Install the fastest available asyncio event loop policy.
+
+    Prefers uringcore (io_uring, Linux 5.11+), then uvloop, and falls back to
+    the default asyncio loop. Must be called before the event loop is created
+    (i.e. before ``asyncio.run``). Returns the name of the selected backend.
+    """
+    for backend in ("uringcore", "uvloop"):
+        try:
+            module = importlib.import_module(backend)
+        except ImportError:
+            continue
+        asyncio.set_event_loop_policy(module.EventLoopPolicy())
+        return backend
+    return "asyncio"
+
+
 __all__ = [
+    # Event loop
+    "install_fast_loop",
     # Core agents
     "AutonomousAgent",
     "SelfManager", 
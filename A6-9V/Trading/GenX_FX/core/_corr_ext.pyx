@@ -0,0 +1,72 @@
+# cython: language_level=3
+"""
+Single-pass BTC/Gold correlation math for the crypto/gold trader
+Built by setup_cython.py; crypto_gold_trader falls back to NumPy without it
+"""
+
+cimport cython
+from libc.math cimport sqrt, NAN
+
+
+cdef inline double _corr(double sx, double sy, double sxx, double syy,
+                         double sxy, Py_ssize_t n):
+    """Pearson correlation from running sums"""
+    cdef double denom
+    if n < 2:
+        return NAN
+    denom = (n * sxx - sx * sx) * (n * syy - sy * sy)
+    if denom <= 0:
+        return NAN
+    return (n * sxy - sx * sy) / sqrt(denom)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cpdef tuple analyze_corr(const double[:] btc_c, const double[:] gold_c, int window=20):
+    """
+    Returns (correlation, rolling_correlation, btcxau_implied,
+    btc_momentum, gold_momentum, divergence) from two close series
+    """
+    cdef Py_ssize_t nb = btc_c.shape[0]
+    cdef Py_ssize_t ng = gold_c.shape[0]
+    cdef Py_ssize_t n, ob, og, i, start
+    cdef double rb, rg
+    cdef double sx = 0, sy = 0, sxx = 0, syy = 0, sxy = 0
+    cdef double wx = 0, wy = 0, wxx = 0, wyy = 0, wxy = 0
+    cdef double rolling = NAN
+    cdef double btc_mom, gold_mom
+
+    if nb < window or ng < window:
+        raise IndexError(f"Need at least {window} closes per series")
+
+    # Returns aligned on the most recent n bars of both series
+    n = min(nb, ng) - 1
+    ob = nb - n
+    og = ng - n
+    start = n - window
+    for i in range(n):
+        rb = (btc_c[ob + i] - btc_c[ob + i - 1]) / btc_c[ob + i - 1]
+        rg = (gold_c[og + i] - gold_c[og + i - 1]) / gold_c[og + i - 1]
+        sx += rb
+        sy += rg
+        sxx += rb * rb
+        syy += rg * rg
+        sxy += rb * rg
+        if i >= start:
+            wx += rb
+            wy += rg
+            wxx += rb * rb
+            wyy += rg * rg
+            wxy += rb * rg
+
+    # Only the latest rolling window is reported
+    if n >= window:
+        rolling = _corr(wx, wy, wxx, wyy, wxy, window)
+
+    btc_mom = (btc_c[nb - 1] / btc_c[nb - window] - 1) * 100
+    gold_mom = (gold_c[ng - 1] / gold_c[ng - window] - 1) * 100
+
+    return (_corr(sx, sy, sxx, syy, sxy, n), rolling,
+            btc_c[nb - 1] / gold_c[ng - 1],
+            btc_mom, gold_mom, btc_mom - gold_mom)
@@ -0,0 +1,35 @@
+"""
+Numeric kernels for the autonomous agent
+
+Kernels are compiled with ``@njit(cache=True)``; warm_up() compiles them
+(or loads them from the on-disk cache) at initialization so the first
+trading tick doesn't stall on the JIT.
+"""
+
+import numpy as np
+
+from ._njit import njit
+
+
+def _perf_stats(returns, sharpes, drawdowns, head, n):
+    """Fused single-pass (avg_return, avg_sharpe, max_drawdown) over the last n ring entries"""
+    size = returns.shape[0]
+    sum_return = 0.0
+    sum_sharpe = 0.0
+    max_drawdown = -np.inf
+    for i in range(n):
+        j = (head - n + i) % size
+        sum_return += returns[j]
+        sum_sharpe += sharpes[j]
+        if drawdowns[j] > max_drawdown:
+            max_drawdown = drawdowns[j]
+    return sum_return / n, sum_sharpe / n, max_drawdown
+
+
+perf_stats = njit(cache=True)(_perf_stats)
+
+
+def warm_up() -> None:
+    """Trigger JIT compilation up front rather than on the first trading tick"""
+    buf = np.zeros(2)
+    perf_stats(buf, buf, buf, 0, 1)
@@ -0,0 +1,32 @@
+"""
+Numba JIT helpers
+Falls back to plain Python execution when numba is not installed
+"""
+
+try:
+    from numba import njit, prange
+    from numba.experimental import jitclass
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def jitclass(*args, **kwargs):
+        """No-op stand-in for ``numba.experimental.jitclass(spec)``"""
+        def decorator(cls):
+            return cls
+
+        return decorator
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit`` supporting both decorator forms"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+__all__ = ["njit", "prange", "jitclass", "NUMBA_AVAILABLE"]
@@ -0,0 +1,205 @@
+"""
+JIT-compiled signal scoring kernels for the crypto/gold trader
+Each kernel takes the latest indicator values as scalars (NaN = unavailable)
+and returns the mean of the individual indicator votes.
+``score_and_target`` fuses all three votes with signal thresholding and
+stop-loss / take-profit / position sizing into a single kernel call;
+``make_pair_scorer`` generates a variant with one pair's parameters baked in.
+"""
+
+import math
+
+from ._njit import njit
+
+# Fixed order of the latest indicator values packed for ``score_and_target``
+LAST_FIELDS = (
+    'ema_9', 'ema_21', 'adx', 'plus_di', 'minus_di', 'supertrend_direction',
+    'ichimoku_tenkan_sen', 'ichimoku_kijun_sen',
+    'rsi', 'macd', 'macd_signal', 'stoch_k', 'stoch_d', 'williams_r', 'cci',
+    'bb_upper', 'bb_lower', 'bb_middle', 'atr',
+)
+
+# Fixed order of the per-pair parameters packed for ``score_and_target``
+CONFIG_FIELDS = (
+    'sl_buy_mul', 'sl_sell_mul', 'tp_buy_mul', 'tp_sell_mul',
+    'base_size', 'max_size', 'spread_tolerance',
+)
+
+
+@njit(cache=True)
+def trend_score(ema_fast, ema_slow, adx, plus_di, minus_di,
+                st_direction, tenkan, kijun):
+    """Trend vote: EMA crossover, ADX/DI strength, SuperTrend, Ichimoku"""
+    total = 0.0
+    count = 0
+
+    # EMA crossover
+    if not math.isnan(ema_fast) and not math.isnan(ema_slow):
+        total += 0.5 if ema_fast > ema_slow else -0.5
+        count += 1
+
+    # ADX trend strength
+    if not math.isnan(adx) and adx > 25:  # Strong trend
+        strength = min(adx / 50, 1.0)
+        total += strength if plus_di > minus_di else -strength
+        count += 1
+
+    # SuperTrend
+    if not math.isnan(st_direction):
+        total += st_direction * 0.5
+        count += 1
+
+    # Ichimoku Cloud
+    if not math.isnan(tenkan) and not math.isnan(kijun):
+        total += 0.3 if tenkan > kijun else -0.3
+        count += 1
+
+    return total / count if count else 0.0
+
+
+@njit(cache=True)
+def momentum_score(rsi, macd, macd_signal, stoch_k, stoch_d, williams_r, cci):
+    """Momentum vote: RSI, MACD, Stochastic, Williams %R, CCI"""
+    total = 0.0
+    count = 0
+
+    # RSI
+    if not math.isnan(rsi):
+        if rsi < 30:
+            total += 1.0  # Oversold
+        elif rsi > 70:
+            total -= 1.0  # Overbought
+        else:
+            total += (50 - rsi) / 50
+        count += 1
+
+    # MACD
+    if not math.isnan(macd) and not math.isnan(macd_signal):
+        total += 0.5 if macd > macd_signal else -0.5
+        count += 1
+
+    # Stochastic
+    if not math.isnan(stoch_k):
+        if stoch_k < 20:
+            total += 0.8
+        elif stoch_k > 80:
+            total -= 0.8
+        elif stoch_k > stoch_d:
+            total += 0.3
+        else:
+            total -= 0.3
+        count += 1
+
+    # Williams %R
+    if not math.isnan(williams_r):
+        if williams_r < -80:
+            total += 0.7
+            count += 1
+        elif williams_r > -20:
+            total -= 0.7
+            count += 1
+
+    # CCI
+    if not math.isnan(cci):
+        if cci < -100:
+            total += 0.6
+            count += 1
+        elif cci > 100:
+            total -= 0.6
+            count += 1
+
+    return total / count if count else 0.0
+
+
+@njit(cache=True)
+def volatility_score(bb_upper, bb_lower, bb_middle, atr, spread_tolerance):
+    """Volatility vote: Bollinger squeeze and ATR relative to spread tolerance"""
+    total = 0.0
+    count = 0
+
+    # Bollinger Band squeeze (low volatility = potential breakout)
+    bb_width = (bb_upper - bb_lower) / bb_middle if bb_middle != 0 else 0.0
+    if bb_width < 0.02:
+        total += 0.3  # Neutral but prepared
+        count += 1
+
+    # ATR-based volatility - higher ATR = larger potential moves
+    if not math.isnan(atr) and atr > 0 and not math.isnan(spread_tolerance):
+        if atr / spread_tolerance > 2:  # High volatility
+            total += 0.2  # Slightly bullish on volatility
+            count += 1
+
+    return total / count if count else 0.0
+
+
+@njit(cache=True, inline='always')
+def _score_and_target(last, price, sl_buy_mul, sl_sell_mul, tp_buy_mul,
+                      tp_sell_mul, base_size, max_size, spread_tolerance):
+    """Fused signal pass with the pair parameters as scalars"""
+    trend = trend_score(last[0], last[1], last[2], last[3], last[4],
+                        last[5], last[6], last[7])
+    momentum = momentum_score(last[8], last[9], last[10], last[11],
+                              last[12], last[13], last[14])
+    volatility = volatility_score(last[15], last[16], last[17], last[18],
+                                  spread_tolerance)
+
+    # Combine signals with weights
+    combined = trend * 0.35 + momentum * 0.40 + volatility * 0.25
+
+    if combined > 0.3:
+        direction = 1
+    elif combined < -0.3:
+        direction = -1
+    else:
+        direction = 0
+
+    confidence = min(abs(combined), 1.0)
+
+    # ATR-based targets (2:1 reward-risk), bounded by the pair's percentages
+    atr = last[18] if not math.isnan(last[18]) else price * 0.02
+    if direction == 1:
+        stop_loss = max(price - atr * 2.0, price * sl_buy_mul)
+        take_profit = min(price + atr * 4.0, price * tp_buy_mul)
+    elif direction == -1:
+        stop_loss = min(price + atr * 2.0, price * sl_sell_mul)
+        take_profit = max(price - atr * 4.0, price * tp_sell_mul)
+    else:
+        stop_loss = price
+        take_profit = price
+
+    # Base position scaled by confidence, capped at the allocation limit
+    position_size = min(base_size * confidence, max_size)
+
+    return (trend, momentum, volatility, combined, direction, confidence,
+            stop_loss, take_profit, position_size)
+
+
+@njit(cache=True)
+def score_and_target(last, params, price):
+    """
+    Fused signal pass over packed ``LAST_FIELDS`` / ``CONFIG_FIELDS`` arrays
+    Returns (trend, momentum, volatility, combined, direction, confidence,
+    stop_loss, take_profit, position_size); direction is 1 BUY, -1 SELL, 0 HOLD
+    """
+    return _score_and_target(last, price, params[0], params[1], params[2],
+                             params[3], params[4], params[5], params[6])
+
+
+_PAIR_SCORER_TEMPLATE = """
+def {name}(last, price):
+    return _score_and_target(last, price, {params})
+"""
+
+
+def make_pair_scorer(name, params):
+    """
+    ``score_and_target`` specialized for one pair: the ``CONFIG_FIELDS``
+    values are generated into the source as literals so the JIT can fold them
+    """
+    src = _PAIR_SCORER_TEMPLATE.format(
+        name=name, params=', '.join(repr(float(value)) for value in params)
+    )
+    namespace = {}
+    exec(src, {'_score_and_target': _score_and_target}, namespace)
+    # Generated source has no backing file, so it can't use the on-disk cache
+    return njit(namespace[name])
@@ -5,23 +5,45 @@ Handles decision making, learning, and self-improvement
 
 import asyncio
 import logging
+import time
+from pathlib import Path
 from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
+from datetime import datetime
 import numpy as np
-import pandas as pd
 from dataclasses import dataclass
-from enum import Enum
-from collections import deque  # For efficient bounded performance history
+from enum import IntEnum
 
+from ._kernels import perf_stats, warm_up as warm_up_kernels
 
-class AgentState(Enum):
-    """Agent operational states"""
-    INITIALIZING = "initializing"
-    LEARNING = "learning"
-    TRADING = "trading"
-    PAUSED = "paused"
-    ERROR = "error"
-    UPDATING = "updating"
+
+# Structure-of-arrays layout for the performance ring buffer
+PERFORMANCE_FIELDS = ('return', 'sharpe_ratio', 'max_drawdown', 'win_rate', 'total_trades')
+PERFORMANCE_HISTORY_SIZE = 1000
+
+
+class AgentState(IntEnum):
+    """Agent operational states (int-backed for cheap loop-guard comparisons)"""
+    INITIALIZING = 0
+    LEARNING = 1
+    TRADING = 2
+    PAUSED = 3
+    ERROR = 4
+    UPDATING = 5
+
+
+# Errors that trigger an emergency stop; per-type results are memoized so
+# subclasses only pay for the issubclass walk once
+_CRITICAL_ERRORS = (ConnectionError, TimeoutError)
+_critical_error_table: Dict[type, bool] = {}
+
+
+def _is_critical_error(error: Exception) -> bool:
+    """Dispatch-table lookup for critical error types"""
+    error_type = type(error)
+    critical = _critical_error_table.get(error_type)
+    if critical is None:
+        critical = _critical_error_table[error_type] = issubclass(error_type, _CRITICAL_ERRORS)
+    return critical
 
 
 @dataclass
@@ -35,6 +57,35 @@ class AgentConfig:
     emergency_stop_loss: float = 0.1
     auto_update_enabled: bool = True
     human_approval_required: bool = True
+    broker_concurrency: int = 4  # max in-flight broker orders
+    state_path: str = "agent_state.npz"  # performance ring buffer checkpoint
+
+
+async def _wait_for_next_tick(loop: asyncio.AbstractEventLoop, deadline: float, interval: float) -> float:
+    """
+    Sleep until ``deadline + interval`` on the loop clock and return the new deadline.
+    Fixed-rate scheduling: cycle duration no longer adds drift, and an overrunning
+    cycle restarts the schedule from now instead of bursting to catch up.
+    """
+    deadline += interval
+    delay = deadline - loop.time()
+    if delay > 0:
+        await asyncio.sleep(delay)
+        return deadline
+    await asyncio.sleep(0)
+    return loop.time()
+
+
+@dataclass(slots=True, frozen=True)
+class TradeResult:
+    """Broker execution result, converted once from the broker's dict response"""
+    success: bool
+    error: Optional[str]
+    details: Dict[str, Any]
+    
+    @classmethod
+    def from_dict(cls, result: Dict[str, Any]) -> "TradeResult":
+        return cls(bool(result.get('success')), result.get('error'), result)
 
 
 class AutonomousAgent:
@@ -56,15 +107,24 @@ class AutonomousAgent:
         self.broker = None
         self.metrics = None
         
-        # Performance tracking - Use deque with maxlen to prevent memory leaks
-        self.performance_history = deque(maxlen=1000)
+        # Performance tracking - fixed-size SoA ring buffers; one contiguous float64 row
+        # per field in a single matrix so a sample is written with one column store
+        self._perf_ts = np.zeros(PERFORMANCE_HISTORY_SIZE, dtype=np.int64)  # monotonic ns
+        self._perf_matrix = np.zeros((len(PERFORMANCE_FIELDS), PERFORMANCE_HISTORY_SIZE))
+        self._perf = {field: self._perf_matrix[i] for i, field in enumerate(PERFORMANCE_FIELDS)}
+        self._perf_head = 0
+        self._perf_count = 0
         self.learning_metrics = {}
+        self._wall_clock_offset_ns = time.time_ns() - time.monotonic_ns()
         self.last_update = datetime.now()
         
         # Self-improvement tracking
         self.improvement_suggestions = []
         self.auto_updates_applied = 0
         
+        # Background monitoring tasks (cancelled on shutdown)
+        self._background_tasks: List[asyncio.Task] = []
+        
     async def initialize(self, market_data=None, broker=None, model_registry=None, decision_engine=None, self_manager=None, metrics=None) -> bool:
         """Initialize the autonomous agent"""
         try:
@@ -85,31 +145,32 @@ class AutonomousAgent:
             if metrics:
                 self.metrics = metrics
             
-            # Initialize all components
-            if self.market_data:
-                await self.market_data.initialize()
-            if self.broker:
-                await self.broker.initialize()
-            if self.model_registry:
-                await self.model_registry.initialize()
-            if self.decision_engine:
-                await self.decision_engine.initialize()
-            if self.self_manager:
-                await self.self_manager.initialize()
+            # Initialize all components concurrently
+            components = (self.market_data, self.broker, self.model_registry,
+                          self.decision_engine, self.self_manager)
+            await asyncio.gather(*[c.initialize() for c in components if c])
             
             # Load latest models
             await self._load_latest_models()
             
+            # Compile numeric kernels now rather than on the first tick
+            warm_up_kernels()
+            
+            # Restore performance history from the last checkpoint
+            self._load_state()
+            
             # Start monitoring
-            asyncio.create_task(self._monitor_performance())
-            asyncio.create_task(self._self_improvement_loop())
+            self._background_tasks = [
+                asyncio.create_task(self._monitor_performance()),
+                asyncio.create_task(self._self_improvement_loop())
+            ]
             
             self.state = AgentState.LEARNING
             self.logger.info("Autonomous agent initialized successfully")
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to initialize agent: {e}")
+            self.logger.error("Failed to initialize agent: %s", e)
             self.state = AgentState.ERROR
             return False
     
@@ -121,25 +182,42 @@ class AutonomousAgent:
         self.state = AgentState.TRADING
         self.logger.info("Starting autonomous trading...")
         
-        # Main trading loop
+        # Main trading loop; components are bound inside it so a missing one
+        # is handled per cycle like any other cycle error
+        trading_cycle = self._trading_cycle
+        hot_paths_bound = False
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
         while self.state == AgentState.TRADING:
             try:
-                await self._trading_cycle()
-                await asyncio.sleep(1)  # 1 second cycle
+                if not hot_paths_bound:
+                    self._bind_hot_paths()
+                    hot_paths_bound = True
+                await trading_cycle()
+                next_tick = await _wait_for_next_tick(loop, next_tick, 1.0)  # 1 second cycle
             except Exception as e:
-                self.logger.error(f"Error in trading cycle: {e}")
+                self.logger.error("Error in trading cycle: %s", e)
                 await self._handle_error(e)
+                next_tick = loop.time()
+    
+    def _bind_hot_paths(self) -> None:
+        """Cache bound component methods used on every trading cycle"""
+        self._get_latest_data = self.market_data.get_latest_data
+        self._generate_signals = self.decision_engine.generate_signals
+        self._filter_signals = self.risk_manager.filter_signals
+        self._check_risk_limits = self.risk_manager.check_risk_limits
+        self._execute_trade = self.broker.execute_trade
     
     async def _trading_cycle(self) -> None:
         """Single trading cycle"""
         # Get market data
-        market_data = await self.market_data.get_latest_data()
+        market_data = await self._get_latest_data()
         
         # Generate signals
-        signals = await self.decision_engine.generate_signals(market_data)
+        signals = await self._generate_signals(market_data)
         
         # Apply risk management
-        filtered_signals = await self.risk_manager.filter_signals(signals)
+        filtered_signals = await self._filter_signals(signals)
         
         # Execute trades
         if filtered_signals:
@@ -150,23 +228,51 @@ class AutonomousAgent:
     
     async def _execute_trades(self, signals: List[Dict]) -> None:
         """Execute trading signals"""
-        for signal in signals:
+        check_risk_limits = self._check_risk_limits
+        execute_trade = self._execute_trade
+        logger = self.logger
+        
+        # Check and execute each signal under the broker rate limit; at most
+        # broker_concurrency signals are in flight, and a risk check doesn't
+        # see exposure from fills still in flight (1 restores strict ordering)
+        semaphore = asyncio.Semaphore(self.config.broker_concurrency)
+        rejected = object()
+        
+        async def execute_one(signal: Dict) -> Any:
+            async with semaphore:
+                try:
+                    approved = await check_risk_limits(signal)
+                except Exception as e:
+                    logger.error("Error checking risk limits: %s", e)
+                    return rejected
+                if not approved:
+                    return rejected
+                return await execute_trade(signal)
+        
+        results = await asyncio.gather(
+            *[execute_one(signal) for signal in signals],
+            return_exceptions=True
+        )
+        
+        # Record outcomes in signal order
+        log_trades = logger.isEnabledFor(logging.INFO)
+        for signal, result in zip(signals, results):
+            if result is rejected:
+                continue
             try:
-                # Check risk limits
-                if not await self.risk_manager.check_risk_limits(signal):
-                    continue
-                
-                # Execute trade
-                result = await self.broker.execute_trade(signal)
+                if isinstance(result, Exception):
+                    raise result
                 
-                if result['success']:
-                    self.logger.info(f"Trade executed: {signal}")
-                    await self.metrics.record_trade(result)
+                trade = TradeResult.from_dict(result)
+                if trade.success:
+                    if log_trades:
+                        logger.info("Trade executed: %s", signal)
+                    await self.metrics.record_trade(trade.details)
                 else:
-                    self.logger.warning(f"Trade failed: {result['error']}")
+                    logger.warning("Trade failed: %s", trade.error)
                     
             except Exception as e:
-                self.logger.error(f"Error executing trade: {e}")
+                logger.error("Error executing trade: %s", e)
     
     async def _load_latest_models(self) -> None:
         """Load the latest trained models"""
@@ -175,30 +281,40 @@ class AutonomousAgent:
             await self.decision_engine.load_models(latest_models)
             self.logger.info("Latest models loaded successfully")
         except Exception as e:
-            self.logger.error(f"Failed to load models: {e}")
+            self.logger.error("Failed to load models: %s", e)
     
     async def _monitor_performance(self) -> None:
         """Monitor agent performance and trigger improvements"""
+        loop = asyncio.get_running_loop()
+        next_check = loop.time()
         while True:
             try:
                 # Collect performance metrics
                 performance = await self.metrics.get_performance_summary()
-                self.performance_history.append(performance)
+                self._record_performance(time.monotonic_ns(), (
+                    performance.get('total_pnl', 0.0),
+                    performance.get('sharpe_ratio', 0.0),
+                    performance.get('max_drawdown', 0.0),
+                    performance.get('win_rate', 0.0),
+                    performance.get('total_trades', 0)
+                ))
                 
                 # Check for improvement opportunities
-                if len(self.performance_history) > 10:
+                if self._perf_count > 10:
                     improvement_opportunity = await self._analyze_performance()
                     if improvement_opportunity:
                         await self._trigger_self_improvement(improvement_opportunity)
                 
-                await asyncio.sleep(60)  # Check every minute
+                next_check = await _wait_for_next_tick(loop, next_check, 60)  # Check every minute
                 
             except Exception as e:
-                self.logger.error(f"Error in performance monitoring: {e}")
-                await asyncio.sleep(60)
+                self.logger.error("Error in performance monitoring: %s", e)
+                next_check = await _wait_for_next_tick(loop, next_check, 60)
     
     async def _self_improvement_loop(self) -> None:
         """Continuous self-improvement loop"""
+        loop = asyncio.get_running_loop()
+        next_run = loop.time()
         while True:
             try:
                 if self.config.auto_update_enabled:
@@ -209,20 +325,22 @@ class AutonomousAgent:
                         if await self._should_apply_improvement(improvement):
                             await self._apply_improvement(improvement)
                 
-                await asyncio.sleep(self.config.update_frequency)
+                next_run = await _wait_for_next_tick(loop, next_run, self.config.update_frequency)
                 
             except Exception as e:
-                self.logger.error(f"Error in self-improvement loop: {e}")
+                self.logger.error("Error in self-improvement loop: %s", e)
                 await asyncio.sleep(60)
+                next_run = loop.time()
     
     async def _analyze_performance(self) -> Optional[Dict]:
         """Analyze performance for improvement opportunities"""
-        recent_performance = self.performance_history[-10:]
+        perf = self._perf
+        window = min(self._perf_count, 10)
         
-        # Calculate performance metrics
-        avg_return = np.mean([p['return'] for p in recent_performance])
-        avg_sharpe = np.mean([p['sharpe_ratio'] for p in recent_performance])
-        max_drawdown = max([p['max_drawdown'] for p in recent_performance])
+        # Calculate performance metrics in one fused pass over the ring buffers
+        avg_return, avg_sharpe, max_drawdown = perf_stats(
+            perf['return'], perf['sharpe_ratio'], perf['max_drawdown'], self._perf_head, window
+        )
         
         # Check for improvement opportunities
         if avg_return < 0.01 or avg_sharpe < 1.0 or max_drawdown > 0.05:
@@ -244,7 +362,7 @@ class AutonomousAgent:
     
     async def _trigger_self_improvement(self, opportunity: Dict) -> None:
         """Trigger self-improvement based on opportunity"""
-        self.logger.info(f"Triggering self-improvement: {opportunity['type']}")
+        self.logger.info("Triggering self-improvement: %s", opportunity['type'])
         
         for action in opportunity['suggested_actions']:
             if action == 'retrain_models':
@@ -270,22 +388,22 @@ class AutonomousAgent:
         """Apply self-improvement"""
         try:
             self.state = AgentState.UPDATING
-            self.logger.info(f"Applying improvement: {improvement['type']}")
+            self.logger.info("Applying improvement: %s", improvement['type'])
             
             # Apply the improvement
             result = await self.self_manager.apply_improvement(improvement)
             
             if result['success']:
                 self.auto_updates_applied += 1
-                self.logger.info(f"Improvement applied successfully: {improvement['type']}")
+                self.logger.info("Improvement applied successfully: %s", improvement['type'])
                 
                 # Validate the improvement
                 await self._validate_improvement(improvement)
             else:
-                self.logger.error(f"Failed to apply improvement: {result['error']}")
+                self.logger.error("Failed to apply improvement: %s", result['error'])
                 
         except Exception as e:
-            self.logger.error(f"Error applying improvement: {e}")
+            self.logger.error("Error applying improvement: %s", e)
         finally:
             self.state = AgentState.TRADING
     
@@ -337,40 +455,60 @@ class AutonomousAgent:
         validation_results = await self.self_manager.validate_improvement(improvement)
         
         if not validation_results['passed']:
-            self.logger.warning(f"Improvement validation failed: {validation_results['issues']}")
+            self.logger.warning("Improvement validation failed: %s", validation_results['issues'])
             # Rollback if necessary
             await self._rollback_improvement(improvement)
     
     async def _rollback_improvement(self, improvement: Dict) -> None:
         """Rollback failed improvement"""
-        self.logger.info(f"Rolling back improvement: {improvement['type']}")
+        self.logger.info("Rolling back improvement: %s", improvement['type'])
         
         try:
             await self.self_manager.rollback_improvement(improvement)
             self.logger.info("Improvement rolled back successfully")
         except Exception as e:
-            self.logger.error(f"Failed to rollback improvement: {e}")
+            self.logger.error("Failed to rollback improvement: %s", e)
     
     async def _update_performance_metrics(self) -> None:
         """Update performance metrics"""
-        current_performance = {
-            'timestamp': datetime.now(),
-            'return': await self.metrics.get_current_return(),
-            'sharpe_ratio': await self.metrics.get_sharpe_ratio(),
-            'max_drawdown': await self.metrics.get_max_drawdown(),
-            'win_rate': await self.metrics.get_win_rate(),
-            'total_trades': await self.metrics.get_total_trades()
-        }
-        
-        # deque automatically handles maxlen, no need for manual trimming
-        self.performance_history.append(current_performance)
+        # Single snapshot call returns all fields in PERFORMANCE_FIELDS order
+        snapshot = await self.metrics.get_perf_snapshot()
+        self._record_performance(time.monotonic_ns(), snapshot)
+    
+    def _record_performance(self, timestamp_ns: int, values) -> None:
+        """Write one performance sample (ordered as PERFORMANCE_FIELDS) into the ring buffers"""
+        head = self._perf_head
+        self._perf_ts[head] = timestamp_ns
+        self._perf_matrix[:, head] = values
+        
+        # Ring buffer wraps automatically, no need for manual trimming
+        self._perf_head = (head + 1) % PERFORMANCE_HISTORY_SIZE
+        if self._perf_count < PERFORMANCE_HISTORY_SIZE:
+            self._perf_count += 1
+    
+    @property
+    def performance_history(self) -> List[Dict[str, Any]]:
+        """Performance samples in chronological order (materialized on demand)"""
+        order = (np.arange(self._perf_head - self._perf_count, self._perf_head)
+                 % PERFORMANCE_HISTORY_SIZE)
+        history = []
+        for i in order:
+            entry = {'timestamp': self._to_datetime(self._perf_ts[i])}
+            for field in PERFORMANCE_FIELDS:
+                entry[field] = float(self._perf[field][i])
+            history.append(entry)
+        return history
+    
+    def _to_datetime(self, monotonic_ns: int) -> datetime:
+        """Convert a monotonic-clock sample timestamp to wall-clock time"""
+        return datetime.fromtimestamp((int(monotonic_ns) + self._wall_clock_offset_ns) / 1e9)
     
     async def _handle_error(self, error: Exception) -> None:
         """Handle errors gracefully"""
-        self.logger.error(f"Handling error: {error}")
+        self.logger.error("Handling error: %s", error)
         
         # Check if error is critical
-        if isinstance(error, (ConnectionError, TimeoutError)):
+        if _is_critical_error(error):
             self.state = AgentState.ERROR
             await self._emergency_stop()
         else:
@@ -410,6 +548,12 @@ class AutonomousAgent:
         # Stop trading
         self.state = AgentState.PAUSED
         
+        # Stop background monitoring
+        for task in self._background_tasks:
+            task.cancel()
+        await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        self._background_tasks = []
+        
         # Close all positions
         await self.broker.close_all_positions()
         
@@ -420,8 +564,19 @@ class AutonomousAgent:
     
     async def _save_state(self) -> None:
         """Save agent state"""
+        # Dump the ring buffers as-is: one contiguous write, no per-entry pickling.
+        # Timestamps are stored as wall-clock ns since the monotonic clock resets on restart.
+        np.savez(
+            self.config.state_path,
+            timestamps=self._perf_ts + self._wall_clock_offset_ns,
+            performance=self._perf_matrix,
+            head=self._perf_head,
+            count=self._perf_count
+        )
+        
         state = {
-            'performance_history': self.performance_history,
+            'performance_history_path': self.config.state_path,
+            'performance_history_count': self._perf_count,
             'learning_metrics': self.learning_metrics,
             'auto_updates_applied': self.auto_updates_applied,
             'last_update': self.last_update.isoformat()
@@ -430,11 +585,34 @@ class AutonomousAgent:
         # Save to persistent storage
         await self.self_manager.save_state(state)
     
+    def _load_state(self) -> None:
+        """Load performance ring buffers saved by _save_state"""
+        try:
+            state_file = Path(self.config.state_path)
+            if not state_file.exists():
+                return
+            
+            with np.load(state_file) as data:
+                performance = data['performance']
+                if performance.shape != self._perf_matrix.shape:
+                    self.logger.warning("Ignoring saved performance history with incompatible layout")
+                    return
+                
+                self._perf_matrix[...] = performance
+                self._perf_ts[:] = data['timestamps'] - self._wall_clock_offset_ns
+                self._perf_head = int(data['head'])
+                self._perf_count = int(data['count'])
+            
+            self.logger.info("Restored %s performance samples", self._perf_count)
+            
+        except Exception as e:
+            self.logger.error("Failed to load agent state: %s", e)
+    
     def get_status(self) -> Dict[str, Any]:
         """Get current agent status"""
         return {
-            'state': self.state.value,
-            'performance_history_count': len(self.performance_history),
+            'state': self.state.name.lower(),
+            'performance_history_count': self._perf_count,
             'auto_updates_applied': self.auto_updates_applied,
             'last_update': self.last_update.isoformat(),
             'config': self.config.__dict__
@@ -5,15 +5,83 @@ Device: NUNA 💻 | User: @mouyleng 🧑‍💻 | Org: @A6-9V 🏙️
 """
 
 import asyncio
+import hashlib
 import logging
+import math
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 
 from .forex_indicators import ForexIndicators, IndicatorConfig
+from ._signal_jit import LAST_FIELDS, make_pair_scorer
+
+
+def _latest_values(indicators: Dict[str, np.ndarray]) -> Dict[str, float]:
+    """Latest value of every indicator series as a plain float (NaN when empty)"""
+    return {
+        key: float(values[-1]) if len(values) else np.nan
+        for key, values in indicators.items()
+    }
+
+
+def _ns_to_iso(timestamp_ns: int) -> str:
+    """ISO-8601 (UTC) string for an epoch timestamp in nanoseconds"""
+    return datetime.fromtimestamp(timestamp_ns / 1e9, tz=timezone.utc).isoformat()
+
+
+def _fast_corr(a: np.ndarray, b: np.ndarray) -> float:
+    """Pearson correlation from running sums (no covariance matrix)"""
+    n = a.size
+    if n < 2:
+        return np.nan
+    sx = a.sum()
+    sy = b.sum()
+    sxx = np.dot(a, a)
+    syy = np.dot(b, b)
+    sxy = np.dot(a, b)
+    denom = (n * sxx - sx * sx) * (n * syy - sy * sy)
+    if denom <= 0:
+        return np.nan
+    return float((n * sxy - sx * sy) / np.sqrt(denom))
+
+
+def _analyze_corr_numpy(btc_close: np.ndarray, gold_close: np.ndarray,
+                        window: int = 20) -> Tuple[float, float, float, float, float, float]:
+    """NumPy fallback for ``_corr_ext.analyze_corr`` when the extension isn't built"""
+    if len(btc_close) < window or len(gold_close) < window:
+        raise IndexError(f"Need at least {window} closes per series")
+    
+    # Simple returns aligned on the most recent bars of both series
+    btc_returns = np.diff(btc_close) / btc_close[:-1]
+    gold_returns = np.diff(gold_close) / gold_close[:-1]
+    min_len = min(len(btc_returns), len(gold_returns))
+    btc_returns = btc_returns[-min_len:]
+    gold_returns = gold_returns[-min_len:]
+    
+    correlation = _fast_corr(btc_returns, gold_returns)
+    
+    # Only the latest rolling window is reported
+    rolling_corr = np.nan
+    if min_len >= window:
+        rolling_corr = _fast_corr(btc_returns[-window:], gold_returns[-window:])
+    
+    btc_momentum = float((btc_close[-1] / btc_close[-window] - 1) * 100)
+    gold_momentum = float((gold_close[-1] / gold_close[-window] - 1) * 100)
+    
+    return (correlation, rolling_corr, float(btc_close[-1] / gold_close[-1]),
+            btc_momentum, gold_momentum, btc_momentum - gold_momentum)
+
+
+try:
+    from ._corr_ext import analyze_corr
+except ImportError:
+    analyze_corr = _analyze_corr_numpy
 
 
 class CryptoGoldPair(Enum):
@@ -23,7 +91,19 @@ class CryptoGoldPair(Enum):
     BTCXAU = "BTCXAU"      # Bitcoin / Gold (Cross-pair)
 
 
-@dataclass
+# Pair symbols materialized once, in enum order
+_PAIRS: Tuple[str, ...] = tuple(pair.value for pair in CryptoGoldPair)
+
+# Per-pair performance counters, copied for each pair
+_PERFORMANCE_TEMPLATE = {
+    'total_trades': 0,
+    'winning_trades': 0,
+    'total_pnl': 0.0,
+    'max_drawdown': 0.0
+}
+
+
+@dataclass(slots=True, frozen=True)
 class PairConfig:
     """Configuration for a trading pair"""
     symbol: str
@@ -36,6 +116,94 @@ class PairConfig:
     stop_loss_pct: float
     take_profit_pct: float
     is_24_7: bool = True
+    
+    # Derived multipliers, precomputed for the per-signal hot path
+    _sl_buy_mul: float = field(init=False, repr=False, compare=False)
+    _sl_sell_mul: float = field(init=False, repr=False, compare=False)
+    _tp_buy_mul: float = field(init=False, repr=False, compare=False)
+    _tp_sell_mul: float = field(init=False, repr=False, compare=False)
+    _base_size: float = field(init=False, repr=False, compare=False)
+    _max_size: float = field(init=False, repr=False, compare=False)
+    _kernel_params: np.ndarray = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, '_sl_buy_mul', 1 - self.stop_loss_pct)
+        object.__setattr__(self, '_sl_sell_mul', 1 + self.stop_loss_pct)
+        object.__setattr__(self, '_tp_buy_mul', 1 + self.take_profit_pct)
+        object.__setattr__(self, '_tp_sell_mul', 1 - self.take_profit_pct)
+        object.__setattr__(self, '_base_size', self.min_lot * 10)
+        object.__setattr__(self, '_max_size', self.lot_size * self.max_position_pct)
+        # Packed in _signal_jit.CONFIG_FIELDS order for score_and_target
+        object.__setattr__(self, '_kernel_params', np.array([
+            self._sl_buy_mul, self._sl_sell_mul,
+            self._tp_buy_mul, self._tp_sell_mul,
+            self._base_size, self._max_size,
+            self.spread_tolerance,
+        ], dtype=np.float64))
+
+
+def _format_reasoning(symbol: str, signal_type: str,
+                      indicators: Dict[str, float],
+                      combined_signal: float) -> str:
+    """Generate human-readable reasoning for the signal"""
+    reasons = []
+    
+    # RSI reasoning
+    rsi = indicators.get('rsi', 50)
+    if rsi < 30:
+        reasons.append(f"RSI ({rsi:.1f}) indicates oversold conditions")
+    elif rsi > 70:
+        reasons.append(f"RSI ({rsi:.1f}) indicates overbought conditions")
+    
+    # MACD reasoning
+    macd = indicators.get('macd', 0)
+    if macd > 0:
+        reasons.append(f"MACD ({macd:.4f}) shows bullish momentum")
+    elif macd < 0:
+        reasons.append(f"MACD ({macd:.4f}) shows bearish momentum")
+    
+    # Trend reasoning
+    adx = indicators.get('adx', 0)
+    if adx > 25:
+        reasons.append(f"ADX ({adx:.1f}) indicates strong trend")
+    else:
+        reasons.append(f"ADX ({adx:.1f}) indicates ranging market")
+    
+    # BB position
+    bb_pos = indicators.get('bb_position', 0.5)
+    if bb_pos < 0.2:
+        reasons.append("Price near lower Bollinger Band")
+    elif bb_pos > 0.8:
+        reasons.append("Price near upper Bollinger Band")
+    
+    reasoning = f"{signal_type} signal for {symbol} (confidence: {abs(combined_signal):.2f}). "
+    reasoning += " ".join(reasons)
+    
+    return reasoning
+
+
+class LazyReasoning:
+    """Signal reasoning that is only formatted when converted to ``str``"""
+    
+    __slots__ = ('symbol', 'signal_type', 'indicators', 'combined_signal', '_text')
+    
+    def __init__(self, symbol: str, signal_type: str,
+                 indicators: Dict[str, float], combined_signal: float):
+        self.symbol = symbol
+        self.signal_type = signal_type
+        self.indicators = indicators
+        self.combined_signal = combined_signal
+        self._text = None
+    
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = _format_reasoning(
+                self.symbol, self.signal_type, self.indicators, self.combined_signal
+            )
+        return self._text
+    
+    def __repr__(self) -> str:
+        return repr(str(self))
 
 
 @dataclass
@@ -50,8 +218,272 @@ class TradingSignal:
     take_profit: float
     position_size: float
     indicators: Dict[str, float]
-    timestamp: datetime
-    reasoning: str = ""
+    timestamp_ns: int  # epoch nanoseconds (time.time_ns)
+    reasoning: Union[str, LazyReasoning] = ""
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Signal time as a naive local datetime, as previously stored"""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
+
+
+# Pair-specific configurations, built once at import and shared by all traders
+_PAIR_CONFIGS: Dict[str, PairConfig] = {
+    CryptoGoldPair.BTCUSD.value: PairConfig(
+        symbol="BTCUSD",
+        pip_value=0.01,
+        lot_size=1,
+        min_lot=0.001,
+        leverage=10,
+        spread_tolerance=50.0,  # $50 spread tolerance
+        max_position_pct=0.5,   # 50% max allocation
+        stop_loss_pct=0.03,     # 3% stop loss
+        take_profit_pct=0.05,   # 5% take profit
+        is_24_7=True
+    ),
+    CryptoGoldPair.XAUUSD.value: PairConfig(
+        symbol="XAUUSD",
+        pip_value=0.01,
+        lot_size=100,
+        min_lot=0.01,
+        leverage=50,
+        spread_tolerance=0.50,   # $0.50 spread tolerance
+        max_position_pct=0.3,    # 30% max allocation
+        stop_loss_pct=0.02,      # 2% stop loss
+        take_profit_pct=0.04,    # 4% take profit
+        is_24_7=True
+    ),
+    CryptoGoldPair.BTCXAU.value: PairConfig(
+        symbol="BTCXAU",
+        pip_value=0.0001,
+        lot_size=1,
+        min_lot=0.001,
+        leverage=5,
+        spread_tolerance=0.01,    # 1% spread tolerance
+        max_position_pct=0.2,     # 20% max allocation
+        stop_loss_pct=0.04,       # 4% stop loss
+        take_profit_pct=0.06,     # 6% take profit
+        is_24_7=True
+    )
+}
+
+
+# Per-pair scoring kernels with each pair's parameters compiled in as constants
+_PAIR_SCORERS = {
+    symbol: make_pair_scorer(f"score_and_target_{symbol}", config._kernel_params)
+    for symbol, config in _PAIR_CONFIGS.items()
+}
+
+
+# Shared worker pool for indicator computation (one worker per pair)
+_indicator_executor = ThreadPoolExecutor(
+    max_workers=len(_PAIRS), thread_name_prefix="crypto-gold-indicators"
+)
+
+# Minimum OHLCV bars required before a pair is analyzed
+_MIN_BARS = 50
+
+# Signals retained in memory; the store overwrites the oldest beyond this
+SIGNAL_HISTORY_SIZE = 10_000
+
+# Bars retained per symbol in the market data cache
+BAR_STORE_CAPACITY = 4096
+
+# Integer codes for the SoA signal store columns
+SIGNAL_TYPES = ("BUY", "SELL", "HOLD", "CLOSE")
+_SIGNAL_TYPE_CODES = {name: code for code, name in enumerate(SIGNAL_TYPES)}
+# score_and_target direction (1 / -1 / 0) -> signal type
+_DIRECTION_SIGNALS = ("HOLD", "BUY", "SELL")
+_SYMBOL_CODES = {name: code for code, name in enumerate(_PAIRS)}
+
+
+class SignalStore:
+    """
+    Ring buffer of trading signals stored as parallel NumPy columns (SoA)
+    
+    Hot fields live in typed arrays; the (lazy) reasoning is kept in a
+    separate object column since it is only read when serializing.
+    """
+    
+    def __init__(self, capacity: int = SIGNAL_HISTORY_SIZE):
+        self.capacity = capacity
+        self.symbol_id = np.zeros(capacity, dtype=np.int8)
+        self.signal_type = np.zeros(capacity, dtype=np.int8)
+        self.confidence = np.zeros(capacity, dtype=np.float64)
+        self.entry_price = np.zeros(capacity, dtype=np.float64)
+        self.stop_loss = np.zeros(capacity, dtype=np.float64)
+        self.take_profit = np.zeros(capacity, dtype=np.float64)
+        self.timestamp_ns = np.zeros(capacity, dtype=np.int64)
+        self.reasoning = np.empty(capacity, dtype=object)
+        self.head = 0
+        self.count = 0
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def append(self, signal: TradingSignal) -> None:
+        """Write a signal into the head slot, overwriting the oldest when full"""
+        i = self.head
+        self.symbol_id[i] = _SYMBOL_CODES[signal.symbol]
+        self.signal_type[i] = _SIGNAL_TYPE_CODES[signal.signal_type]
+        self.confidence[i] = signal.confidence
+        self.entry_price[i] = signal.entry_price
+        self.stop_loss[i] = signal.stop_loss
+        self.take_profit[i] = signal.take_profit
+        self.timestamp_ns[i] = signal.timestamp_ns
+        self.reasoning[i] = signal.reasoning
+        
+        self.head = (i + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+    
+    def latest(self, count: int) -> List[Dict[str, Any]]:
+        """Latest ``count`` signals (oldest first) as plain dicts"""
+        n = min(max(count, 0), self.count)
+        slots = np.arange(self.head - n, self.head) % self.capacity
+        return [
+            {
+                'symbol': _PAIRS[self.symbol_id[i]],
+                'signal_type': SIGNAL_TYPES[self.signal_type[i]],
+                'confidence': float(self.confidence[i]),
+                'entry_price': float(self.entry_price[i]),
+                'stop_loss': float(self.stop_loss[i]),
+                'take_profit': float(self.take_profit[i]),
+                'reasoning': str(self.reasoning[i]),
+                'timestamp': _ns_to_iso(int(self.timestamp_ns[i]))
+            }
+            for i in slots
+        ]
+
+
+class BarStore:
+    """
+    Per-symbol OHLCV bars stored as float32 NumPy columns (SoA)
+    
+    Holds the latest ``capacity`` bars. Columns are allocated at twice the
+    capacity and the live window is slid back to the start when the end is
+    reached, so the live window is always contiguous and chronological.
+    """
+    
+    __slots__ = ('capacity', 'has_volume', 'last_close', 'open', 'high', 'low',
+                 'close', 'volume', 'timestamp_ns', '_start', '_end')
+    
+    def __init__(self, capacity: int = BAR_STORE_CAPACITY, has_volume: bool = True):
+        self.capacity = capacity
+        self.has_volume = has_volume
+        self.last_close = np.nan  # full-precision close of the latest bar
+        self.open = np.zeros(2 * capacity, dtype=np.float32)
+        self.high = np.zeros(2 * capacity, dtype=np.float32)
+        self.low = np.zeros(2 * capacity, dtype=np.float32)
+        self.close = np.zeros(2 * capacity, dtype=np.float32)
+        self.volume = np.zeros(2 * capacity, dtype=np.float32)
+        self.timestamp_ns = np.zeros(2 * capacity, dtype=np.int64)
+        self._start = 0
+        self._end = 0
+    
+    @classmethod
+    def from_frame(cls, ohlcv_data: pd.DataFrame,
+                   capacity: int = BAR_STORE_CAPACITY) -> "BarStore":
+        """Build a store from the latest ``capacity`` rows of an OHLCV frame"""
+        store = cls(capacity, has_volume='volume' in ohlcv_data.columns)
+        tail = ohlcv_data.iloc[-capacity:]
+        n = len(tail)
+        for name in ('open', 'high', 'low', 'close', 'volume'):
+            if name in tail.columns:
+                getattr(store, name)[:n] = tail[name].to_numpy(dtype=np.float32)
+        if n:
+            store.last_close = float(tail['close'].iat[-1])
+        store._end = n
+        return store
+    
+    def __len__(self) -> int:
+        return self._end - self._start
+    
+    def append(self, open_: float, high: float, low: float, close: float,
+               volume: float = 0.0, timestamp_ns: Optional[int] = None) -> None:
+        """Append one bar, dropping the oldest once ``capacity`` bars are held"""
+        if self._end == 2 * self.capacity:
+            # Slide the newest capacity - 1 bars back to the start
+            keep = self.capacity - 1
+            for column in (self.open, self.high, self.low, self.close,
+                           self.volume, self.timestamp_ns):
+                column[:keep] = column[self._end - keep:self._end]
+            self._start, self._end = 0, keep
+        elif len(self) == self.capacity:
+            self._start += 1
+        
+        i = self._end
+        self.open[i] = open_
+        self.high[i] = high
+        self.low[i] = low
+        self.close[i] = close
+        self.volume[i] = volume
+        self.timestamp_ns[i] = time.time_ns() if timestamp_ns is None else timestamp_ns
+        self.last_close = float(close)
+        self._end = i + 1
+    
+    def ohlcv(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Optional[np.ndarray], float]:
+        """
+        Copies of (high, low, close, volume, current_price) over the live window
+        
+        Copied rather than viewed because the arrays are read on indicator
+        worker threads while append() may slide the columns in place.
+        """
+        window = slice(self._start, self._end)
+        volume = self.volume[window].copy() if self.has_volume else None
+        return (self.high[window].copy(), self.low[window].copy(),
+                self.close[window].copy(), volume, self.last_close)
+
+
+def _has_volume(data: Union[pd.DataFrame, "BarStore"]) -> bool:
+    """Whether an OHLCV frame or bar store carries volume"""
+    if isinstance(data, BarStore):
+        return data.has_volume
+    return 'volume' in data.columns
+
+
+class IndicatorCache:
+    """
+    LRU cache of indicator results keyed by a SHA-256 digest of the indicator
+    config and the OHLCV arrays
+    
+    Re-analyzing an unchanged frame (several strategies, or the correlation path
+    re-reading a pair) returns the previous result instead of recomputing. Each
+    entry holds a full indicator dict, so the default keeps one per pair.
+    """
+    
+    def __init__(self, maxsize: int = len(_PAIRS)):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(config: IndicatorConfig, *arrays: Optional[np.ndarray]) -> bytes:
+        digest = hashlib.sha256(repr(config).encode())
+        for array in arrays:
+            if array is None:
+                digest.update(b"\x00")
+            else:
+                array = np.ascontiguousarray(array)
+                digest.update(str(array.dtype).encode())
+                digest.update(array.tobytes())
+        return digest.digest()
+    
+    def get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+    
+    def put(self, key: bytes, value: Dict[str, Any]) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
 
 
 class CryptoGoldTrader:
@@ -69,394 +501,194 @@ class CryptoGoldTrader:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
-        # Initialize indicator calculator
-        self.indicators = ForexIndicators()
+        # Initialize indicator calculator; bars are stored as float32 (BarStore)
+        self.indicators = ForexIndicators(IndicatorConfig(dtype=np.float32))
+        self.indicator_cache = IndicatorCache()
         
         # Pair configurations
-        self.pair_configs: Dict[str, PairConfig] = self._initialize_pair_configs()
+        self.pair_configs: Dict[str, PairConfig] = _PAIR_CONFIGS
         
         # Trading state
         self.is_active = False
         self.current_positions: Dict[str, Dict] = {}
-        self.signal_history: List[TradingSignal] = []
+        self.signal_history = SignalStore()
         
         # Performance tracking
-        self.performance: Dict[str, Dict] = {}
-        for pair in CryptoGoldPair:
-            self.performance[pair.value] = {
-                'total_trades': 0,
-                'winning_trades': 0,
-                'total_pnl': 0.0,
-                'max_drawdown': 0.0
-            }
+        self.performance: Dict[str, Dict] = {
+            symbol: _PERFORMANCE_TEMPLATE.copy() for symbol in _PAIRS
+        }
         
         # Market data cache
-        self.market_data_cache: Dict[str, pd.DataFrame] = {}
+        self.market_data_cache: Dict[str, BarStore] = {}
         self.last_update: Dict[str, datetime] = {}
     
-    def _initialize_pair_configs(self) -> Dict[str, PairConfig]:
-        """Initialize pair-specific configurations"""
-        return {
-            CryptoGoldPair.BTCUSD.value: PairConfig(
-                symbol="BTCUSD",
-                pip_value=0.01,
-                lot_size=1,
-                min_lot=0.001,
-                leverage=10,
-                spread_tolerance=50.0,  # $50 spread tolerance
-                max_position_pct=0.5,   # 50% max allocation
-                stop_loss_pct=0.03,     # 3% stop loss
-                take_profit_pct=0.05,   # 5% take profit
-                is_24_7=True
-            ),
-            CryptoGoldPair.XAUUSD.value: PairConfig(
-                symbol="XAUUSD",
-                pip_value=0.01,
-                lot_size=100,
-                min_lot=0.01,
-                leverage=50,
-                spread_tolerance=0.50,   # $0.50 spread tolerance
-                max_position_pct=0.3,    # 30% max allocation
-                stop_loss_pct=0.02,      # 2% stop loss
-                take_profit_pct=0.04,    # 4% take profit
-                is_24_7=True
-            ),
-            CryptoGoldPair.BTCXAU.value: PairConfig(
-                symbol="BTCXAU",
-                pip_value=0.0001,
-                lot_size=1,
-                min_lot=0.001,
-                leverage=5,
-                spread_tolerance=0.01,    # 1% spread tolerance
-                max_position_pct=0.2,     # 20% max allocation
-                stop_loss_pct=0.04,       # 4% stop loss
-                take_profit_pct=0.06,     # 6% take profit
-                is_24_7=True
-            )
-        }
-    
     async def analyze_pair(self, symbol: str, 
-                          ohlcv_data: pd.DataFrame) -> TradingSignal:
+                          ohlcv_data: Union[pd.DataFrame, BarStore]) -> TradingSignal:
         """
         Analyze a crypto/gold pair and generate trading signal
         
         Args:
             symbol: Trading pair symbol
-            ohlcv_data: OHLCV data with columns: open, high, low, close, volume
+            ohlcv_data: OHLCV data with columns: open, high, low, close, volume,
+                or a BarStore of cached bars
         
         Returns:
             TradingSignal with recommendation
         """
-        try:
-            config = self.pair_configs.get(symbol)
-            if not config:
-                raise ValueError(f"Unknown symbol: {symbol}")
-            
-            # Extract price data
-            high = ohlcv_data['high'].values
-            low = ohlcv_data['low'].values
-            close = ohlcv_data['close'].values
-            volume = ohlcv_data['volume'].values if 'volume' in ohlcv_data else None
-            
-            current_price = close[-1]
-            
-            # Calculate all indicators
-            all_indicators = self.indicators.calculate_all_indicators(
+        if symbol not in self.pair_configs:
+            raise ValueError(f"Unknown symbol: {symbol}")
+        if len(ohlcv_data) < _MIN_BARS:
+            raise ValueError(f"Need at least {_MIN_BARS} bars for {symbol}, got {len(ohlcv_data)}")
+        
+        high, low, close, volume, current_price = self._extract_ohlcv(ohlcv_data)
+        
+        # Calculate all indicators off the event loop so pairs can overlap,
+        # reusing the previous result when the OHLCV frame is unchanged
+        cache_key = IndicatorCache.make_key(self.indicators.config, high, low, close, volume)
+        all_indicators = self.indicator_cache.get(cache_key)
+        if all_indicators is None:
+            loop = asyncio.get_running_loop()
+            all_indicators = await loop.run_in_executor(
+                _indicator_executor,
+                self.indicators.calculate_all_indicators,
                 high, low, close, volume
             )
-            
-            # Analyze signals from different indicator groups
-            trend_signal = self._analyze_trend(all_indicators, close)
-            momentum_signal = self._analyze_momentum(all_indicators)
-            volatility_signal = self._analyze_volatility(all_indicators, symbol)
-            
-            # Combine signals with weights
-            combined_signal = (
-                trend_signal * 0.35 +
-                momentum_signal * 0.40 +
-                volatility_signal * 0.25
-            )
-            
-            # Determine signal type
-            if combined_signal > 0.3:
-                signal_type = "BUY"
-            elif combined_signal < -0.3:
-                signal_type = "SELL"
-            else:
-                signal_type = "HOLD"
-            
-            # Calculate confidence
-            confidence = min(abs(combined_signal), 1.0)
-            
-            # Calculate position parameters
-            stop_loss = self._calculate_stop_loss(
-                current_price, signal_type, all_indicators, config
-            )
-            take_profit = self._calculate_take_profit(
-                current_price, signal_type, all_indicators, config
-            )
-            position_size = self._calculate_position_size(confidence, config)
-            
-            # Build indicator summary
-            indicator_summary = {
-                'rsi': float(all_indicators['rsi'][-1]) if not np.isnan(all_indicators['rsi'][-1]) else 50,
-                'macd': float(all_indicators['macd'][-1]) if not np.isnan(all_indicators['macd'][-1]) else 0,
-                'bb_position': self._get_bb_position(current_price, all_indicators),
-                'atr': float(all_indicators['atr'][-1]) if not np.isnan(all_indicators['atr'][-1]) else 0,
-                'adx': float(all_indicators['adx'][-1]) if not np.isnan(all_indicators['adx'][-1]) else 0,
-                'trend_signal': trend_signal,
-                'momentum_signal': momentum_signal,
-                'volatility_signal': volatility_signal
-            }
-            
-            # Generate reasoning
-            reasoning = self._generate_reasoning(
-                symbol, signal_type, indicator_summary, combined_signal
-            )
-            
-            signal = TradingSignal(
-                symbol=symbol,
-                signal_type=signal_type,
-                confidence=confidence,
-                strength=abs(combined_signal),
-                entry_price=current_price,
-                stop_loss=stop_loss,
-                take_profit=take_profit,
-                position_size=position_size,
-                indicators=indicator_summary,
-                timestamp=datetime.now(),
-                reasoning=reasoning
-            )
-            
-            # Store in history
-            self.signal_history.append(signal)
-            
-            return signal
-            
-        except Exception as e:
-            self.logger.error(f"Error analyzing {symbol}: {e}")
-            raise
-    
-    def _analyze_trend(self, indicators: Dict[str, np.ndarray], 
-                       close: np.ndarray) -> float:
-        """Analyze trend indicators"""
-        signals = []
+            self.indicator_cache.put(cache_key, all_indicators)
         
-        # EMA crossover signals
-        if 'ema_9' in indicators and 'ema_21' in indicators:
-            ema_9 = indicators['ema_9'][-1]
-            ema_21 = indicators['ema_21'][-1]
-            if not np.isnan(ema_9) and not np.isnan(ema_21):
-                if ema_9 > ema_21:
-                    signals.append(0.5)
-                else:
-                    signals.append(-0.5)
+        return self._build_signal(symbol, all_indicators, current_price)
+    
+    async def analyze_pairs_batch(self, frames: Dict[str, Union[pd.DataFrame, BarStore]]
+                                  ) -> Dict[str, TradingSignal]:
+        """
+        Analyze several pairs with a single batched indicator pass
         
-        # ADX trend strength
-        if 'adx' in indicators and 'plus_di' in indicators and 'minus_di' in indicators:
-            adx = indicators['adx'][-1]
-            plus_di = indicators['plus_di'][-1]
-            minus_di = indicators['minus_di'][-1]
+        All frames must have the same number of bars and either all or none
+        carry volume; their OHLCV columns are stacked into (n_pairs, n_bars)
+        arrays so the indicators are computed in one call.
+        """
+        for symbol in frames:
+            if symbol not in self.pair_configs:
+                raise ValueError(f"Unknown symbol: {symbol}")
+            if len(frames[symbol]) < _MIN_BARS:
+                raise ValueError(
+                    f"Need at least {_MIN_BARS} bars for {symbol}, got {len(frames[symbol])}"
+                )
+        
+        extracted = {symbol: self._extract_ohlcv(data) for symbol, data in frames.items()}
+        if len({len(cols[2]) for cols in extracted.values()}) > 1:
+            raise ValueError("Batched frames must have the same number of bars")
+        if len({cols[3] is None for cols in extracted.values()}) > 1:
+            raise ValueError("Batched frames must all have or all lack volume")
+        
+        # Reuse cached per-pair results; compute the rest as one batch
+        keys = {
+            symbol: IndicatorCache.make_key(self.indicators.config, *cols[:4])
+            for symbol, cols in extracted.items()
+        }
+        indicators = {symbol: self.indicator_cache.get(key) for symbol, key in keys.items()}
+        missing = [symbol for symbol, result in indicators.items() if result is None]
+        if missing:
+            high, low, close = (
+                np.stack([extracted[symbol][col] for symbol in missing])
+                for col in range(3)
+            )
+            volume = None
+            if extracted[missing[0]][3] is not None:
+                volume = np.stack([extracted[symbol][3] for symbol in missing])
             
-            if not np.isnan(adx) and adx > 25:  # Strong trend
-                if plus_di > minus_di:
-                    signals.append(min(adx / 50, 1.0))
-                else:
-                    signals.append(-min(adx / 50, 1.0))
-        
-        # SuperTrend
-        if 'supertrend_direction' in indicators:
-            direction = indicators['supertrend_direction'][-1]
-            signals.append(direction * 0.5)
-        
-        # Ichimoku Cloud
-        if 'ichimoku_tenkan_sen' in indicators and 'ichimoku_kijun_sen' in indicators:
-            tenkan = indicators['ichimoku_tenkan_sen'][-1]
-            kijun = indicators['ichimoku_kijun_sen'][-1]
-            if not np.isnan(tenkan) and not np.isnan(kijun):
-                if tenkan > kijun:
-                    signals.append(0.3)
-                else:
-                    signals.append(-0.3)
+            loop = asyncio.get_running_loop()
+            batch = await loop.run_in_executor(
+                _indicator_executor,
+                self.indicators.calculate_all_indicators_batch,
+                high, low, close, volume
+            )
+            for row, symbol in enumerate(missing):
+                result = {key: values[row] for key, values in batch.items()}
+                self.indicator_cache.put(keys[symbol], result)
+                indicators[symbol] = result
         
-        return np.mean(signals) if signals else 0.0
+        return {
+            symbol: self._build_signal(symbol, indicators[symbol], extracted[symbol][4])
+            for symbol in frames
+        }
     
-    def _analyze_momentum(self, indicators: Dict[str, np.ndarray]) -> float:
-        """Analyze momentum indicators"""
-        signals = []
-        
-        # RSI
-        if 'rsi' in indicators:
-            rsi = indicators['rsi'][-1]
-            if not np.isnan(rsi):
-                if rsi < 30:
-                    signals.append(1.0)  # Oversold
-                elif rsi > 70:
-                    signals.append(-1.0)  # Overbought
-                else:
-                    signals.append((50 - rsi) / 50)
-        
-        # MACD
-        if 'macd' in indicators and 'macd_signal' in indicators:
-            macd = indicators['macd'][-1]
-            signal = indicators['macd_signal'][-1]
-            if not np.isnan(macd) and not np.isnan(signal):
-                if macd > signal:
-                    signals.append(0.5)
-                else:
-                    signals.append(-0.5)
-        
-        # Stochastic
-        if 'stoch_k' in indicators and 'stoch_d' in indicators:
-            stoch_k = indicators['stoch_k'][-1]
-            stoch_d = indicators['stoch_d'][-1]
-            if not np.isnan(stoch_k):
-                if stoch_k < 20:
-                    signals.append(0.8)
-                elif stoch_k > 80:
-                    signals.append(-0.8)
-                elif stoch_k > stoch_d:
-                    signals.append(0.3)
-                else:
-                    signals.append(-0.3)
-        
-        # Williams %R
-        if 'williams_r' in indicators:
-            wr = indicators['williams_r'][-1]
-            if not np.isnan(wr):
-                if wr < -80:
-                    signals.append(0.7)
-                elif wr > -20:
-                    signals.append(-0.7)
-        
-        # CCI
-        if 'cci' in indicators:
-            cci = indicators['cci'][-1]
-            if not np.isnan(cci):
-                if cci < -100:
-                    signals.append(0.6)
-                elif cci > 100:
-                    signals.append(-0.6)
-        
-        return np.mean(signals) if signals else 0.0
+    @staticmethod
+    def _extract_ohlcv(ohlcv_data: Union[pd.DataFrame, BarStore]
+                       ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Optional[np.ndarray], float]:
+        """Extract (high, low, close, volume, current_price) from an OHLCV frame or bar store"""
+        if isinstance(ohlcv_data, BarStore):
+            return ohlcv_data.ohlcv()
+        
+        # One block read for high/low/close; entry price keeps full precision
+        prices = ohlcv_data[['high', 'low', 'close']].to_numpy(dtype=np.float64, copy=False)
+        current_price = float(prices[-1, 2])
+        
+        # Contiguous float32 rows for the indicator pass; the thresholds
+        # applied downstream don't need float64 precision
+        high, low, close = np.ascontiguousarray(prices.T, dtype=np.float32)
+        volume = None
+        if 'volume' in ohlcv_data.columns:
+            volume = ohlcv_data['volume'].to_numpy(dtype=np.float32)
+        return high, low, close, volume, current_price
     
-    def _analyze_volatility(self, indicators: Dict[str, np.ndarray],
-                           symbol: str) -> float:
-        """Analyze volatility for trading suitability"""
-        signals = []
-        
-        # Bollinger Band position
-        if 'bb_upper' in indicators and 'bb_lower' in indicators and 'bb_middle' in indicators:
-            bb_upper = indicators['bb_upper'][-1]
-            bb_lower = indicators['bb_lower'][-1]
-            bb_middle = indicators['bb_middle'][-1]
-            
-            # Check for squeeze (low volatility = potential breakout)
-            bb_width = (bb_upper - bb_lower) / bb_middle if bb_middle != 0 else 0
-            if bb_width < 0.02:  # Squeeze
-                signals.append(0.3)  # Neutral but prepared
-        
-        # ATR-based volatility
-        if 'atr' in indicators:
-            atr = indicators['atr'][-1]
-            # Higher ATR = higher volatility = larger potential moves
-            if not np.isnan(atr) and atr > 0:
-                # Normalize by symbol
-                config = self.pair_configs.get(symbol)
-                if config:
-                    relative_atr = atr / config.spread_tolerance
-                    if relative_atr > 2:  # High volatility
-                        signals.append(0.2)  # Slightly bullish on volatility
+    def _build_signal(self, symbol: str, all_indicators: Dict[str, np.ndarray],
+                      current_price: float) -> TradingSignal:
+        """Score computed indicators into a TradingSignal and record it"""
+        # Extract the latest indicator values once for all downstream checks
+        last = _latest_values(all_indicators)
+        
+        # Score trend/momentum/volatility and size the position in one kernel pass
+        last_arr = np.array(
+            [last.get(key, np.nan) for key in LAST_FIELDS], dtype=np.float64
+        )
+        (trend_signal, momentum_signal, volatility_signal, combined_signal,
+         direction, confidence, stop_loss, take_profit,
+         position_size) = _PAIR_SCORERS[symbol](last_arr, current_price)
+        signal_type = _DIRECTION_SIGNALS[direction]
+        
+        # Build indicator summary
+        rsi, macd, atr, adx = last['rsi'], last['macd'], last['atr'], last['adx']
+        indicator_summary = {
+            'rsi': rsi if not math.isnan(rsi) else 50,
+            'macd': macd if not math.isnan(macd) else 0,
+            'bb_position': self._get_bb_position(current_price, last),
+            'atr': atr if not math.isnan(atr) else 0,
+            'adx': adx if not math.isnan(adx) else 0,
+            'trend_signal': trend_signal,
+            'momentum_signal': momentum_signal,
+            'volatility_signal': volatility_signal
+        }
         
-        return np.mean(signals) if signals else 0.0
+        # Reasoning is formatted lazily, only if the signal is serialized
+        reasoning = LazyReasoning(symbol, signal_type, indicator_summary, combined_signal)
+        
+        signal = TradingSignal(
+            symbol=symbol,
+            signal_type=signal_type,
+            confidence=confidence,
+            strength=abs(combined_signal),
+            entry_price=current_price,
+            stop_loss=stop_loss,
+            take_profit=take_profit,
+            position_size=position_size,
+            indicators=indicator_summary,
+            timestamp_ns=time.time_ns(),
+            reasoning=reasoning
+        )
+        
+        # Store in history
+        self.signal_history.append(signal)
+        
+        return signal
     
-    def _get_bb_position(self, price: float, indicators: Dict[str, np.ndarray]) -> float:
+    def _get_bb_position(self, price: float, last: Dict[str, float]) -> float:
         """Get price position within Bollinger Bands (0-1)"""
-        if 'bb_upper' in indicators and 'bb_lower' in indicators:
-            upper = indicators['bb_upper'][-1]
-            lower = indicators['bb_lower'][-1]
-            if not np.isnan(upper) and not np.isnan(lower) and upper != lower:
-                return (price - lower) / (upper - lower)
+        upper = last.get('bb_upper', np.nan)
+        lower = last.get('bb_lower', np.nan)
+        if not math.isnan(upper) and not math.isnan(lower) and upper != lower:
+            return (price - lower) / (upper - lower)
         return 0.5
     
-    def _calculate_stop_loss(self, price: float, signal_type: str,
-                            indicators: Dict[str, np.ndarray],
-                            config: PairConfig) -> float:
-        """Calculate stop loss price"""
-        # Use ATR-based stop loss
-        atr = indicators['atr'][-1] if not np.isnan(indicators['atr'][-1]) else price * 0.02
-        atr_multiplier = 2.0
-        
-        if signal_type == "BUY":
-            return max(price - (atr * atr_multiplier), price * (1 - config.stop_loss_pct))
-        elif signal_type == "SELL":
-            return min(price + (atr * atr_multiplier), price * (1 + config.stop_loss_pct))
-        return price
-    
-    def _calculate_take_profit(self, price: float, signal_type: str,
-                              indicators: Dict[str, np.ndarray],
-                              config: PairConfig) -> float:
-        """Calculate take profit price"""
-        # Use ATR-based take profit (2:1 reward-risk ratio)
-        atr = indicators['atr'][-1] if not np.isnan(indicators['atr'][-1]) else price * 0.02
-        atr_multiplier = 4.0
-        
-        if signal_type == "BUY":
-            return min(price + (atr * atr_multiplier), price * (1 + config.take_profit_pct))
-        elif signal_type == "SELL":
-            return max(price - (atr * atr_multiplier), price * (1 - config.take_profit_pct))
-        return price
-    
-    def _calculate_position_size(self, confidence: float, 
-                                config: PairConfig) -> float:
-        """Calculate position size based on confidence and limits"""
-        base_size = config.min_lot * 10  # Base position
-        confidence_multiplier = confidence  # Scale by confidence
-        
-        position_size = base_size * confidence_multiplier
-        max_size = config.lot_size * config.max_position_pct
-        
-        return min(position_size, max_size)
-    
-    def _generate_reasoning(self, symbol: str, signal_type: str,
-                           indicators: Dict[str, float],
-                           combined_signal: float) -> str:
-        """Generate human-readable reasoning for the signal"""
-        reasons = []
-        
-        # RSI reasoning
-        rsi = indicators.get('rsi', 50)
-        if rsi < 30:
-            reasons.append(f"RSI ({rsi:.1f}) indicates oversold conditions")
-        elif rsi > 70:
-            reasons.append(f"RSI ({rsi:.1f}) indicates overbought conditions")
-        
-        # MACD reasoning
-        macd = indicators.get('macd', 0)
-        if macd > 0:
-            reasons.append(f"MACD ({macd:.4f}) shows bullish momentum")
-        elif macd < 0:
-            reasons.append(f"MACD ({macd:.4f}) shows bearish momentum")
-        
-        # Trend reasoning
-        adx = indicators.get('adx', 0)
-        if adx > 25:
-            reasons.append(f"ADX ({adx:.1f}) indicates strong trend")
-        else:
-            reasons.append(f"ADX ({adx:.1f}) indicates ranging market")
-        
-        # BB position
-        bb_pos = indicators.get('bb_position', 0.5)
-        if bb_pos < 0.2:
-            reasons.append("Price near lower Bollinger Band")
-        elif bb_pos > 0.8:
-            reasons.append("Price near upper Bollinger Band")
-        
-        reasoning = f"{signal_type} signal for {symbol} (confidence: {abs(combined_signal):.2f}). "
-        reasoning += " ".join(reasons)
-        
-        return reasoning
-    
     async def analyze_btc_gold_correlation(self, 
                                           btc_data: pd.DataFrame,
                                           gold_data: pd.DataFrame) -> Dict[str, Any]:
@@ -466,33 +698,13 @@ class CryptoGoldTrader:
         Returns correlation analysis and potential arbitrage opportunities
         """
         try:
-            # Calculate returns
-            btc_returns = btc_data['close'].pct_change().dropna()
-            gold_returns = gold_data['close'].pct_change().dropna()
-            
-            # Align data
-            min_len = min(len(btc_returns), len(gold_returns))
-            btc_returns = btc_returns[-min_len:]
-            gold_returns = gold_returns[-min_len:]
+            btc_close = btc_data['close'].to_numpy(dtype=np.float64)
+            gold_close = gold_data['close'].to_numpy(dtype=np.float64)
             
-            # Calculate correlation
-            correlation = np.corrcoef(btc_returns, gold_returns)[0, 1]
-            
-            # Calculate rolling correlation
-            rolling_corr = pd.Series(btc_returns.values).rolling(20).corr(
-                pd.Series(gold_returns.values)
-            )
-            
-            # Calculate BTCXAU implied price
-            btc_price = btc_data['close'].iloc[-1]
-            gold_price = gold_data['close'].iloc[-1]
-            btcxau_implied = btc_price / gold_price
-            
-            # Detect divergence
-            btc_momentum = (btc_data['close'].iloc[-1] / btc_data['close'].iloc[-20] - 1) * 100
-            gold_momentum = (gold_data['close'].iloc[-1] / gold_data['close'].iloc[-20] - 1) * 100
-            
-            divergence = btc_momentum - gold_momentum
+            # Returns, correlation, latest 20-bar rolling correlation and
+            # momentum divergence in a single pass
+            (correlation, rolling_corr, btcxau_implied,
+             btc_momentum, gold_momentum, divergence) = analyze_corr(btc_close, gold_close, 20)
             
             # Trading recommendation
             if abs(correlation) < 0.3 and abs(divergence) > 10:
@@ -506,15 +718,15 @@ class CryptoGoldTrader:
             
             return {
                 'correlation': float(correlation),
-                'rolling_correlation': rolling_corr.iloc[-1] if len(rolling_corr) > 0 else None,
-                'btc_price': float(btc_price),
-                'gold_price': float(gold_price),
+                'rolling_correlation': rolling_corr,
+                'btc_price': float(btc_close[-1]),
+                'gold_price': float(gold_close[-1]),
                 'btcxau_implied': float(btcxau_implied),
                 'btc_momentum_20d': float(btc_momentum),
                 'gold_momentum_20d': float(gold_momentum),
                 'divergence': float(divergence),
                 'recommendation': recommendation,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': _ns_to_iso(time.time_ns())
             }
             
         except Exception as e:
@@ -530,33 +742,30 @@ class CryptoGoldTrader:
             'performance_summary': {}
         }
         
-        for pair in CryptoGoldPair:
-            config = self.pair_configs[pair.value]
-            status['pairs'][pair.value] = {
+        for symbol in _PAIRS:
+            config = self.pair_configs[symbol]
+            status['pairs'][symbol] = {
                 'is_24_7': config.is_24_7,
                 'max_position_pct': config.max_position_pct,
-                'current_position': self.current_positions.get(pair.value),
-                'performance': self.performance[pair.value]
+                'current_position': self.current_positions.get(symbol),
+                'performance': self.performance[symbol]
             }
         
         return status
     
+    def update_market_data(self, symbol: str, open_: float, high: float, low: float,
+                           close: float, volume: float = 0.0,
+                           timestamp_ns: Optional[int] = None) -> None:
+        """Append a bar to the symbol's cached BarStore"""
+        store = self.market_data_cache.get(symbol)
+        if store is None:
+            store = self.market_data_cache[symbol] = BarStore()
+        store.append(open_, high, low, close, volume, timestamp_ns)
+        self.last_update[symbol] = datetime.now()
+    
     def get_latest_signals(self, count: int = 10) -> List[Dict[str, Any]]:
         """Get latest trading signals"""
-        signals = self.signal_history[-count:]
-        return [
-            {
-                'symbol': s.symbol,
-                'signal_type': s.signal_type,
-                'confidence': s.confidence,
-                'entry_price': s.entry_price,
-                'stop_loss': s.stop_loss,
-                'take_profit': s.take_profit,
-                'reasoning': s.reasoning,
-                'timestamp': s.timestamp.isoformat()
-            }
-            for s in signals
-        ]
+        return self.signal_history.latest(count)
 
 
 # Create global instance
@@ -568,16 +777,29 @@ async def analyze_all_crypto_gold_pairs(btc_data: pd.DataFrame = None,
                                         btcxau_data: pd.DataFrame = None) -> Dict[str, TradingSignal]:
     """
     Analyze all crypto/gold pairs and return signals
+    Pairs without a frame fall back to the trader's cached BarStore, if any
     """
-    signals = {}
-    
-    if btc_data is not None and len(btc_data) > 0:
-        signals['BTCUSD'] = await crypto_gold_trader.analyze_pair('BTCUSD', btc_data)
-    
-    if gold_data is not None and len(gold_data) > 0:
-        signals['XAUUSD'] = await crypto_gold_trader.analyze_pair('XAUUSD', gold_data)
+    cache = crypto_gold_trader.market_data_cache
+    pairs = [
+        (symbol, data if data is not None else cache.get(symbol))
+        for symbol, data in (('BTCUSD', btc_data), ('XAUUSD', gold_data), ('BTCXAU', btcxau_data))
+    ]
+    pairs = [(symbol, data) for symbol, data in pairs if data is not None and len(data) > 0]
     
-    if btcxau_data is not None and len(btcxau_data) > 0:
-        signals['BTCXAU'] = await crypto_gold_trader.analyze_pair('BTCXAU', btcxau_data)
+    try:
+        # Equal-length frames share one batched indicator pass
+        if len(pairs) > 1 and len({len(data) for _, data in pairs}) == 1 \
+                and len({_has_volume(data) for _, data in pairs}) == 1:
+            return await crypto_gold_trader.analyze_pairs_batch(dict(pairs))
+        
+        # Otherwise analyze all pairs concurrently
+        results = await asyncio.gather(
+            *[crypto_gold_trader.analyze_pair(symbol, data) for symbol, data in pairs]
+        )
+    except Exception:
+        crypto_gold_trader.logger.exception(
+            "Error analyzing crypto/gold pairs %s", [symbol for symbol, _ in pairs]
+        )
+        raise
     
-    return signals
+    return {symbol: signal for (symbol, _), signal in zip(pairs, results)}
@@ -37,9 +37,9 @@ class StrategyType(Enum):
     ML_PREDICTION = "ml_prediction"
 
 
-@dataclass
+@dataclass(slots=True)
 class TradingSignal:
-    """Trading signal with metadata"""
+    """Trading signal with metadata (slotted: compact, fast attribute access)"""
     symbol: str
     signal_type: SignalType
     confidence: float
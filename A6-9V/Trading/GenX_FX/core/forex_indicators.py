@@ -5,10 +5,350 @@ Supports BTCXAU, BTCUSD, XAUUSD and 10 forex pairs for 24/7 trading
 
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Tuple, Any
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Dict, List, Optional, Tuple, Any, Union
 from dataclasses import dataclass
 from enum import Enum
 import logging
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from ._njit import njit, jitclass, NUMBA_AVAILABLE
+
+try:
+    from scipy.signal import lfilter
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+try:
+    import talib
+    TALIB_AVAILABLE = True
+except ImportError:
+    TALIB_AVAILABLE = False
+
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
+
+
+def _as_f64(values: np.ndarray) -> np.ndarray:
+    """Contiguous float64 view/copy, as required by the TA-Lib bindings"""
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def _rolling(values: np.ndarray, period: int, stat: str) -> np.ndarray:
+    """
+    Trailing-window max/min/mean/std (ddof=0), NaN until a full window
+    Uses bottleneck's moving-window functions when installed, else pandas rolling.
+    """
+    if BOTTLENECK_AVAILABLE:
+        if len(values) < period:
+            return np.full(len(values), np.nan)
+        return getattr(bn, f'move_{stat}')(_as_f64(values), period)
+    rolling = pd.Series(values).rolling(period)
+    return (rolling.std(ddof=0) if stat == 'std' else getattr(rolling, stat)()).to_numpy()
+
+
+@lru_cache(maxsize=64)
+def _sma_kernel(period: int) -> np.ndarray:
+    """Read-only uniform 1/period weights for the SMA convolution"""
+    kernel = np.full(period, 1.0 / period)
+    kernel.setflags(write=False)
+    return kernel
+
+
+@lru_cache(maxsize=64)
+def _wma_weights(period: int) -> np.ndarray:
+    """Read-only linear weights 1..period, normalized to sum to 1"""
+    weights = np.arange(1, period + 1, dtype=np.float64)
+    weights /= weights.sum()
+    weights.setflags(write=False)
+    return weights
+
+
+@njit(cache=True)
+def _ema_loop(prices, period, multiplier, seed):
+    """EMA recurrence seeded with ``seed`` at index ``period - 1``"""
+    ema = np.empty(len(prices))
+    ema[:period-1] = np.nan
+    ema[period-1] = seed
+    for i in range(period, len(prices)):
+        ema[i] = (prices[i] * multiplier) + (ema[i-1] * (1 - multiplier))
+    return ema
+
+
+def _ema_lfilter(prices, period, multiplier, seed):
+    """EMA as a first-order IIR filter, for when the JIT kernel isn't compiled"""
+    ema = np.empty(len(prices))
+    ema[:period-1] = np.nan
+    ema[period-1] = seed
+    ema[period:] = lfilter([multiplier], [1.0, -(1 - multiplier)], prices[period:],
+                           zi=[(1 - multiplier) * seed])[0]
+    return ema
+
+
+def _ema_recurrence(values, period, multiplier, seed):
+    """
+    EMA-style recurrence seeded with ``seed`` at index ``period - 1``
+    Uses the JIT kernel when numba is present, otherwise SciPy's IIR filter.
+    """
+    if not NUMBA_AVAILABLE and SCIPY_AVAILABLE:
+        return _ema_lfilter(values, period, multiplier, seed)
+    return _ema_loop(values, period, multiplier, seed)
+
+
+@njit(cache=True)
+def _stacked_ema_loop(prices, period, multiplier, depth):
+    """
+    DEMA (depth 2) or TEMA (depth 3) in one pass over ``prices``
+    Each EMA level is seeded with the mean of the first ``period`` values of
+    the level below, matching repeated calls to ``calculate_ema``.
+    """
+    n = len(prices)
+    out = np.full(n, np.nan)
+    ema = np.zeros(3)
+    seed_sum = np.zeros(3)
+    for i in range(n):
+        x = prices[i]
+        for k in range(depth):
+            # Level k's input (level k-1) is only valid from k*(period-1)
+            if i < k * (period - 1):
+                break
+            first_valid = (k + 1) * (period - 1)
+            if i < first_valid:
+                seed_sum[k] += x
+                break
+            if i == first_valid:
+                ema[k] = (seed_sum[k] + x) / period
+            else:
+                ema[k] = (x * multiplier) + (ema[k] * (1 - multiplier))
+            x = ema[k]
+        if i >= depth * (period - 1):
+            if depth == 2:
+                out[i] = 2 * ema[0] - ema[1]
+            else:
+                out[i] = 3 * ema[0] - 3 * ema[1] + ema[2]
+    return out
+
+
+@njit(cache=True)
+def _kama_loop(prices, sc, period):
+    """KAMA recurrence given the per-bar smoothing constants ``sc``"""
+    kama = np.empty(len(prices))
+    kama[:period-1] = np.nan
+    kama[period-1] = prices[period-1]
+    for i in range(period, len(prices)):
+        kama[i] = kama[i-1] + sc[i-period] * (prices[i] - kama[i-1])
+    return kama
+
+
+@njit(cache=True)
+def _supertrend_loop(close, upper_band, lower_band):
+    """SuperTrend band/direction recurrence; adjusts the bands in place"""
+    supertrend = np.zeros(len(close))
+    direction = np.zeros(len(close))  # 1 = uptrend, -1 = downtrend
+
+    supertrend[0] = upper_band[0]
+    direction[0] = 1
+
+    for i in range(1, len(close)):
+        # Calculate final bands
+        if upper_band[i] < supertrend[i-1] or close[i-1] > supertrend[i-1]:
+            upper_band[i] = upper_band[i]
+        else:
+            upper_band[i] = supertrend[i-1]
+
+        if lower_band[i] > supertrend[i-1] or close[i-1] < supertrend[i-1]:
+            lower_band[i] = lower_band[i]
+        else:
+            lower_band[i] = supertrend[i-1]
+
+        # Determine trend
+        if direction[i-1] == 1:  # Was in uptrend
+            if close[i] < lower_band[i]:
+                direction[i] = -1
+                supertrend[i] = upper_band[i]
+            else:
+                direction[i] = 1
+                supertrend[i] = lower_band[i]
+        else:  # Was in downtrend
+            if close[i] > upper_band[i]:
+                direction[i] = 1
+                supertrend[i] = lower_band[i]
+            else:
+                direction[i] = -1
+                supertrend[i] = upper_band[i]
+
+    return supertrend, direction
+
+
+@njit(cache=True)
+def _rolling_midpoints(high, low, windows):
+    """
+    (max(high) + min(low)) / 2 over each trailing window in ``windows``
+    One pass over the bars with a monotonic index deque per window and side;
+    a window holding a NaN high or low is NaN, as with np.max/np.min.
+    """
+    n = len(high)
+    k = len(windows)
+    out = np.full((k, n), np.nan)
+    max_q = np.empty((k, n), dtype=np.int64)
+    min_q = np.empty((k, n), dtype=np.int64)
+    max_head = np.zeros(k, dtype=np.int64)
+    max_tail = np.zeros(k, dtype=np.int64)
+    min_head = np.zeros(k, dtype=np.int64)
+    min_tail = np.zeros(k, dtype=np.int64)
+    last_nan = -1
+    for i in range(n):
+        h = high[i]
+        l = low[i]
+        if np.isnan(h) or np.isnan(l):
+            last_nan = i
+        for j in range(k):
+            w = windows[j]
+            if not np.isnan(h):
+                while max_tail[j] > max_head[j] and high[max_q[j, max_tail[j] - 1]] <= h:
+                    max_tail[j] -= 1
+                max_q[j, max_tail[j]] = i
+                max_tail[j] += 1
+            if not np.isnan(l):
+                while min_tail[j] > min_head[j] and low[min_q[j, min_tail[j] - 1]] >= l:
+                    min_tail[j] -= 1
+                min_q[j, min_tail[j]] = i
+                min_tail[j] += 1
+            while max_tail[j] > max_head[j] and max_q[j, max_head[j]] <= i - w:
+                max_head[j] += 1
+            while min_tail[j] > min_head[j] and min_q[j, min_head[j]] <= i - w:
+                min_head[j] += 1
+            if i >= w - 1 and last_nan <= i - w:
+                out[j, i] = (high[max_q[j, max_head[j]]] + low[min_q[j, min_head[j]]]) / 2
+    return out
+
+
+@njit(cache=True)
+def _ema_row(prices, period, out):
+    """``calculate_ema`` for one row, written into ``out``"""
+    n = len(prices)
+    out[:] = np.nan
+    start = 0
+    while start < n and np.isnan(prices[start]):
+        start += 1
+    if n - start < period:
+        return
+    multiplier = 2 / (period + 1)
+    ema = 0.0
+    for i in range(start, start + period):
+        ema += prices[i]
+    ema /= period
+    out[start + period - 1] = ema
+    for i in range(start + period, n):
+        ema = (prices[i] * multiplier) + (ema * (1 - multiplier))
+        out[i] = ema
+
+
+@njit(cache=True)
+def _rsi_row(prices, period, out):
+    """``calculate_rsi`` for one row, written into ``out``"""
+    n = len(prices)
+    if n < period + 1:
+        out[:] = 50.0
+        return
+    out[:period] = np.nan
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        delta = prices[i] - prices[i-1]
+        if delta > 0:
+            avg_gain += delta
+        elif delta < 0:
+            avg_loss -= delta
+    avg_gain /= period
+    avg_loss /= period
+    alpha = 1.0 / period
+    for i in range(period, n):
+        if i > period:
+            delta = prices[i] - prices[i-1]
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            avg_gain = (gain * alpha) + (avg_gain * (1 - alpha))
+            avg_loss = (loss * alpha) + (avg_loss * (1 - alpha))
+        if avg_loss == 0:
+            out[i] = 100.0
+        else:
+            out[i] = 100 - 100 / (1 + avg_gain / avg_loss)
+
+
+@njit(cache=True)
+def _true_range_row(high, low, close):
+    """``calculate_true_range`` for one row"""
+    n = len(close)
+    tr = np.empty(n)
+    if n:
+        tr[0] = high[0] - low[0]
+    for i in range(1, n):
+        hl = high[i] - low[i]
+        hc = abs(high[i] - close[i-1])
+        lc = abs(low[i] - close[i-1])
+        # NaN-propagating like np.maximum
+        if np.isnan(hl) or np.isnan(hc) or np.isnan(lc):
+            tr[i] = np.nan
+        else:
+            tr[i] = max(hl, hc, lc)
+    return tr
+
+
+if NUMBA_AVAILABLE:
+    from numba import int64
+    _CORE_SPEC = [('rsi_period', int64), ('ema_periods', int64[:]), ('atr_periods', int64[:])]
+else:
+    _CORE_SPEC = []
+
+
+@jitclass(_CORE_SPEC)
+class _IndicatorCore:
+    """IndicatorConfig's recurrence periods and the per-symbol batch row as one JIT unit"""
+    
+    def __init__(self, rsi_period, ema_periods, atr_periods):
+        self.rsi_period = rsi_period
+        self.ema_periods = ema_periods
+        self.atr_periods = atr_periods
+    
+    def row(self, high, low, close, emas, rsi, atrs, s):
+        """EMAs, RSI and ATRs for symbol row ``s``, written into the stacked outputs"""
+        for k in range(len(self.ema_periods)):
+            _ema_row(close[s], self.ema_periods[k], emas[k, s])
+        _rsi_row(close[s], self.rsi_period, rsi[s])
+        if close.shape[1] < 2:
+            atrs[:, s] = 0.0
+            return
+        tr = _true_range_row(high[s], low[s], close[s])
+        for k in range(len(self.atr_periods)):
+            _ema_row(tr, self.atr_periods[k], atrs[k, s])
+
+
+# jitclass types differ per process, so this entry point can't use cache=True
+@njit(nogil=True)
+def _batch_row(core, high, low, close, emas, rsi, atrs, s):
+    """``core.row`` with the GIL released"""
+    core.row(high, low, close, emas, rsi, atrs, s)
+
+
+# Symbol rows of calculate_all_indicators_batch run here; _batch_row drops
+# the GIL so they compute in parallel. numba's parallel=True is avoided as
+# its TBB layer hangs interpreter exit when first launched off the main thread.
+_batch_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="indicator-batch"
+)
+
+
+# Series read by ForexIndicators.get_signal_strength
+_SIGNAL_KEYS = ('rsi', 'macd_histogram', 'stoch_k', 'stoch_d', 'adx',
+                'plus_di', 'minus_di', 'supertrend_direction')
 
 
 class IndicatorType(Enum):
@@ -63,6 +403,11 @@ class IndicatorConfig:
     ichimoku_kijun: int = 26
     ichimoku_senkou_b: int = 52
     
+    # Storage dtype for inputs and results of calculate_all_indicators;
+    # recurrences and running sums still accumulate in float64. Hot paths
+    # may pass np.float32 to halve memory traffic
+    dtype: Any = np.float64
+    
     def __post_init__(self):
         if self.sma_periods is None:
             self.sma_periods = [5, 10, 20, 50, 100, 200]
@@ -89,7 +434,10 @@ class ForexIndicators:
         if len(prices) < period:
             return np.full(len(prices), np.nan)
         
-        sma = np.convolve(prices, np.ones(period)/period, mode='valid')
+        if TALIB_AVAILABLE:
+            return talib.SMA(_as_f64(prices), timeperiod=period)
+        
+        sma = np.convolve(prices, _sma_kernel(period), mode='valid')
         # Pad the beginning with NaN
         return np.concatenate([np.full(period-1, np.nan), sma])
     
@@ -98,14 +446,19 @@ class ForexIndicators:
         if len(prices) < period:
             return np.full(len(prices), np.nan)
         
-        multiplier = 2 / (period + 1)
-        ema = np.zeros(len(prices))
-        ema[:period] = np.nan
-        ema[period-1] = np.mean(prices[:period])
-        
-        for i in range(period, len(prices)):
-            ema[i] = (prices[i] * multiplier) + (ema[i-1] * (1 - multiplier))
+        if TALIB_AVAILABLE:
+            return talib.EMA(_as_f64(prices), timeperiod=period)
         
+        # Like TA-Lib, start after leading NaNs so EMAs of indicator series
+        # (MACD signal, DEMA/TEMA, ADX) are seeded from their first valid values
+        start = int(np.argmax(~np.isnan(prices)))
+        if len(prices) - start < period or np.isnan(prices[start]):
+            return np.full(len(prices), np.nan)
+
+        multiplier = 2 / (period + 1)
+        seed = float(np.mean(prices[start:start + period]))
+        ema = np.full(len(prices), np.nan)
+        ema[start:] = _ema_recurrence(prices[start:], period, multiplier, seed)
         return ema
     
     def calculate_wma(self, prices: np.ndarray, period: int) -> np.ndarray:
@@ -113,29 +466,39 @@ class ForexIndicators:
         if len(prices) < period:
             return np.full(len(prices), np.nan)
 
-        weights = np.arange(1, period + 1)
-        wma = np.zeros(len(prices))
-        wma[:period-1] = np.nan
+        if TALIB_AVAILABLE:
+            return talib.WMA(_as_f64(prices), timeperiod=period)
+
+        wma = np.full(len(prices), np.nan)
+
+        # One matmul over a zero-copy window view instead of a per-bar loop
+        windows = sliding_window_view(_as_f64(prices), period)
+        wma[period-1:] = windows @ _wma_weights(period)
 
-        # Performance optimization: Cache the constant weight sum
-        weight_sum = np.sum(weights)
-        for i in range(period-1, len(prices)):
-            wma[i] = np.sum(prices[i-period+1:i+1] * weights) / weight_sum
-        
         return wma
     
     def calculate_dema(self, prices: np.ndarray, period: int) -> np.ndarray:
         """Calculate Double Exponential Moving Average"""
-        ema1 = self.calculate_ema(prices, period)
-        ema2 = self.calculate_ema(ema1, period)
-        return 2 * ema1 - ema2
+        if TALIB_AVAILABLE:
+            return talib.DEMA(_as_f64(prices), timeperiod=period)
+        return self._stacked_ema(prices, period, 2)
     
     def calculate_tema(self, prices: np.ndarray, period: int) -> np.ndarray:
         """Calculate Triple Exponential Moving Average"""
-        ema1 = self.calculate_ema(prices, period)
-        ema2 = self.calculate_ema(ema1, period)
-        ema3 = self.calculate_ema(ema2, period)
-        return 3 * ema1 - 3 * ema2 + ema3
+        if TALIB_AVAILABLE:
+            return talib.TEMA(_as_f64(prices), timeperiod=period)
+        return self._stacked_ema(prices, period, 3)
+    
+    def _stacked_ema(self, prices: np.ndarray, period: int, depth: int) -> np.ndarray:
+        """DEMA/TEMA via the fused kernel, skipping leading NaNs like calculate_ema"""
+        result = np.full(len(prices), np.nan)
+        if len(prices) == 0:
+            return result
+        start = int(np.argmax(~np.isnan(prices)))
+        if len(prices) - start < depth * (period - 1) + 1 or np.isnan(prices[start]):
+            return result
+        result[start:] = _stacked_ema_loop(prices[start:], period, 2 / (period + 1), depth)
+        return result
     
     def calculate_kama(self, prices: np.ndarray, period: int = 10, 
                        fast: int = 2, slow: int = 30) -> np.ndarray:
@@ -146,9 +509,8 @@ class ForexIndicators:
         # Calculate Efficiency Ratio
         change = np.abs(prices[period:] - prices[:-period])
         volatility = np.zeros(len(prices) - period)
-        
-        for i in range(len(volatility)):
-            volatility[i] = np.sum(np.abs(np.diff(prices[i:i+period+1])))
+        if len(volatility):
+            volatility = sliding_window_view(np.abs(np.diff(prices)), period).sum(axis=1)
         
         # Avoid division by zero
         volatility = np.where(volatility == 0, 1e-10, volatility)
@@ -160,14 +522,7 @@ class ForexIndicators:
         sc = (er * (fast_sc - slow_sc) + slow_sc) ** 2
         
         # Calculate KAMA
-        kama = np.zeros(len(prices))
-        kama[:period] = np.nan
-        kama[period-1] = prices[period-1]
-        
-        for i in range(period, len(prices)):
-            kama[i] = kama[i-1] + sc[i-period] * (prices[i] - kama[i-1])
-        
-        return kama
+        return _kama_loop(prices, sc, period)
     
     # ==========================================================================
     # MOMENTUM INDICATORS
@@ -184,22 +539,18 @@ class ForexIndicators:
         gains = np.where(deltas > 0, deltas, 0)
         losses = np.where(deltas < 0, -deltas, 0)
         
-        rsi = np.zeros(len(prices))
-        rsi[:period] = np.nan
-        
-        # Calculate initial average gain/loss
-        avg_gain = np.mean(gains[:period])
-        avg_loss = np.mean(losses[:period])
-        
-        for i in range(period, len(prices) - 1):
-            avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-            avg_loss = (avg_loss * (period - 1) + losses[i]) / period
-            
-            if avg_loss == 0:
-                rsi[i+1] = 100
-            else:
-                rs = avg_gain / avg_loss
-                rsi[i+1] = 100 - (100 / (1 + rs))
+        # Wilder smoothing is an EMA with alpha = 1/period, seeded with the
+        # mean of the first period gains/losses
+        alpha = 1.0 / period
+        avg_gain = _ema_recurrence(gains, period, alpha, float(np.mean(gains[:period])))
+        avg_loss = _ema_recurrence(losses, period, alpha, float(np.mean(losses[:period])))
+        
+        rsi = np.full(len(prices), np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi[period:] = np.where(
+                avg_loss[period-1:] == 0, 100.0,
+                100 - 100 / (1 + avg_gain[period-1:] / avg_loss[period-1:])
+            )
         
         return rsi
     
@@ -237,17 +588,13 @@ class ForexIndicators:
         if len(close) < k_period:
             return np.full(len(close), 50.0), np.full(len(close), 50.0)
         
-        stoch_k = np.zeros(len(close))
-        stoch_k[:k_period-1] = np.nan
+        highest_high = _rolling(high, k_period, 'max')
+        lowest_low = _rolling(low, k_period, 'min')
+        price_range = highest_high - lowest_low
         
-        for i in range(k_period-1, len(close)):
-            highest_high = np.max(high[i-k_period+1:i+1])
-            lowest_low = np.min(low[i-k_period+1:i+1])
-            
-            if highest_high == lowest_low:
-                stoch_k[i] = 50.0
-            else:
-                stoch_k[i] = ((close[i] - lowest_low) / (highest_high - lowest_low)) * 100
+        with np.errstate(divide='ignore', invalid='ignore'):
+            stoch_k = np.where(price_range == 0, 50.0,
+                               (close - lowest_low) / price_range * 100)
         
         # Smooth %K
         stoch_k_smooth = self.calculate_sma(stoch_k, smooth)
@@ -265,42 +612,42 @@ class ForexIndicators:
         if len(close) < period:
             return np.full(len(close), -50.0)
         
-        williams_r = np.zeros(len(close))
-        williams_r[:period-1] = np.nan
+        highest_high = _rolling(high, period, 'max')
+        lowest_low = _rolling(low, period, 'min')
+        price_range = highest_high - lowest_low
         
-        for i in range(period-1, len(close)):
-            highest_high = np.max(high[i-period+1:i+1])
-            lowest_low = np.min(low[i-period+1:i+1])
-            
-            if highest_high == lowest_low:
-                williams_r[i] = -50.0
-            else:
-                williams_r[i] = ((highest_high - close[i]) / (highest_high - lowest_low)) * -100
+        with np.errstate(divide='ignore', invalid='ignore'):
+            williams_r = np.where(price_range == 0, -50.0,
+                                  (highest_high - close) / price_range * -100)
         
         return williams_r
     
     def calculate_cci(self, high: np.ndarray, low: np.ndarray,
-                      close: np.ndarray, period: int = None) -> np.ndarray:
+                      close: np.ndarray, period: int = None,
+                      tp: np.ndarray = None) -> np.ndarray:
         """Calculate Commodity Channel Index"""
         period = period or self.config.cci_period
         
         # Typical price
-        tp = (high + low + close) / 3
+        if tp is None:
+            tp = (high + low + close) / 3
         
         if len(tp) < period:
             return np.full(len(tp), 0.0)
         
-        cci = np.zeros(len(tp))
-        cci[:period-1] = np.nan
+        if TALIB_AVAILABLE:
+            return talib.CCI(_as_f64(high), _as_f64(low), _as_f64(close), timeperiod=period)
         
-        for i in range(period-1, len(tp)):
-            sma_tp = np.mean(tp[i-period+1:i+1])
-            mean_deviation = np.mean(np.abs(tp[i-period+1:i+1] - sma_tp))
-            
-            if mean_deviation == 0:
-                cci[i] = 0.0
-            else:
-                cci[i] = (tp[i] - sma_tp) / (0.015 * mean_deviation)
+        # Mean absolute deviation needs each window's own mean, so evaluate
+        # all windows at once over a strided view
+        windows = sliding_window_view(tp, period)
+        sma_tp = windows.mean(axis=1)
+        mean_deviation = np.abs(windows - sma_tp[:, None]).mean(axis=1)
+        
+        cci = np.full(len(tp), np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cci[period-1:] = np.where(mean_deviation == 0, 0.0,
+                                      (tp[period-1:] - sma_tp) / (0.015 * mean_deviation))
         
         return cci
     
@@ -309,8 +656,8 @@ class ForexIndicators:
         if len(prices) < period + 1:
             return np.full(len(prices), 0.0)
         
-        momentum = np.zeros(len(prices))
-        momentum[:period] = np.nan
+        # Same float dtype as the input, so float32 storage stays float32
+        momentum = np.full(len(prices), np.nan, dtype=np.result_type(prices, np.float32))
         momentum[period:] = prices[period:] - prices[:-period]
         
         return momentum
@@ -320,14 +667,12 @@ class ForexIndicators:
         if len(prices) < period + 1:
             return np.full(len(prices), 0.0)
         
-        roc = np.zeros(len(prices))
-        roc[:period] = np.nan
+        roc = np.full(len(prices), np.nan, dtype=np.result_type(prices, np.float32))
         
-        for i in range(period, len(prices)):
-            if prices[i-period] != 0:
-                roc[i] = ((prices[i] - prices[i-period]) / prices[i-period]) * 100
-            else:
-                roc[i] = 0.0
+        # A zero reference price maps to 0 rather than inf
+        prev = prices[:-period]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            roc[period:] = np.where(prev != 0, ((prices[period:] - prev) / prev) * 100, 0.0)
         
         return roc
     
@@ -345,43 +690,46 @@ class ForexIndicators:
         period = period or self.config.bb_period
         std_dev = std_dev or self.config.bb_std_dev
         
-        middle_band = self.calculate_sma(prices, period)
-        
         if len(prices) < period:
             return (np.full(len(prices), np.nan), 
                     np.full(len(prices), np.nan), 
                     np.full(len(prices), np.nan))
         
-        std = np.zeros(len(prices))
-        std[:period-1] = np.nan
+        if TALIB_AVAILABLE:
+            return talib.BBANDS(_as_f64(prices), timeperiod=period,
+                                nbdevup=std_dev, nbdevdn=std_dev, matype=0)
+        
+        middle_band = self.calculate_sma(prices, period)
         
-        for i in range(period-1, len(prices)):
-            std[i] = np.std(prices[i-period+1:i+1])
+        std = _rolling(prices, period, 'std')
         
         upper_band = middle_band + (std * std_dev)
         lower_band = middle_band - (std * std_dev)
         
         return upper_band, middle_band, lower_band
     
+    def calculate_true_range(self, high: np.ndarray, low: np.ndarray,
+                             close: np.ndarray) -> np.ndarray:
+        """Calculate True Range; the first bar has no previous close"""
+        high, low, close = _as_f64(high), _as_f64(low), _as_f64(close)
+        prev_close = np.concatenate((close[:1], close[:-1]))
+        tr = np.maximum(high - low, np.maximum(np.abs(high - prev_close),
+                                               np.abs(low - prev_close)))
+        tr[:1] = high[:1] - low[:1]
+        return tr
+
     def calculate_atr(self, high: np.ndarray, low: np.ndarray,
-                      close: np.ndarray, period: int = None) -> np.ndarray:
+                      close: np.ndarray, period: int = None,
+                      tr: np.ndarray = None) -> np.ndarray:
         """Calculate Average True Range"""
         period = period or self.config.atr_period
         
         if len(close) < 2:
             return np.full(len(close), 0.0)
         
-        # Calculate True Range
-        tr = np.zeros(len(close))
-        tr[0] = high[0] - low[0]
-        
-        for i in range(1, len(close)):
-            tr[i] = max(
-                high[i] - low[i],
-                abs(high[i] - close[i-1]),
-                abs(low[i] - close[i-1])
-            )
-        
+        if tr is None:
+            tr = self.calculate_true_range(high, low, close)
+
         # Calculate ATR using EMA
         atr = self.calculate_ema(tr, period)
         
@@ -390,13 +738,15 @@ class ForexIndicators:
     def calculate_keltner_channels(self, high: np.ndarray, low: np.ndarray,
                                    close: np.ndarray, ema_period: int = 20,
                                    atr_period: int = 10, 
-                                   multiplier: float = 2.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+                                   multiplier: float = 2.0,
+                                   atr: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Calculate Keltner Channels
         Returns: (upper_channel, middle_channel, lower_channel)
         """
         middle = self.calculate_ema(close, ema_period)
-        atr = self.calculate_atr(high, low, close, atr_period)
+        if atr is None:
+            atr = self.calculate_atr(high, low, close, atr_period)
         
         upper = middle + (multiplier * atr)
         lower = middle - (multiplier * atr)
@@ -414,14 +764,8 @@ class ForexIndicators:
                     np.full(len(high), np.nan),
                     np.full(len(high), np.nan))
         
-        upper = np.zeros(len(high))
-        lower = np.zeros(len(low))
-        upper[:period-1] = np.nan
-        lower[:period-1] = np.nan
-        
-        for i in range(period-1, len(high)):
-            upper[i] = np.max(high[i-period+1:i+1])
-            lower[i] = np.min(low[i-period+1:i+1])
+        upper = _rolling(high, period, 'max')
+        lower = _rolling(low, period, 'min')
         
         middle = (upper + lower) / 2
         
@@ -432,7 +776,8 @@ class ForexIndicators:
     # ==========================================================================
     
     def calculate_adx(self, high: np.ndarray, low: np.ndarray,
-                      close: np.ndarray, period: int = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+                      close: np.ndarray, period: int = None,
+                      atr: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Calculate ADX (Average Directional Index)
         Returns: (adx, +DI, -DI)
@@ -445,25 +790,15 @@ class ForexIndicators:
                     np.full(len(close), np.nan))
         
         # Calculate +DM and -DM
-        plus_dm = np.zeros(len(high))
-        minus_dm = np.zeros(len(high))
-        
-        for i in range(1, len(high)):
-            up_move = high[i] - high[i-1]
-            down_move = low[i-1] - low[i]
-            
-            if up_move > down_move and up_move > 0:
-                plus_dm[i] = up_move
-            else:
-                plus_dm[i] = 0
-                
-            if down_move > up_move and down_move > 0:
-                minus_dm[i] = down_move
-            else:
-                minus_dm[i] = 0
-        
+        high, low = _as_f64(high), _as_f64(low)
+        up_move = np.diff(high, prepend=high[0])
+        down_move = -np.diff(low, prepend=low[0])
+        plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+        minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+
         # Calculate ATR
-        atr = self.calculate_atr(high, low, close, period)
+        if atr is None:
+            atr = self.calculate_atr(high, low, close, period)
         
         # Smoothed +DM and -DM
         plus_dm_smooth = self.calculate_ema(plus_dm, period)
@@ -491,70 +826,67 @@ class ForexIndicators:
         if len(close) < 2:
             return np.zeros(len(close))
         
-        obv = np.zeros(len(close))
-        obv[0] = volume[0]
+        if TALIB_AVAILABLE:
+            return talib.OBV(_as_f64(close), _as_f64(volume))
         
-        for i in range(1, len(close)):
-            if close[i] > close[i-1]:
-                obv[i] = obv[i-1] + volume[i]
-            elif close[i] < close[i-1]:
-                obv[i] = obv[i-1] - volume[i]
-            else:
-                obv[i] = obv[i-1]
-        
-        return obv
+        # +1 / -1 / 0 per bar; comparisons keep NaN closes at 0 like the old loop
+        delta = np.diff(_as_f64(close), prepend=close[0])
+        direction = (delta > 0).astype(np.float64) - (delta < 0)
+        direction[0] = 1.0
+
+        return np.cumsum(direction * volume)
     
     def calculate_mfi(self, high: np.ndarray, low: np.ndarray,
                       close: np.ndarray, volume: np.ndarray,
-                      period: int = 14) -> np.ndarray:
+                      period: int = 14, tp: np.ndarray = None) -> np.ndarray:
         """Calculate Money Flow Index"""
         if len(close) < period + 1:
             return np.full(len(close), 50.0)
         
         # Typical price
-        tp = (high + low + close) / 3
+        if tp is None:
+            tp = (high + low + close) / 3
         
         # Raw money flow
         mf = tp * volume
         
         # Positive and negative money flow
-        pos_mf = np.zeros(len(close))
-        neg_mf = np.zeros(len(close))
-        
-        for i in range(1, len(close)):
-            if tp[i] > tp[i-1]:
-                pos_mf[i] = mf[i]
-            elif tp[i] < tp[i-1]:
-                neg_mf[i] = mf[i]
-        
+        dtp = np.diff(tp, prepend=tp[0])
+        pos_mf = np.where(dtp > 0, mf, 0.0)
+        neg_mf = np.where(dtp < 0, mf, 0.0)
+
+        # Window sums; summed directly so an all-zero window stays exactly 0
+        pos_sum = sliding_window_view(pos_mf, period).sum(axis=1)[1:]
+        neg_sum = sliding_window_view(neg_mf, period).sum(axis=1)[1:]
+
         # Calculate MFI
-        mfi = np.zeros(len(close))
-        mfi[:period] = np.nan
-        
-        for i in range(period, len(close)):
-            pos_sum = np.sum(pos_mf[i-period+1:i+1])
-            neg_sum = np.sum(neg_mf[i-period+1:i+1])
-            
-            if neg_sum == 0:
-                mfi[i] = 100.0
-            else:
-                mfr = pos_sum / neg_sum
-                mfi[i] = 100 - (100 / (1 + mfr))
-        
+        mfi = np.full(len(close), np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mfi[period:] = np.where(neg_sum == 0, 100.0,
+                                    100 - (100 / (1 + pos_sum / neg_sum)))
+
         return mfi
     
     def calculate_vwap(self, high: np.ndarray, low: np.ndarray,
-                       close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+                       close: np.ndarray, volume: np.ndarray,
+                       tp: np.ndarray = None) -> np.ndarray:
         """Calculate Volume Weighted Average Price"""
-        # Typical price
-        tp = (high + low + close) / 3
-        
-        # Cumulative values
-        cum_tp_vol = np.cumsum(tp * volume)
-        cum_vol = np.cumsum(volume)
-        
-        # VWAP
-        vwap = np.where(cum_vol != 0, cum_tp_vol / cum_vol, 0)
+        # Typical price * volume, built and accumulated in one float64 buffer
+        vwap = np.empty(len(close))
+        if tp is None:
+            np.add(high, low, out=vwap)
+            vwap += close
+            vwap /= 3
+        else:
+            vwap[:] = tp
+        vwap *= volume
+        np.cumsum(vwap, out=vwap)
+        cum_vol = np.cumsum(volume, dtype=np.float64)
+        
+        # VWAP; zero cumulative volume maps to 0
+        no_volume = cum_vol == 0
+        np.divide(vwap, cum_vol, out=vwap, where=~no_volume)
+        vwap[no_volume] = 0.0
         
         return vwap
     
@@ -573,27 +905,14 @@ class ForexIndicators:
         kijun = self.config.ichimoku_kijun
         senkou_b = self.config.ichimoku_senkou_b
         
-        # Tenkan-sen (Conversion Line)
-        tenkan_sen = np.zeros(len(close))
-        for i in range(tenkan-1, len(close)):
-            tenkan_sen[i] = (np.max(high[i-tenkan+1:i+1]) + np.min(low[i-tenkan+1:i+1])) / 2
-        tenkan_sen[:tenkan-1] = np.nan
-        
-        # Kijun-sen (Base Line)
-        kijun_sen = np.zeros(len(close))
-        for i in range(kijun-1, len(close)):
-            kijun_sen[i] = (np.max(high[i-kijun+1:i+1]) + np.min(low[i-kijun+1:i+1])) / 2
-        kijun_sen[:kijun-1] = np.nan
-        
+        # Tenkan-sen (Conversion Line), Kijun-sen (Base Line) and Senkou Span B
+        # (Leading Span B) midpoints share one rolling pass
+        tenkan_sen, kijun_sen, senkou_span_b = _rolling_midpoints(
+            _as_f64(high), _as_f64(low), np.array([tenkan, kijun, senkou_b], dtype=np.int64))
+
         # Senkou Span A (Leading Span A) - displaced forward by kijun periods
         senkou_span_a = (tenkan_sen + kijun_sen) / 2
-        
-        # Senkou Span B (Leading Span B) - displaced forward by kijun periods
-        senkou_span_b = np.zeros(len(close))
-        for i in range(senkou_b-1, len(close)):
-            senkou_span_b[i] = (np.max(high[i-senkou_b+1:i+1]) + np.min(low[i-senkou_b+1:i+1])) / 2
-        senkou_span_b[:senkou_b-1] = np.nan
-        
+
         # Chikou Span (Lagging Span) - displaced back by kijun periods
         chikou_span = np.zeros(len(close))
         chikou_span[:-kijun] = close[kijun:]
@@ -613,52 +932,22 @@ class ForexIndicators:
     
     def calculate_supertrend(self, high: np.ndarray, low: np.ndarray,
                              close: np.ndarray, period: int = 10,
-                             multiplier: float = 3.0) -> Tuple[np.ndarray, np.ndarray]:
+                             multiplier: float = 3.0,
+                             atr: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray]:
         """
         Calculate SuperTrend indicator
         Returns: (supertrend, trend_direction)
         """
-        atr = self.calculate_atr(high, low, close, period)
+        if atr is None:
+            atr = self.calculate_atr(high, low, close, period)
         hl2 = (high + low) / 2
         
         # Basic bands
         upper_band = hl2 + (multiplier * atr)
         lower_band = hl2 - (multiplier * atr)
         
-        supertrend = np.zeros(len(close))
-        direction = np.zeros(len(close))  # 1 = uptrend, -1 = downtrend
-        
-        supertrend[0] = upper_band[0]
-        direction[0] = 1
-        
-        for i in range(1, len(close)):
-            # Calculate final bands
-            if upper_band[i] < supertrend[i-1] or close[i-1] > supertrend[i-1]:
-                upper_band[i] = upper_band[i]
-            else:
-                upper_band[i] = supertrend[i-1]
-            
-            if lower_band[i] > supertrend[i-1] or close[i-1] < supertrend[i-1]:
-                lower_band[i] = lower_band[i]
-            else:
-                lower_band[i] = supertrend[i-1]
-            
-            # Determine trend
-            if direction[i-1] == 1:  # Was in uptrend
-                if close[i] < lower_band[i]:
-                    direction[i] = -1
-                    supertrend[i] = upper_band[i]
-                else:
-                    direction[i] = 1
-                    supertrend[i] = lower_band[i]
-            else:  # Was in downtrend
-                if close[i] > upper_band[i]:
-                    direction[i] = 1
-                    supertrend[i] = lower_band[i]
-                else:
-                    direction[i] = -1
-                    supertrend[i] = upper_band[i]
-        
+        supertrend, direction = _supertrend_loop(_as_f64(close), upper_band, lower_band)
+
         return supertrend, direction
     
     def calculate_pivot_points(self, high: float, low: float,
@@ -706,22 +995,48 @@ class ForexIndicators:
     
     def calculate_all_indicators(self, high: np.ndarray, low: np.ndarray,
                                  close: np.ndarray, 
-                                 volume: np.ndarray = None) -> Dict[str, Any]:
+                                 volume: np.ndarray = None,
+                                 return_dataframe: bool = False
+                                 ) -> Union[Dict[str, Any], pd.DataFrame]:
         """
         Calculate all indicators at once for efficiency
-        Returns dictionary with all indicator values
+        Returns dictionary with all indicator values, or a DataFrame with one
+        column per indicator (sharing the result buffers) if return_dataframe
         """
+        results = self._calculate_all_indicators(high, low, close, volume, {})
+        if return_dataframe:
+            return pd.DataFrame(results, copy=False)
+        return results
+    
+    def _calculate_all_indicators(self, high: np.ndarray, low: np.ndarray,
+                                  close: np.ndarray, volume: Optional[np.ndarray],
+                                  precomputed: Dict[str, np.ndarray]) -> Dict[str, Any]:
+        """calculate_all_indicators, reusing any ema_*/rsi/atr/atr_10 rows in ``precomputed``"""
         results = {}
-        
-        # Trend indicators
-        for period in self.config.sma_periods:
-            results[f'sma_{period}'] = self.calculate_sma(close, period)
-        
+        dtype = self.config.dtype
+        high, low, close = (np.ascontiguousarray(a, dtype=dtype) for a in (high, low, close))
+        if volume is not None:
+            volume = np.ascontiguousarray(volume, dtype=dtype)
+
+        # Trend indicators; every moving average reads one shared float64 close
+        close_f64 = _as_f64(close)
+        if TALIB_AVAILABLE:
+            for period in self.config.sma_periods:
+                results[f'sma_{period}'] = talib.SMA(close_f64, timeperiod=period)
+        else:
+            for period in self.config.sma_periods:
+                results[f'sma_{period}'] = _rolling(close_f64, period, 'mean')
+
+        # ewm(adjust=False) seeds from the first bar rather than the SMA, so
+        # the EMAs stay on calculate_ema
         for period in self.config.ema_periods:
-            results[f'ema_{period}'] = self.calculate_ema(close, period)
+            key = f'ema_{period}'
+            results[key] = (precomputed[key] if key in precomputed
+                            else self.calculate_ema(close_f64, period))
         
         # Momentum indicators
-        results['rsi'] = self.calculate_rsi(close)
+        results['rsi'] = (precomputed['rsi'] if 'rsi' in precomputed
+                          else self.calculate_rsi(close))
         macd, signal, hist = self.calculate_macd(close)
         results['macd'] = macd
         results['macd_signal'] = signal
@@ -731,8 +1046,18 @@ class ForexIndicators:
         results['stoch_k'] = stoch_k
         results['stoch_d'] = stoch_d
         
+        # Shared intermediates: typical price, True Range and the two ATR
+        # lengths used below (Keltner and SuperTrend default to 10 bars)
+        tp = (high + low + close) / 3
+        if 'atr' in precomputed:
+            atr, atr_10 = precomputed['atr'], precomputed['atr_10']
+        else:
+            tr = self.calculate_true_range(high, low, close)
+            atr = self.calculate_atr(high, low, close, tr=tr)
+            atr_10 = self.calculate_atr(high, low, close, 10, tr=tr)
+        
         results['williams_r'] = self.calculate_williams_r(high, low, close)
-        results['cci'] = self.calculate_cci(high, low, close)
+        results['cci'] = self.calculate_cci(high, low, close, tp=tp)
         results['momentum'] = self.calculate_momentum(close)
         results['roc'] = self.calculate_roc(close)
         
@@ -742,15 +1067,17 @@ class ForexIndicators:
         results['bb_middle'] = bb_middle
         results['bb_lower'] = bb_lower
         
-        results['atr'] = self.calculate_atr(high, low, close)
+        results['atr'] = atr
         
-        kc_upper, kc_middle, kc_lower = self.calculate_keltner_channels(high, low, close)
+        kc_upper, kc_middle, kc_lower = self.calculate_keltner_channels(high, low, close, atr=atr_10)
         results['kc_upper'] = kc_upper
         results['kc_middle'] = kc_middle
         results['kc_lower'] = kc_lower
         
         # Trend strength
-        adx, plus_di, minus_di = self.calculate_adx(high, low, close)
+        adx, plus_di, minus_di = self.calculate_adx(
+            high, low, close,
+            atr=atr if self.config.adx_period == self.config.atr_period else None)
         results['adx'] = adx
         results['plus_di'] = plus_di
         results['minus_di'] = minus_di
@@ -760,28 +1087,77 @@ class ForexIndicators:
         results.update({f'ichimoku_{k}': v for k, v in ichimoku.items()})
         
         # SuperTrend
-        supertrend, direction = self.calculate_supertrend(high, low, close)
+        supertrend, direction = self.calculate_supertrend(high, low, close, atr=atr_10)
         results['supertrend'] = supertrend
         results['supertrend_direction'] = direction
         
         # Volume indicators (if volume provided)
         if volume is not None:
             results['obv'] = self.calculate_obv(close, volume)
-            results['mfi'] = self.calculate_mfi(high, low, close, volume)
-            results['vwap'] = self.calculate_vwap(high, low, close, volume)
+            results['mfi'] = self.calculate_mfi(high, low, close, volume, tp=tp)
+            results['vwap'] = self.calculate_vwap(high, low, close, volume, tp=tp)
         
-        return results
+        return {key: np.asarray(value, dtype=dtype) for key, value in results.items()}
+    
+    def calculate_all_indicators_batch(self, high: np.ndarray, low: np.ndarray,
+                                       close: np.ndarray,
+                                       volume: np.ndarray = None) -> Dict[str, np.ndarray]:
+        """
+        Calculate all indicators for several symbols at once
+        Inputs are (n_symbols, n_bars) arrays; every result is stacked to the same shape
+        """
+        precomputed = [{} for _ in range(close.shape[0])]
+        if NUMBA_AVAILABLE:
+            # The EMA, RSI and ATR recurrences run across symbols in parallel
+            dtype = self.config.dtype
+            high_f64, low_f64, close_f64 = (_as_f64(np.asarray(a, dtype=dtype))
+                                            for a in (high, low, close))
+            ema_periods = self.config.ema_periods
+            core = _IndicatorCore(self.config.rsi_period,
+                                  np.array(ema_periods, dtype=np.int64),
+                                  np.array([self.config.atr_period, 10], dtype=np.int64))
+            n_symbols, n_bars = close_f64.shape
+            emas = np.empty((len(ema_periods), n_symbols, n_bars))
+            rsi = np.empty((n_symbols, n_bars))
+            atrs = np.empty((2, n_symbols, n_bars))
+            list(_batch_executor.map(
+                lambda s: _batch_row(core, high_f64, low_f64, close_f64, emas, rsi, atrs, s),
+                range(n_symbols)
+            ))
+            for i, rows in enumerate(precomputed):
+                rows.update({f'ema_{period}': emas[k, i] for k, period in enumerate(ema_periods)})
+                rows.update(rsi=rsi[i], atr=atrs[0, i], atr_10=atrs[1, i])
+        
+        per_symbol = [
+            self._calculate_all_indicators(
+                high[i], low[i], close[i], volume[i] if volume is not None else None,
+                precomputed[i]
+            )
+            for i in range(close.shape[0])
+        ]
+        return {key: np.stack([res[key] for res in per_symbol]) for key in per_symbol[0]}
     
-    def get_signal_strength(self, indicators: Dict[str, Any]) -> float:
+    def get_signal_strength(self, indicators: Union[Dict[str, Any], pd.DataFrame]) -> float:
         """
         Calculate overall signal strength from indicators
         Returns value between -1 (strong sell) and 1 (strong buy)
         """
+        # Latest value of each series this score reads, as plain floats
+        if isinstance(indicators, pd.DataFrame):
+            keys = [key for key in _SIGNAL_KEYS if key in indicators.columns]
+            row = indicators[keys].iloc[-1].tolist() if len(indicators) else [math.nan] * len(keys)
+            last = dict(zip(keys, row))
+        else:
+            last = {
+                key: float(indicators[key][-1]) if len(indicators[key]) else math.nan
+                for key in _SIGNAL_KEYS if key in indicators
+            }
+        
         signals = []
         
         # RSI signal
-        if 'rsi' in indicators:
-            rsi = indicators['rsi'][-1] if not np.isnan(indicators['rsi'][-1]) else 50
+        if 'rsi' in last:
+            rsi = last['rsi'] if not math.isnan(last['rsi']) else 50
             if rsi < self.config.rsi_oversold:
                 signals.append(1.0)  # Oversold = buy signal
             elif rsi > self.config.rsi_overbought:
@@ -790,13 +1166,13 @@ class ForexIndicators:
                 signals.append((50 - rsi) / 50)  # Neutral scaled
         
         # MACD signal
-        if 'macd_histogram' in indicators:
-            hist = indicators['macd_histogram'][-1] if not np.isnan(indicators['macd_histogram'][-1]) else 0
-            signals.append(np.clip(hist / 10, -1, 1))
+        if 'macd_histogram' in last:
+            hist = last['macd_histogram'] if not math.isnan(last['macd_histogram']) else 0
+            signals.append(min(max(hist / 10, -1), 1))
         
         # Stochastic signal
-        if 'stoch_k' in indicators and 'stoch_d' in indicators:
-            stoch_k = indicators['stoch_k'][-1] if not np.isnan(indicators['stoch_k'][-1]) else 50
+        if 'stoch_k' in last and 'stoch_d' in last:
+            stoch_k = last['stoch_k'] if not math.isnan(last['stoch_k']) else 50
             if stoch_k < 20:
                 signals.append(1.0)
             elif stoch_k > 80:
@@ -805,21 +1181,18 @@ class ForexIndicators:
                 signals.append((50 - stoch_k) / 50)
         
         # ADX trend strength
-        if 'adx' in indicators:
-            adx = indicators['adx'][-1] if not np.isnan(indicators['adx'][-1]) else 0
+        if 'adx' in last:
+            adx = last['adx'] if not math.isnan(last['adx']) else 0
             if adx > 25:  # Strong trend
-                if 'plus_di' in indicators and 'minus_di' in indicators:
-                    plus_di = indicators['plus_di'][-1]
-                    minus_di = indicators['minus_di'][-1]
-                    if plus_di > minus_di:
+                if 'plus_di' in last and 'minus_di' in last:
+                    if last['plus_di'] > last['minus_di']:
                         signals.append(0.5)  # Bullish trend
                     else:
                         signals.append(-0.5)  # Bearish trend
         
         # SuperTrend signal
-        if 'supertrend_direction' in indicators:
-            direction = indicators['supertrend_direction'][-1]
-            signals.append(direction * 0.5)
+        if 'supertrend_direction' in last:
+            signals.append(last['supertrend_direction'] * 0.5)
         
         # Calculate average signal
         if signals:
@@ -830,9 +1203,11 @@ class ForexIndicators:
 # Convenience function for quick indicator calculation
 def calculate_forex_indicators(high: np.ndarray, low: np.ndarray,
                                close: np.ndarray, volume: np.ndarray = None,
-                               config: IndicatorConfig = None) -> Dict[str, Any]:
+                               config: IndicatorConfig = None,
+                               return_dataframe: bool = False
+                               ) -> Union[Dict[str, Any], pd.DataFrame]:
     """
     Convenience function to calculate all forex indicators
     """
     calculator = ForexIndicators(config)
-    return calculator.calculate_all_indicators(high, low, close, volume)
+    return calculator.calculate_all_indicators(high, low, close, volume, return_dataframe)
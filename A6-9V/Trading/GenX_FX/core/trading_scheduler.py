@@ -5,14 +5,25 @@ Device: NUNA 💻 | User: @mouyleng 🧑‍💻 | Org: @A6-9V 🏙️
 """
 
 import asyncio
+import bisect
+import heapq
 import logging
-from datetime import datetime, timedelta, time
-from typing import Dict, List, Optional, Any, Callable
+import sys
+from functools import lru_cache
+from datetime import datetime, timedelta, time, timezone
+from typing import Dict, List, Mapping, Optional, Any, Callable, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
-import pytz
+from types import MappingProxyType
 from zoneinfo import ZoneInfo
 import json
+import numpy as np
+
+try:
+    from croniter import croniter
+    CRONITER_AVAILABLE = True
+except ImportError:
+    CRONITER_AVAILABLE = False
 
 
 class TradingSession(Enum):
@@ -25,6 +36,90 @@ class TradingSession(Enum):
     CRYPTO_CONTINUOUS = "crypto_continuous"
 
 
+_UTC = timezone.utc
+
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+# How often the session monitor logs active sessions (debug logging only)
+_MONITOR_INTERVAL = timedelta(minutes=5)
+# The Unix epoch fell on a Thursday, three days after Monday 00:00
+_EPOCH_MINUTE_OF_WEEK = 3 * MINUTES_PER_DAY
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=_UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_ns(dt: datetime) -> int:
+    """Exact nanoseconds since the Unix epoch for an aware datetime"""
+    return (dt - _EPOCH) // _MICROSECOND * 1000
+
+
+def _minute_of_week(dt: datetime) -> int:
+    """Minute index from Monday 00:00 in ``dt``'s own timezone"""
+    return dt.weekday() * MINUTES_PER_DAY + dt.hour * 60 + dt.minute
+
+
+def _forex_open_at(weekday: int, hour: int) -> bool:
+    """Forex closed from Friday 22:00 UTC to Sunday 22:00 UTC"""
+    if weekday == 5:  # Saturday
+        return False
+    elif weekday == 6:  # Sunday
+        return hour >= 22  # Opens at 22:00 UTC
+    elif weekday == 4:  # Friday
+        return hour < 22  # Closes at 22:00 UTC
+    return True
+
+
+# Forex open flag per UTC hour of the week, indexed by weekday * 24 + hour
+_FOREX_OPEN_HOURS = bytes(
+    _forex_open_at(weekday, hour) for weekday in range(7) for hour in range(24)
+)
+
+
+# Session overlap windows returned by get_session_overlap_info
+_OVERLAPS = MappingProxyType({
+    'sydney_tokyo': MappingProxyType({
+        'start': '00:00 UTC',
+        'end': '07:00 UTC',
+        'pairs': ('AUDJPY', 'NZDJPY', 'AUDUSD')
+    }),
+    'tokyo_london': MappingProxyType({
+        'start': '08:00 UTC',
+        'end': '09:00 UTC',
+        'pairs': ('EURJPY', 'GBPJPY')
+    }),
+    'london_new_york': MappingProxyType({
+        'start': '13:00 UTC',
+        'end': '17:00 UTC',
+        'pairs': ('EURUSD', 'GBPUSD', 'USDJPY'),
+        'note': 'Highest volatility period'
+    })
+})
+
+
+_INTERVAL_UNITS = {'m': 'minutes', 'h': 'hours', 'd': 'days'}
+_interval_cache: Dict[str, timedelta] = {}
+
+
+def _parse_interval(schedule: str) -> timedelta:
+    """Parse an interval schedule such as "30m", "1h" or "1d" (default 1 hour)"""
+    interval = _interval_cache.get(schedule)
+    if interval is None:
+        unit = _INTERVAL_UNITS.get(schedule[-1:])
+        if unit is not None and schedule[:-1].isdigit():
+            interval = timedelta(**{unit: int(schedule[:-1])})
+        else:
+            interval = timedelta(hours=1)
+        _interval_cache[schedule] = interval
+    return interval
+
+
+def _is_cron(schedule: str) -> bool:
+    """Whether a schedule is a cron expression rather than an interval"""
+    return ' ' in schedule.strip()
+
+
 class MarketType(Enum):
     """Market types"""
     FOREX = "forex"
@@ -33,7 +128,7 @@ class MarketType(Enum):
     INDICES = "indices"
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionConfig:
     """Configuration for a trading session"""
     name: str
@@ -44,15 +139,43 @@ class SessionConfig:
     strategies: List[str]
     is_high_volatility: bool = False
     active_days: List[int] = field(default_factory=lambda: [0, 1, 2, 3, 4])  # Mon-Fri
+    # One bit per minute of the week the session is active (see _minute_of_week)
+    _active_mask: bytearray = field(default=None, init=False, repr=False, compare=False)
+    _pair_set: frozenset = field(default=None, init=False, repr=False, compare=False)
+    _open_seconds: int = field(default=0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Interned so pair sets shared across sessions compare by identity
+        self.preferred_pairs = [sys.intern(pair) for pair in self.preferred_pairs]
+        self._pair_set = frozenset(self.preferred_pairs)
+        self._open_seconds = self.open_time.hour * 3600 + self.open_time.minute * 60
+        open_minute = self.open_time.hour * 60 + self.open_time.minute
+        close_minute = self.close_time.hour * 60 + self.close_time.minute
+        mask = bytearray(MINUTES_PER_WEEK // 8)
+        for day in self.active_days:
+            for minute in range(MINUTES_PER_DAY):
+                # Overnight sessions (e.g. Sydney) wrap past midnight
+                if open_minute > close_minute:
+                    active = minute >= open_minute or minute <= close_minute
+                else:
+                    active = open_minute <= minute <= close_minute
+                if active:
+                    index = day * MINUTES_PER_DAY + minute
+                    mask[index >> 3] |= 1 << (index & 7)
+        self._active_mask = mask
+    
+    def is_active_at(self, minute_of_week: int) -> bool:
+        """Whether the session is active in the given minute of the week"""
+        return bool(self._active_mask[minute_of_week >> 3] & (1 << (minute_of_week & 7)))
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduledTask:
     """Configuration for a scheduled task"""
     name: str
     schedule: str  # cron-like or interval
     callback: Callable
-    enabled: bool = True
+    enabled: bool = True  # toggle via TradingScheduler.enable_task/disable_task
     last_run: Optional[datetime] = None
     next_run: Optional[datetime] = None
 
@@ -73,25 +196,56 @@ class TradingScheduler:
         self.logger = logging.getLogger(__name__)
         
         # Session configurations
-        self.sessions: Dict[TradingSession, SessionConfig] = {}
+        self.sessions: Mapping[TradingSession, SessionConfig] = {}
         self._initialize_sessions()
+        # Sessions are fixed after init; hot paths iterate the frozen tuple
+        self.sessions = MappingProxyType(self.sessions)
+        self._session_items: Tuple[Tuple[TradingSession, SessionConfig], ...] = tuple(self.sessions.items())
+        self._session_info_static: Dict[TradingSession, Mapping[str, Any]] = {
+            session_type: self._build_session_info(session)
+            for session_type, session in self._session_items
+        }
         
-        # Scheduled tasks
+        # Scheduled tasks, plus a (deadline_ns, task_index) min-heap into
+        # scheduled_tasks; _task_batches holds callbacks currently running.
+        # _queued_tasks holds the indexes on the heap or running, so disabled
+        # tasks leave the heap and enable_task knows whether to re-queue
         self.scheduled_tasks: List[ScheduledTask] = []
+        self._task_heap: List[Tuple[int, int]] = []
+        self._task_batches: set = set()
+        self._queued_tasks: set = set()
         
         # Trading state
         self.is_running = False
         self.current_session: Optional[TradingSession] = None
         self.active_pairs: List[str] = []
+        self._last_active_sessions: Optional[frozenset] = None
+        self._crypto_pairs = ("BTCUSD", "XAUUSD", "BTCXAU")
         
         # Callback handlers
         self.on_session_change: Optional[Callable] = None
         self.on_market_open: Optional[Callable] = None
         self.on_market_close: Optional[Callable] = None
         self.on_high_impact_event: Optional[Callable] = None
+        # Session changes as (old_session, new_session, active_sessions),
+        # dispatched to the callbacks above by _callback_consumer; created in
+        # start() so each run binds to its own event loop
+        self._event_queue: Optional[asyncio.Queue] = None
         
         # Timezone for Singapore VPS
-        self.vps_timezone = pytz.timezone('Asia/Singapore')
+        self.vps_timezone = ZoneInfo('Asia/Singapore')
+        
+        # Upcoming session boundaries as (utc_time, seq, session, kind), where
+        # kind is 'open', 'close' or 'day' (UTC midnight, when active_days flip)
+        self._boundary_heap: List[Tuple[datetime, int, Optional[TradingSession], str]] = []
+        self._build_boundary_heap(datetime.now(_UTC))
+        
+        # Set to wake the scheduler loop early (new task, finished batch, stop);
+        # created in start() alongside _event_queue
+        self._wakeup_event: Optional[asyncio.Event] = None
+        
+        # Last get_active_sessions result, keyed by (weekday, hour, minute)
+        self._active_cache: Optional[Tuple[Tuple[int, int, int], List[TradingSession]]] = None
         
     def _initialize_sessions(self):
         """Initialize trading sessions"""
@@ -172,97 +326,215 @@ class TradingScheduler:
         self.is_running = True
         self.logger.info("Starting trading scheduler...")
         
-        # Start main scheduler loop
-        asyncio.create_task(self._scheduler_loop())
+        # Bound to the running loop, so a later asyncio.run() can start again
+        self._wakeup_event = asyncio.Event()
+        self._event_queue = asyncio.Queue(maxsize=64)
         
-        # Start session monitoring
-        asyncio.create_task(self._session_monitor_loop())
+        # Start main scheduler loop (sessions, monitoring and scheduled tasks)
+        asyncio.create_task(self._scheduler_loop())
         
-        # Start task executor
-        asyncio.create_task(self._task_executor_loop())
+        # Start session callback dispatch
+        asyncio.create_task(self._callback_consumer())
         
         self.logger.info("Trading scheduler started")
     
     async def stop(self):
         """Stop the trading scheduler"""
         self.is_running = False
+        self._wake()
+        if self._event_queue is not None:
+            self._enqueue_event(None)
         self.logger.info("Trading scheduler stopped")
     
+    def _wake(self):
+        """Wake the scheduler loop early, if it is running"""
+        if self._wakeup_event is not None:
+            self._wakeup_event.set()
+    
+    def _build_boundary_heap(self, now_utc: datetime):
+        """Seed the heap with the next open/close of every session and the next UTC midnight"""
+        times = [(time(0, 0), None, 'day')]
+        for session_type, session in self._session_items:
+            times.append((session.open_time, session_type, 'open'))
+            # Sessions include their whole close minute, so they end after it
+            close_after = (datetime.combine(now_utc.date(), session.close_time)
+                           + timedelta(minutes=1)).time()
+            times.append((close_after, session_type, 'close'))
+        
+        self._boundary_heap = []
+        for seq, (at, session_type, kind) in enumerate(times):
+            boundary = datetime.combine(now_utc.date(), at, tzinfo=_UTC)
+            if boundary <= now_utc:
+                boundary += timedelta(days=1)
+            self._boundary_heap.append((boundary, seq, session_type, kind))
+        heapq.heapify(self._boundary_heap)
+    
+    def _seconds_until_next_boundary(self, now_utc: datetime) -> float:
+        """Pop boundaries already passed (re-arming each a day later) and time the next one"""
+        heap = self._boundary_heap
+        while heap[0][0] <= now_utc:
+            boundary, seq, session_type, kind = heap[0]
+            days = (now_utc - boundary).days + 1
+            heapq.heapreplace(heap, (boundary + timedelta(days=days), seq, session_type, kind))
+        return (heap[0][0] - now_utc).total_seconds()
+    
     async def _scheduler_loop(self):
-        """Main scheduler loop"""
+        """
+        Main scheduler loop; sleeps until the next session boundary, scheduled
+        task or (with debug logging) session monitor tick
+        """
+        check_sessions = True
+        next_monitor = datetime.now(_UTC)
+        
         while self.is_running:
             try:
+                # Cleared first so wakeups requested while working aren't lost
+                self._wakeup_event.clear()
+                
                 # Get current time in UTC
-                now_utc = datetime.now(pytz.UTC)
+                now_utc = datetime.now(_UTC)
+                
+                if check_sessions:
+                    # Check for session changes
+                    await self._check_session_changes(now_utc)
+                    
+                    # Update active pairs based on current sessions
+                    await self._update_active_pairs(now_utc)
                 
-                # Check for session changes
-                await self._check_session_changes(now_utc)
+                # Monitor trading sessions (debug logging only)
+                monitoring = self.logger.isEnabledFor(logging.DEBUG)
+                if monitoring and now_utc >= next_monitor:
+                    active_sessions = self.get_active_sessions(now_utc)
+                    self.logger.debug("Active sessions: %s", [s.value for s in active_sessions])
+                    next_monitor = now_utc + _MONITOR_INTERVAL
                 
-                # Update active pairs based on current sessions
-                await self._update_active_pairs(now_utc)
+                # Start scheduled tasks that are due
+                self._start_due_tasks(now_utc)
                 
-                await asyncio.sleep(60)  # Check every minute
+                # Sleep until the earliest boundary, task or monitor tick
+                delay = self._seconds_until_next_boundary(now_utc)
+                if self._task_heap:
+                    delay = min(delay, (self._task_heap[0][0] - _to_ns(now_utc)) / 1e9)
+                if monitoring:
+                    delay = min(delay, (next_monitor - now_utc).total_seconds())
+                try:
+                    await asyncio.wait_for(self._wakeup_event.wait(), timeout=max(delay, 0))
+                except asyncio.TimeoutError:
+                    pass
+                
+                check_sessions = datetime.now(_UTC) >= self._boundary_heap[0][0]
                 
             except Exception as e:
                 self.logger.error(f"Error in scheduler loop: {e}")
+                check_sessions = True
                 await asyncio.sleep(60)
     
-    async def _session_monitor_loop(self):
-        """Monitor trading sessions"""
-        while self.is_running:
-            try:
-                now_utc = datetime.now(pytz.UTC)
-                active_sessions = self.get_active_sessions(now_utc)
-                
-                self.logger.debug(f"Active sessions: {[s.value for s in active_sessions]}")
-                
-                await asyncio.sleep(300)  # Check every 5 minutes
-                
-            except Exception as e:
-                self.logger.error(f"Error in session monitor: {e}")
-                await asyncio.sleep(300)
+    def _start_due_tasks(self, now: datetime):
+        """Pop due scheduled tasks and run them as one background batch"""
+        heap = self._task_heap
+        now_ns = _to_ns(now)
+        due = []
+        while heap and heap[0][0] <= now_ns:
+            _, index = heapq.heappop(heap)
+            if self._is_task_runnable(index, now, now_ns):
+                due.append(index)
+        
+        if due:
+            # Run off the loop so slow callbacks don't delay session checks
+            batch = asyncio.create_task(self._run_task_batch(due, now))
+            self._task_batches.add(batch)
+            batch.add_done_callback(self._task_batches.discard)
     
-    async def _task_executor_loop(self):
-        """Execute scheduled tasks"""
-        while self.is_running:
-            try:
-                now = datetime.now(pytz.UTC)
-                
-                for task in self.scheduled_tasks:
-                    if task.enabled and task.next_run and now >= task.next_run:
-                        try:
-                            await task.callback()
-                            task.last_run = now
-                            task.next_run = self._calculate_next_run(task)
-                            self.logger.info(f"Executed task: {task.name}")
-                        except Exception as e:
-                            self.logger.error(f"Error executing task {task.name}: {e}")
-                
-                await asyncio.sleep(1)
-                
-            except Exception as e:
-                self.logger.error(f"Error in task executor: {e}")
-                await asyncio.sleep(1)
+    async def _run_task_batch(self, due: List[int], now: datetime):
+        """Fire due tasks together so independent I/O overlaps, then re-queue them"""
+        results = await asyncio.gather(
+            *[self._invoke_task(index) for index in due],
+            return_exceptions=True
+        )
+        for index, result in zip(due, results):
+            self._finish_task(index, result, now)
+        
+        # Re-queued deadlines may be earlier than the loop's current sleep
+        self._wake()
+    
+    def _push_task(self, index: int, due: datetime):
+        """Queue scheduled_tasks[index] on the executor heap"""
+        self._queued_tasks.add(index)
+        heapq.heappush(self._task_heap, (_to_ns(due), index))
+    
+    def _requeue_task(self, index: int, due: datetime):
+        """Re-queue a task that just ran, unless it was disabled meanwhile"""
+        if self.scheduled_tasks[index].enabled:
+            self._push_task(index, due)
+        else:
+            self._queued_tasks.discard(index)
+    
+    def _is_task_runnable(self, index: int, now: datetime, now_ns: int) -> bool:
+        """Check a task popped from the heap, re-queueing it if it can't run now"""
+        task = self.scheduled_tasks[index]
+        if task.next_run is None or not task.enabled:
+            # Dropped from the heap; enable_task re-queues disabled tasks
+            self._queued_tasks.discard(index)
+            return False
+        if _to_ns(task.next_run) > now_ns:
+            # next_run was pushed back since the task was queued
+            self._push_task(index, task.next_run)
+            return False
+        return True
+    
+    async def _invoke_task(self, index: int):
+        """Await a task's callback (errors, even from calling it, go to gather)"""
+        return await self.scheduled_tasks[index].callback()
+    
+    def _finish_task(self, index: int, result: Any, now: datetime):
+        """Record a task's callback result and re-queue it"""
+        task = self.scheduled_tasks[index]
+        if isinstance(result, BaseException):
+            # Failed tasks are retried after a second
+            self.logger.error(f"Error executing task {task.name}: {result}")
+            self._requeue_task(index, now + timedelta(seconds=1))
+            return
+        
+        task.last_run = now
+        task.next_run = self._calculate_next_run(task)
+        self.logger.info(f"Executed task: {task.name}")
+        self._requeue_task(index, task.next_run)
     
     def get_active_sessions(self, dt: datetime = None) -> List[TradingSession]:
-        """Get currently active trading sessions"""
+        """Get currently active trading sessions (resolved to the minute)"""
         if dt is None:
-            dt = datetime.now(pytz.UTC)
-        
-        active = []
-        current_time = dt.time()
-        current_day = dt.weekday()
-        
-        for session_type, session in self.sessions.items():
-            # Check if trading day
-            if current_day not in session.active_days:
-                continue
-            
-            # Check session hours
-            if self._is_session_active(session, current_time):
-                active.append(session_type)
+            dt = datetime.now(_UTC)
+        
+        # Membership only depends on the weekday and minute of day
+        key = (dt.weekday(), dt.hour, dt.minute)
+        if self._active_cache is not None and self._active_cache[0] == key:
+            return list(self._active_cache[1])
+        
+        # One bit test per session against its minute-of-week mask
+        index = _minute_of_week(dt)
+        active = [
+            session_type for session_type, session in self._session_items
+            if session.is_active_at(index)
+        ]
         
-        return active
+        self._active_cache = (key, active)
+        return list(active)
+    
+    def get_active_sessions_batch(self, timestamps: np.ndarray) -> np.ndarray:
+        """
+        Session membership for many UTC timestamps at once
+        Returns an (N, len(self.sessions)) bool matrix, columns in self.sessions order
+        """
+        minutes = np.asarray(timestamps, dtype='datetime64[m]').astype(np.int64)
+        minute_of_week = (minutes + _EPOCH_MINUTE_OF_WEEK) % MINUTES_PER_WEEK
+        
+        # Unpack each session's bitmask to one bool per minute and gather
+        masks = np.stack([
+            np.unpackbits(np.frombuffer(session._active_mask, dtype=np.uint8),
+                          bitorder='little').view(bool)
+            for _, session in self._session_items
+        ], axis=1)
+        return masks[minute_of_week]
     
     def _is_session_active(self, session: SessionConfig, current_time: time) -> bool:
         """Check if a session is currently active"""
@@ -276,67 +548,98 @@ class TradingScheduler:
             return open_time <= current_time <= close_time
     
     async def _check_session_changes(self, now_utc: datetime):
-        """Check for session changes and trigger callbacks"""
+        """Check for session changes and queue their callbacks"""
         active_sessions = self.get_active_sessions(now_utc)
         
         if active_sessions and self.current_session not in active_sessions:
             # Session changed
             new_session = active_sessions[0]  # Primary session
             
-            if self.current_session is not None:
-                # Trigger session close callback
-                if self.on_market_close:
-                    await self.on_market_close(self.current_session)
-            
+            # Callbacks run in _callback_consumer so slow handlers don't
+            # hold up the scheduler loop
+            self._enqueue_event((self.current_session, new_session, active_sessions))
             self.current_session = new_session
             
-            # Trigger session open callback
-            if self.on_market_open:
-                await self.on_market_open(new_session)
-            
-            # Trigger session change callback
-            if self.on_session_change:
-                await self.on_session_change(new_session, active_sessions)
-            
             self.logger.info(f"Session changed to: {new_session.value}")
     
+    def _enqueue_event(self, event: Optional[Tuple]):
+        """Queue a session event, dropping the oldest one if the queue is full"""
+        if self._event_queue.full():
+            dropped = self._event_queue.get_nowait()
+            self.logger.warning(f"Session event queue full, dropped: {dropped}")
+        self._event_queue.put_nowait(event)
+    
+    async def _callback_consumer(self):
+        """Dispatch queued session changes to the callback handlers"""
+        while True:
+            event = await self._event_queue.get()
+            if event is None:
+                break
+            
+            old_session, new_session, active_sessions = event
+            try:
+                # Trigger session close callback
+                if old_session is not None and self.on_market_close:
+                    await self.on_market_close(old_session)
+                
+                # Trigger session open callback
+                if self.on_market_open:
+                    await self.on_market_open(new_session)
+                
+                # Trigger session change callback
+                if self.on_session_change:
+                    await self.on_session_change(new_session, active_sessions)
+                
+            except Exception as e:
+                self.logger.error(f"Error in session callback: {e}")
+    
     async def _update_active_pairs(self, now_utc: datetime):
         """Update list of active trading pairs"""
-        active_sessions = self.get_active_sessions(now_utc)
+        active_sessions = frozenset(self.get_active_sessions(now_utc))
+        if active_sessions == self._last_active_sessions:
+            return
         
         # Always include crypto pairs (24/7)
-        new_active_pairs = set(["BTCUSD", "XAUUSD", "BTCXAU"])
+        new_active_pairs = set(self._crypto_pairs)
         
         # Add pairs from active sessions
         for session_type in active_sessions:
-            session = self.sessions[session_type]
-            new_active_pairs.update(session.preferred_pairs)
+            new_active_pairs.update(self.sessions[session_type]._pair_set)
         
         self.active_pairs = list(new_active_pairs)
+        self._last_active_sessions = active_sessions
     
-    def get_session_info(self, session_type: TradingSession) -> Dict[str, Any]:
+    def get_session_info(self, session_type: TradingSession,
+                         active_sessions: Optional[set] = None) -> Dict[str, Any]:
         """Get information about a trading session"""
-        session = self.sessions.get(session_type)
-        if not session:
+        static_info = self._session_info_static.get(session_type)
+        if not static_info:
             return {}
         
-        now_utc = datetime.now(pytz.UTC)
-        is_active = session_type in self.get_active_sessions(now_utc)
+        if active_sessions is None:
+            active_sessions = self.get_active_sessions(datetime.now(_UTC))
         
-        return {
+        info = dict(static_info)
+        info['is_active'] = session_type in active_sessions
+        return info
+    
+    @staticmethod
+    def _build_session_info(session: SessionConfig) -> Mapping[str, Any]:
+        """Session info fields that never change (sessions are frozen after init)"""
+        return MappingProxyType({
             'name': session.name,
-            'is_active': is_active,
+            'is_active': False,
             'open_time': session.open_time.isoformat(),
             'close_time': session.close_time.isoformat(),
             'timezone': session.timezone,
-            'preferred_pairs': session.preferred_pairs,
-            'strategies': session.strategies,
+            'preferred_pairs': tuple(session.preferred_pairs),
+            'strategies': tuple(session.strategies),
             'is_high_volatility': session.is_high_volatility
-        }
+        })
     
     def get_all_sessions_status(self) -> Dict[str, Any]:
         """Get status of all trading sessions"""
-        now_utc = datetime.now(pytz.UTC)
+        now_utc = datetime.now(_UTC)
         active_sessions = self.get_active_sessions(now_utc)
         
         status = {
@@ -346,34 +649,33 @@ class TradingScheduler:
             'sessions': {}
         }
         
+        active_set = set(active_sessions)
         for session_type in TradingSession:
-            status['sessions'][session_type.value] = self.get_session_info(session_type)
+            status['sessions'][session_type.value] = self.get_session_info(session_type, active_set)
         
         return status
     
     def get_best_pairs_now(self) -> List[str]:
-        """Get the best trading pairs for current time with optimized set-based lookups"""
-        now_utc = datetime.now(pytz.UTC)
+        """Get the best trading pairs for current time, high volatility sessions first"""
+        now_utc = datetime.now(_UTC)
         active_sessions = self.get_active_sessions(now_utc)
         
-        # Use set for O(1) membership checks instead of O(n) list checks
-        best_pairs_set = set()
+        # Insertion-ordered dict dedupes pairs while keeping priority order
+        best_pairs: Dict[str, None] = {}
+        sessions = [self.sessions[session_type] for session_type in active_sessions]
         
-        # Priority: High volatility sessions first
-        for session_type in active_sessions:
-            session = self.sessions[session_type]
+        # Priority: High volatility sessions first, then regular sessions
+        for session in sessions:
             if session.is_high_volatility:
-                best_pairs_set.update(session.preferred_pairs)
-        
-        # Add regular session pairs
-        for session_type in active_sessions:
-            session = self.sessions[session_type]
-            best_pairs_set.update(session.preferred_pairs)
+                best_pairs.update(dict.fromkeys(session.preferred_pairs))
+        for session in sessions:
+            if not session.is_high_volatility:
+                best_pairs.update(dict.fromkeys(session.preferred_pairs))
         
         # Always include crypto pairs
-        best_pairs_set.update(["BTCUSD", "XAUUSD", "BTCXAU"])
+        best_pairs.update(dict.fromkeys(self._crypto_pairs))
         
-        return list(best_pairs_set)
+        return list(best_pairs)
     
     def get_strategies_for_session(self, session_type: TradingSession) -> List[str]:
         """Get recommended strategies for a session"""
@@ -393,44 +695,64 @@ class TradingScheduler:
             next_run=self._calculate_next_run_from_schedule(schedule)
         )
         self.scheduled_tasks.append(task)
+        if enabled:
+            self._push_task(len(self.scheduled_tasks) - 1, task.next_run)
+            self._wake()
         self.logger.info(f"Added scheduled task: {name}")
     
+    def enable_task(self, name: str) -> bool:
+        """Enable scheduled tasks by name; a task that came due while disabled runs right away"""
+        found = False
+        for index, task in enumerate(self.scheduled_tasks):
+            if task.name != name:
+                continue
+            found = True
+            task.enabled = True
+            if index not in self._queued_tasks and task.next_run is not None:
+                self._push_task(index, task.next_run)
+                self._wake()
+        return found
+    
+    def disable_task(self, name: str) -> bool:
+        """Disable scheduled tasks by name (dropped from the heap when next due)"""
+        found = False
+        for task in self.scheduled_tasks:
+            if task.name == name:
+                task.enabled = False
+                found = True
+        return found
+    
     def _calculate_next_run(self, task: ScheduledTask) -> datetime:
-        """Calculate next run time for a task"""
-        return self._calculate_next_run_from_schedule(task.schedule)
+        """Calculate next run time for a task, anchored to its last due time"""
+        if task.next_run is None or _is_cron(task.schedule):
+            return self._calculate_next_run_from_schedule(task.schedule)
+        
+        # Step from the previous due time so callback runtime doesn't drift
+        # the schedule; skip any intervals missed while the task was late
+        now = datetime.now(_UTC)
+        interval = _parse_interval(task.schedule)
+        next_run = task.next_run + interval
+        if next_run <= now:
+            next_run += interval * ((now - next_run) // interval + 1)
+        return next_run
     
     def _calculate_next_run_from_schedule(self, schedule: str) -> datetime:
         """Calculate next run time from schedule string"""
-        now = datetime.now(pytz.UTC)
-        
-        # Simple interval parsing (e.g., "1h", "30m", "1d")
-        if schedule.endswith('h'):
-            hours = int(schedule[:-1])
-            return now + timedelta(hours=hours)
-        elif schedule.endswith('m'):
-            minutes = int(schedule[:-1])
-            return now + timedelta(minutes=minutes)
-        elif schedule.endswith('d'):
-            days = int(schedule[:-1])
-            return now + timedelta(days=days)
-        
-        # Default to 1 hour
-        return now + timedelta(hours=1)
+        now = datetime.now(_UTC)
+        
+        # Cron expressions (e.g., "0 */4 * * *")
+        if _is_cron(schedule):
+            if CRONITER_AVAILABLE:
+                return croniter(schedule, now).get_next(datetime)
+            self.logger.warning(f"croniter not installed, running '{schedule}' hourly")
+        
+        # Simple intervals (e.g., "1h", "30m", "1d")
+        return now + _parse_interval(schedule)
     
     def is_forex_market_open(self) -> bool:
         """Check if forex market is open"""
-        now_utc = datetime.now(pytz.UTC)
-        weekday = now_utc.weekday()
-        
-        # Forex closed from Friday 22:00 UTC to Sunday 22:00 UTC
-        if weekday == 5:  # Saturday
-            return False
-        elif weekday == 6:  # Sunday
-            return now_utc.hour >= 22  # Opens at 22:00 UTC
-        elif weekday == 4:  # Friday
-            return now_utc.hour < 22  # Closes at 22:00 UTC
-        
-        return True
+        now_utc = datetime.now(_UTC)
+        return bool(_FOREX_OPEN_HOURS[now_utc.weekday() * 24 + now_utc.hour])
     
     def is_crypto_market_open(self) -> bool:
         """Crypto market is always open"""
@@ -442,40 +764,19 @@ class TradingScheduler:
         if not session:
             return timedelta(0)
         
-        now_utc = datetime.now(pytz.UTC)
-        
-        # Calculate next session open
-        today_open = datetime.combine(now_utc.date(), session.open_time)
-        today_open = pytz.UTC.localize(today_open)
+        now_utc = datetime.now(_UTC)
         
-        if now_utc < today_open:
-            return today_open - now_utc
-        else:
-            # Next day
-            tomorrow_open = today_open + timedelta(days=1)
-            return tomorrow_open - now_utc
+        # Seconds from now to the session open, rolling to the next day once passed
+        now_s = now_utc.hour * 3600 + now_utc.minute * 60 + now_utc.second
+        delta = session._open_seconds - now_s
+        if delta <= 0:
+            delta += 86400
+        return timedelta(seconds=delta, microseconds=-now_utc.microsecond)
     
     def get_session_overlap_info(self) -> Dict[str, Any]:
         """Get information about session overlaps"""
-        overlaps = {
-            'sydney_tokyo': {
-                'start': '00:00 UTC',
-                'end': '07:00 UTC',
-                'pairs': ['AUDJPY', 'NZDJPY', 'AUDUSD']
-            },
-            'tokyo_london': {
-                'start': '08:00 UTC',
-                'end': '09:00 UTC',
-                'pairs': ['EURJPY', 'GBPJPY']
-            },
-            'london_new_york': {
-                'start': '13:00 UTC',
-                'end': '17:00 UTC',
-                'pairs': ['EURUSD', 'GBPUSD', 'USDJPY'],
-                'note': 'Highest volatility period'
-            }
-        }
-        return overlaps
+        # Plain dicts and lists so callers can serialize or modify the result
+        return {name: dict(overlap, pairs=list(overlap['pairs'])) for name, overlap in _OVERLAPS.items()}
 
 
 class TradingCalendar:
@@ -486,6 +787,8 @@ class TradingCalendar:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.high_impact_events: List[Dict[str, Any]] = []
+        # (epoch_seconds, currency) sorted by event time for bisect lookups
+        self._events_sorted: List[Tuple[float, str]] = []
     
     def add_event(self, event_time: datetime, event_name: str,
                   currency: str, impact: str, expected: str = None):
@@ -497,10 +800,11 @@ class TradingCalendar:
             'impact': impact,
             'expected': expected
         })
+        bisect.insort(self._events_sorted, (event_time.timestamp(), currency))
     
     def get_upcoming_events(self, hours_ahead: int = 24) -> List[Dict[str, Any]]:
         """Get upcoming high-impact events"""
-        now_utc = datetime.now(pytz.UTC)
+        now_utc = datetime.now(_UTC)
         cutoff = now_utc + timedelta(hours=hours_ahead)
         
         return [
@@ -512,22 +816,29 @@ class TradingCalendar:
                              minutes_before: int = 15,
                              minutes_after: int = 5) -> bool:
         """Check if trading should be paused for upcoming events"""
-        now_utc = datetime.now(pytz.UTC)
+        now_ts = datetime.now(_UTC).timestamp()
         
-        for event in self.high_impact_events:
-            event_time = event['time']
-            pause_start = event_time - timedelta(minutes=minutes_before)
-            pause_end = event_time + timedelta(minutes=minutes_after)
-            
-            if pause_start <= now_utc <= pause_end:
-                # Check if event affects this pair
-                currency = event['currency']
-                if currency in pair:
-                    return True
+        # Events pausing now fall within [now - after, now + before]
+        events = self._events_sorted
+        end_ts = now_ts + minutes_before * 60
+        i = bisect.bisect_left(events, (now_ts - minutes_after * 60,))
+        currencies = _pair_currencies(pair)
+        
+        while i < len(events) and events[i][0] <= end_ts:
+            # Check if event affects this pair
+            if events[i][1] in currencies:
+                return True
+            i += 1
         
         return False
 
 
+@lru_cache(maxsize=None)
+def _pair_currencies(pair: str) -> frozenset:
+    """Base and quote currency codes of a six-letter pair"""
+    return frozenset((pair[:3], pair[3:6]))
+
+
 # Global scheduler instance
 trading_scheduler = TradingScheduler()
 trading_calendar = TradingCalendar()
@@ -535,6 +846,12 @@ trading_calendar = TradingCalendar()
 
 async def initialize_scheduler():
     """Initialize and start the trading scheduler"""
+    # Run callbacks that finish without suspending inline (Python 3.12+)
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    loop = asyncio.get_running_loop()
+    if eager_task_factory is not None and loop.get_task_factory() is None:
+        loop.set_task_factory(eager_task_factory)
+    
     await trading_scheduler.start()
     
     # Add default scheduled tasks
@@ -10,6 +10,7 @@ import sys
 from typing import Dict, Any
 from datetime import datetime
 
+from core import install_fast_loop
 from core.autonomous_agent import AutonomousAgent, AgentConfig
 from core.self_manager import SelfManager, SelfManagerConfig
 from core.decision_engine import DecisionEngine, DecisionEngineConfig
@@ -361,4 +362,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Swap in uvloop/uringcore before the loop is created
+    install_fast_loop()
     asyncio.run(main())
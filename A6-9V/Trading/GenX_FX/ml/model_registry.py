@@ -4,24 +4,241 @@ Handles model storage, versioning, and deployment
 """
 
 import asyncio
+import heapq
 import logging
 import json
 import hashlib
+import importlib
+import mmap
+import pickle
+import shutil
+import threading
+import time
 from typing import Dict, List, Optional, Any, Tuple
+from collections import defaultdict, deque
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from enum import Enum
+from concurrent.futures import ThreadPoolExecutor
 import os
 from pathlib import Path
 import joblib
 import numpy as np
 import pandas as pd
-from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
+from sklearn.metrics import precision_recall_fscore_support
 from sklearn.model_selection import cross_val_score
 
+try:
+    from safetensors.numpy import save_file as save_safetensors, load_file as load_safetensors
+    SAFETENSORS_AVAILABLE = True
+except ImportError:
+    SAFETENSORS_AVAILABLE = False
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
 # Import statements moved to avoid circular imports
 
 
+def _write_json(data: Dict[str, Any], path: Path) -> None:
+    """Write a dict as indented JSON"""
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+
+
+def _write_bytes(data: bytes, path: Path) -> None:
+    """Write bytes to a file"""
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def _dump_uncompressed(obj: Any, path: Path) -> None:
+    """
+    joblib.dump without compression so numpy arrays can be memory-mapped on load;
+    written to a temp file and renamed so models still mapping the old file keep it
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    joblib.dump(obj, tmp_path, compress=0, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def _prefetch_file(path: Path) -> None:
+    """Fault a whole file into the page cache (MAP_POPULATE, Linux only)"""
+    populate = getattr(mmap, 'MAP_POPULATE', None)
+    if populate is None:
+        return
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        mm = mmap.mmap(f.fileno(), 0, flags=mmap.MAP_SHARED | populate, prot=mmap.PROT_READ)
+        mm.close()
+
+
+# Content-addressed model pickles live in <storage>/blobs/<sha256>/model.pkl;
+# each model directory's model.pkl is a hardlink to its blob and records the
+# digest in model.sha256. A blob whose link count drops to 1 is unreferenced.
+# Blob creation, linking and release run under the registry's blob lock so a
+# release can't delete a blob another model is about to link to.
+_BLOBS_DIR = "blobs"
+_HASH_FILE = "model.sha256"
+
+
+def _file_sha256(path: Path) -> str:
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _release_blob(blobs_path: Path, digest: Optional[str]) -> None:
+    """Delete a blob once no model directory links to it"""
+    if not digest:
+        return
+    blob = blobs_path / digest / "model.pkl"
+    try:
+        unreferenced = blob.stat().st_nlink <= 1
+    except FileNotFoundError:
+        return
+    if unreferenced:
+        shutil.rmtree(blob.parent, ignore_errors=True)
+
+
+def _read_digest(model_path: Path) -> Optional[str]:
+    """Blob digest recorded in a model directory, if any"""
+    hash_file = model_path / _HASH_FILE
+    return hash_file.read_text().strip() if hash_file.exists() else None
+
+
+def _dump_deduplicated(obj: Any, model_path: Path, blobs_path: Path, lock: threading.Lock) -> None:
+    """
+    Dump obj to model_path/model.pkl, storing identical pickles only once as a
+    blob and hardlinking to it (copied where hardlinks aren't supported)
+    """
+    blobs_path.mkdir(exist_ok=True)
+    
+    # Dump next to the blobs (same filesystem) and hash to find the blob
+    tmp_blob = blobs_path / f"{model_path.name}.tmp"
+    joblib.dump(obj, tmp_blob, compress=0, protocol=pickle.HIGHEST_PROTOCOL)
+    digest = _file_sha256(tmp_blob)
+    blob = blobs_path / digest / "model.pkl"
+    
+    with lock:
+        previous = _read_digest(model_path)
+        if blob.exists():
+            tmp_blob.unlink()
+        else:
+            blob.parent.mkdir(exist_ok=True)
+            os.replace(tmp_blob, blob)
+        
+        # Swap the link in atomically so models mapping the old file keep it
+        model_file = model_path / "model.pkl"
+        tmp_link = model_path / "model.pkl.tmp"
+        tmp_link.unlink(missing_ok=True)
+        try:
+            os.link(blob, tmp_link)
+        except OSError:
+            shutil.copyfile(blob, tmp_link)
+        os.replace(tmp_link, model_file)
+        (model_path / _HASH_FILE).write_text(digest)
+        
+        if previous != digest:
+            _release_blob(blobs_path, previous)
+
+
+def _remove_model_pkl(model_path: Path, blobs_path: Path, lock: threading.Lock) -> None:
+    """Unlink a model directory's model.pkl and release its blob"""
+    with lock:
+        digest = _read_digest(model_path)
+        (model_path / "model.pkl").unlink(missing_ok=True)
+        (model_path / _HASH_FILE).unlink(missing_ok=True)
+        _release_blob(blobs_path, digest)
+
+
+# Only estimators from these packages are rebuilt from structure.json
+_SAFETENSORS_MODULES = ("sklearn.",)
+_WEIGHTS_FILE = "weights.safetensors"
+_STRUCTURE_FILE = "structure.json"
+
+
+def _to_json_value(value: Any) -> Any:
+    """Convert a plain attribute value to JSON, raising TypeError if it isn't plain"""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray) and value.dtype.kind in "US":
+        return {'__ndarray__': value.tolist(), 'dtype': value.dtype.str}
+    if isinstance(value, (list, tuple)):
+        return [_to_json_value(v) for v in value]
+    if isinstance(value, dict) and all(isinstance(k, str) for k in value):
+        return {k: _to_json_value(v) for k, v in value.items()}
+    raise TypeError(f"Cannot store {type(value).__name__} as JSON")
+
+
+def _from_json_value(value: Any) -> Any:
+    """Inverse of _to_json_value"""
+    if isinstance(value, list):
+        return [_from_json_value(v) for v in value]
+    if isinstance(value, dict):
+        if '__ndarray__' in value:
+            return np.array(value['__ndarray__'], dtype=value['dtype'])
+        return {k: _from_json_value(v) for k, v in value.items()}
+    return value
+
+
+def _save_model_safetensors(model: Any, model_path: Path) -> bool:
+    """
+    Store an sklearn estimator's numeric arrays as safetensors and everything else
+    as JSON; returns False (writing nothing) if the model can't be decomposed
+    """
+    cls = type(model)
+    if not cls.__module__.startswith(_SAFETENSORS_MODULES) or not hasattr(model, 'get_params'):
+        return False
+    
+    arrays = {}
+    attributes = {}
+    try:
+        params = _to_json_value(model.get_params(deep=False))
+        for name, value in model.__dict__.items():
+            if isinstance(value, np.ndarray) and value.dtype.kind in "biuf":
+                arrays[name] = np.ascontiguousarray(value)
+            else:
+                attributes[name] = _to_json_value(value)
+    except TypeError:
+        return False
+    
+    structure = {
+        'class': f"{cls.__module__}.{cls.__qualname__}",
+        'params': params,
+        'attributes': attributes
+    }
+    save_safetensors(arrays, str(model_path / _WEIGHTS_FILE))
+    with open(model_path / _STRUCTURE_FILE, 'w') as f:
+        json.dump(structure, f)
+    return True
+
+
+def _load_model_safetensors(model_path: Path) -> Any:
+    """Rebuild an estimator saved by _save_model_safetensors"""
+    with open(model_path / _STRUCTURE_FILE, 'r') as f:
+        structure = json.load(f)
+    
+    module_name, _, class_name = structure['class'].rpartition('.')
+    if not (module_name + ".").startswith(_SAFETENSORS_MODULES):
+        raise ValueError(f"Refusing to load model class {structure['class']}")
+    cls = getattr(importlib.import_module(module_name), class_name)
+    
+    model = cls(**_from_json_value(structure['params']))
+    model.__dict__.update(_from_json_value(structure['attributes']))
+    model.__dict__.update(load_safetensors(str(model_path / _WEIGHTS_FILE)))
+    return model
+
+
 class ModelStatus(Enum):
     """Model status"""
     TRAINING = "training"
@@ -58,15 +275,35 @@ class ModelMetadata:
     description: str = ""
 
 
+def _nan_for_null(values: Dict[str, Any]) -> Dict[str, Any]:
+    """Restore NaN metric values that msgspec wrote as null"""
+    return {k: float('nan') if v is None else v for k, v in values.items()}
+
+
+def _msgspec_enc_hook(obj: Any) -> Any:
+    """Encode numpy scalars (e.g. sklearn metric values) as Python numbers"""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise NotImplementedError(f"Cannot encode {type(obj).__name__}")
+
+
+if MSGSPEC_AVAILABLE:
+    # C-speed metadata.json round-trip straight to/from ModelMetadata
+    _metadata_encoder = msgspec.json.Encoder(enc_hook=_msgspec_enc_hook)
+    _metadata_decoder = msgspec.json.Decoder(ModelMetadata)
+
+
 @dataclass
 class ModelRegistryConfig:
     """Model registry configuration"""
-    storage_path: str = "models"
+    storage_path: str = "models"  # local filesystem; model arrays are memory-mapped from it
     max_models_per_type: int = 10
     auto_cleanup: bool = True
     validation_threshold: float = 0.7
     deployment_threshold: float = 0.8
     backup_frequency: int = 3600  # seconds
+    use_safetensors: bool = True  # store decomposable sklearn models as safetensors + JSON
+    deployment_history_size: int = 1000  # most recent deployments kept in memory
 
 
 class ModelRegistry:
@@ -74,6 +311,15 @@ class ModelRegistry:
     Advanced model registry with versioning and deployment management
     """
     
+    # Metrics that must reach deployment_threshold before a model is deployed
+    _GATED_METRICS = frozenset({'accuracy', 'precision', 'recall', 'f1_score'})
+    
+    # Periodic jobs run by _scheduler_loop as (method name, interval in seconds)
+    _MAINTENANCE_STEPS = (
+        ('_performance_monitoring_step', 1800),  # Check every 30 minutes
+        ('_cleanup_step', 3600),  # Run every hour
+    )
+    
     def __init__(self, config: ModelRegistryConfig):
         self.config = config
         self.logger = logging.getLogger(__name__)
@@ -89,14 +335,47 @@ class ModelRegistry:
         self.models = {}
         self.model_metadata = {}
         self.deployed_models = {}
+        self._id_to_path: Dict[str, Path] = {}
         
         # Performance tracking
         self.model_performance = {}
-        self.deployment_history = []
+        self.deployment_history = deque(maxlen=config.deployment_history_size)
+        
+        # Bumped by every registry mutation; cached views are keyed on it
+        self._registry_version = 0
+        self._latest_cache: Tuple[Optional[int], Dict[str, Any]] = (None, {})
+        self._status_cache: Tuple[Optional[int], Dict[str, Any]] = (None, {})
+        
+        # Registered model ids per type, kept in step with model_metadata
+        self._models_by_type: Dict[str, set] = defaultdict(set)
+        
+        # Per-type min-heaps of (created_at, model_id) for oldest-first cleanup;
+        # removed models stay as stale entries (skipped on pop)
+        self._per_type_heap: Dict[str, List[Tuple[datetime, str]]] = defaultdict(list)
         
         # Background tasks
         self.is_running = False
         
+        # Threads for blocking disk I/O (model and metadata files)
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 1) * 4),
+            thread_name_prefix="model-registry-io"
+        )
+        
+        # Serializes blob create/link/release across I/O threads
+        self._blob_lock = threading.Lock()
+        
+        # Registered models waiting to be written by _writer_loop, as
+        # (model, metadata, model_path); ids stay in _pending_writes until
+        # written and are served from self.models meanwhile
+        self._write_queue: asyncio.Queue = asyncio.Queue()
+        self._pending_writes: set = set()
+        self._writer_task: Optional[asyncio.Task] = None
+        
+        # Background writes that failed since the last flush(), by model id;
+        # those models stay registered in memory with status FAILED
+        self._failed_writes: Dict[str, Exception] = {}
+        
     async def initialize(self, metrics=None) -> bool:
         """Initialize model registry"""
         try:
@@ -111,8 +390,8 @@ class ModelRegistry:
             
             # Start background tasks
             self.is_running = True
-            asyncio.create_task(self._cleanup_loop())
-            asyncio.create_task(self._performance_monitoring_loop())
+            self._writer_task = asyncio.create_task(self._writer_loop())
+            asyncio.create_task(self._scheduler_loop())
             
             self.logger.info("Model registry initialized successfully")
             return True
@@ -130,17 +409,20 @@ class ModelRegistry:
             if not await self._validate_model(model, metadata):
                 return False
             
-            # Save model
             model_path = self.storage_path / f"{metadata.model_id}_{metadata.version}"
-            await self._save_model(model, model_path)
             
-            # Save metadata
-            metadata_path = model_path / "metadata.json"
-            await self._save_metadata(metadata, metadata_path)
+            if self._writer_task is None or self._writer_task.done():
+                # No background writer (not initialized): save inline
+                await self._write_model(model, metadata, model_path)
+            else:
+                # Save model and metadata in the background
+                self._pending_writes.add(metadata.model_id)
+                self._write_queue.put_nowait((model, metadata, model_path))
             
             # Update registry
             self.models[metadata.model_id] = model
-            self.model_metadata[metadata.model_id] = metadata
+            self._add_metadata(metadata)
+            self._id_to_path[metadata.model_id] = model_path
             
             # Record metrics
             await self.metrics.record_model_registration(metadata)
@@ -152,6 +434,48 @@ class ModelRegistry:
             self.logger.error(f"Error registering model: {e}")
             return False
     
+    async def flush(self) -> Dict[str, Exception]:
+        """
+        Wait until every registered model has been written to storage
+        Returns the models whose background write failed since the last flush
+        """
+        await self._write_queue.join()
+        failed, self._failed_writes = self._failed_writes, {}
+        return failed
+    
+    async def _writer_loop(self) -> None:
+        """Write queued model registrations to storage"""
+        while True:
+            model, metadata, model_path = await self._write_queue.get()
+            try:
+                # Skip models removed or re-registered since they were queued
+                if self.model_metadata.get(metadata.model_id) is metadata:
+                    await self._write_model(model, metadata, model_path)
+                    self._failed_writes.pop(metadata.model_id, None)
+                
+                # _remove_model leaves pending models' files to the writer
+                if metadata.model_id not in self.model_metadata:
+                    await self._run_io(self._remove_model_dir, model_path)
+            except Exception as e:
+                self.logger.error(f"Error writing model {metadata.model_id}: {e}")
+                if self.model_metadata.get(metadata.model_id) is metadata:
+                    metadata.status = ModelStatus.FAILED
+                    self._failed_writes[metadata.model_id] = e
+                    self._registry_version += 1
+            finally:
+                if self.model_metadata.get(metadata.model_id) is metadata:
+                    self._pending_writes.discard(metadata.model_id)
+                self._write_queue.task_done()
+    
+    async def _write_model(self, model: Any, metadata: ModelMetadata, model_path: Path) -> None:
+        """Save a model and its metadata"""
+        # Save model
+        await self._save_model(model, model_path)
+        
+        # Save metadata
+        metadata_path = model_path / "metadata.json"
+        await self._save_metadata(metadata, metadata_path)
+    
     async def load_model(self, model_id: str) -> Optional[Any]:
         """Load a model by ID"""
         try:
@@ -176,7 +500,7 @@ class ModelRegistry:
         try:
             scaler_path = self.storage_path / f"{scaler_id}.pkl"
             if scaler_path.exists():
-                return joblib.load(scaler_path)
+                return await self._run_io(joblib.load, scaler_path, 'r')
             return None
             
         except Exception as e:
@@ -188,7 +512,7 @@ class ModelRegistry:
         try:
             model_path = self.storage_path / f"{model_id}.pkl"
             
-            joblib.dump(model, model_path)
+            await self._run_io(_dump_uncompressed, model, model_path)
             
             self.logger.info(f"Model saved: {model_id}")
             return True
@@ -202,7 +526,7 @@ class ModelRegistry:
         try:
             scaler_path = self.storage_path / f"{scaler_id}.pkl"
             
-            joblib.dump(scaler, scaler_path)
+            await self._run_io(_dump_uncompressed, scaler, scaler_path)
             
             self.logger.info(f"Scaler saved: {scaler_id}")
             return True
@@ -214,31 +538,30 @@ class ModelRegistry:
     async def get_latest_models(self) -> Dict[str, Any]:
         """Get the latest models by type"""
         try:
-            latest_models = {}
+            version = self._registry_version
+            if self._latest_cache[0] == version:
+                return dict(self._latest_cache[1])
             
-            # Group models by type
-            models_by_type = {}
-            for model_id, metadata in self.model_metadata.items():
-                model_type = metadata.model_type.value
-                if model_type not in models_by_type:
-                    models_by_type[model_type] = []
-                models_by_type[model_type].append((model_id, metadata))
+            latest_models = {}
             
             # Get latest model for each type
-            for model_type, model_list in models_by_type.items():
-                # Sort by creation date
-                model_list.sort(key=lambda x: x[1].created_at, reverse=True)
+            for model_type, model_ids in list(self._models_by_type.items()):
+                if not model_ids:
+                    continue
                 
-                if model_list:
-                    latest_model_id, latest_metadata = model_list[0]
-                    latest_model = await self.load_model(latest_model_id)
-                    if latest_model:
-                        latest_models[model_type] = {
-                            'model': latest_model,
-                            'metadata': latest_metadata
-                        }
-            
-            return latest_models
+                latest_model_id = max(model_ids, key=lambda model_id: self.model_metadata[model_id].created_at)
+                latest_metadata = self.model_metadata[latest_model_id]
+                latest_model = await self.load_model(latest_model_id)
+                if latest_model:
+                    latest_models[model_type] = {
+                        'model': latest_model,
+                        'metadata': latest_metadata
+                    }
+            
+            # Keyed on the version read before awaiting, so concurrent changes
+            # force a rebuild next time
+            self._latest_cache = (version, latest_models)
+            return dict(latest_models)
             
         except Exception as e:
             self.logger.error(f"Error getting latest models: {e}")
@@ -272,6 +595,7 @@ class ModelRegistry:
             # Update status
             metadata.status = ModelStatus.DEPLOYED
             metadata.updated_at = datetime.now()
+            self._registry_version += 1
             
             # Record deployment
             self.deployment_history.append({
@@ -295,6 +619,7 @@ class ModelRegistry:
         try:
             if model_id in self.deployed_models:
                 del self.deployed_models[model_id]
+                self._registry_version += 1
                 
                 # Update status
                 if model_id in self.model_metadata:
@@ -323,32 +648,31 @@ class ModelRegistry:
             
             X_test, y_test = test_data
             
-            # Make predictions
-            y_pred = model.predict(X_test)
-            
             # Calculate metrics
             metrics = {}
             
             if hasattr(model, 'predict_proba'):
+                # One pass over the data: predicted class is the most probable one
                 y_pred_proba = model.predict_proba(X_test)
-                if y_pred_proba.shape[1] == 2:
-                    y_pred_proba = y_pred_proba[:, 1]
+                y_pred = y_pred_proba.argmax(axis=1)
+                classes = getattr(model, 'classes_', None)
+                if classes is not None:
+                    y_pred = classes[y_pred]
                 
                 # Binary classification metrics
-                metrics['accuracy'] = accuracy_score(y_test, y_pred)
-                metrics['precision'] = precision_score(y_test, y_pred, average='binary')
-                metrics['recall'] = recall_score(y_test, y_pred, average='binary')
-                metrics['f1_score'] = f1_score(y_test, y_pred, average='binary')
-                
-                # Cross-validation
-                cv_scores = cross_val_score(model, X_test, y_test, cv=5)
-                metrics['cv_mean'] = cv_scores.mean()
-                metrics['cv_std'] = cv_scores.std()
+                precision, recall, f1, _ = precision_recall_fscore_support(
+                    y_test, y_pred, average='binary'
+                )
+                metrics['accuracy'] = float(np.mean(y_pred == np.asarray(y_test)))
+                metrics['precision'] = float(precision)
+                metrics['recall'] = float(recall)
+                metrics['f1_score'] = float(f1)
             
             else:
                 # Regression metrics
                 from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
                 
+                y_pred = model.predict(X_test)
                 metrics['mse'] = mean_squared_error(y_test, y_pred)
                 metrics['mae'] = mean_absolute_error(y_test, y_pred)
                 metrics['r2'] = r2_score(y_test, y_pred)
@@ -367,6 +691,26 @@ class ModelRegistry:
             self.logger.error(f"Error evaluating model {model_id}: {e}")
             return {}
     
+    async def cross_validate_model(self, model_id: str, data: Tuple[np.ndarray, np.ndarray],
+                                   cv: int = 5) -> Dict[str, float]:
+        """Cross-validate a model's estimator on the given data"""
+        try:
+            model = await self.load_model(model_id)
+            if not model:
+                return {}
+            
+            X, y = data
+            cv_scores = cross_val_score(model, X, y, cv=cv)
+            metrics = {'cv_mean': float(cv_scores.mean()), 'cv_std': float(cv_scores.std())}
+            
+            # Merge into the latest evaluation
+            self.model_performance.setdefault(model_id, {}).update(metrics)
+            return metrics
+            
+        except Exception as e:
+            self.logger.error(f"Error cross-validating model {model_id}: {e}")
+            return {}
+    
     async def compare_models(self, model_ids: List[str]) -> Dict[str, Any]:
         """Compare multiple models"""
         try:
@@ -420,13 +764,12 @@ class ModelRegistry:
             if metadata.status != ModelStatus.VALIDATED:
                 return False
             
-            # Check performance metrics
-            if metadata.performance_metrics:
-                # Check if metrics meet threshold
-                for metric, value in metadata.performance_metrics.items():
-                    if metric in ['accuracy', 'precision', 'recall', 'f1_score']:
-                        if value < self.config.deployment_threshold:
-                            return False
+            # Check if gated metrics meet threshold
+            metrics = metadata.performance_metrics
+            if metrics:
+                gated = self._GATED_METRICS & metrics.keys()
+                values = np.fromiter((metrics[k] for k in gated), dtype=np.float64, count=len(gated))
+                return not bool(np.any(values < self.config.deployment_threshold))
             
             return True
             
@@ -437,19 +780,41 @@ class ModelRegistry:
     async def _save_model(self, model: Any, model_path: Path) -> None:
         """Save model to storage"""
         try:
-            model_path.mkdir(parents=True, exist_ok=True)
-            
-            # Save model using joblib (safer than pickle)
-            model_file = model_path / "model.pkl"
-            joblib.dump(model, model_file)
+            await self._run_io(self._save_model_sync, model, model_path)
             
         except Exception as e:
             self.logger.error(f"Error saving model: {e}")
             raise
     
+    def _save_model_sync(self, model: Any, model_path: Path) -> None:
+        """Write a model directory's model files (runs on the I/O pool)"""
+        model_path.mkdir(parents=True, exist_ok=True)
+        
+        # Prefer safetensors weights (no code runs on load); fall back to a
+        # deduplicated joblib pickle
+        blobs_path = self.storage_path / _BLOBS_DIR
+        if (SAFETENSORS_AVAILABLE and self.config.use_safetensors
+                and _save_model_safetensors(model, model_path)):
+            _remove_model_pkl(model_path, blobs_path, self._blob_lock)
+        else:
+            _dump_deduplicated(model, model_path, blobs_path, self._blob_lock)
+            (model_path / _WEIGHTS_FILE).unlink(missing_ok=True)
+            (model_path / _STRUCTURE_FILE).unlink(missing_ok=True)
+    
+    def _remove_model_dir(self, model_path: Path) -> None:
+        """Delete a model directory and release its blob (runs on the I/O pool)"""
+        _remove_model_pkl(model_path, self.storage_path / _BLOBS_DIR, self._blob_lock)
+        shutil.rmtree(model_path, ignore_errors=True)
+    
     async def _save_metadata(self, metadata: ModelMetadata, metadata_path: Path) -> None:
         """Save model metadata"""
         try:
+            if MSGSPEC_AVAILABLE:
+                # Encoded on the loop thread so the worker writes a snapshot
+                data = _metadata_encoder.encode(metadata)
+                await self._run_io(_write_bytes, data, metadata_path)
+                return
+            
             metadata_dict = {
                 'model_id': metadata.model_id,
                 'name': metadata.name,
@@ -467,8 +832,7 @@ class ModelRegistry:
                 'description': metadata.description
             }
             
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata_dict, f, indent=2)
+            await self._run_io(_write_json, metadata_dict, metadata_path)
             
         except Exception as e:
             self.logger.error(f"Error saving metadata: {e}")
@@ -477,54 +841,116 @@ class ModelRegistry:
     async def _load_models(self) -> None:
         """Load models from storage"""
         try:
-            for model_dir in self.storage_path.iterdir():
-                if model_dir.is_dir():
-                    metadata_path = model_dir / "metadata.json"
-                    if metadata_path.exists():
-                        with open(metadata_path, 'r') as f:
-                            metadata_dict = json.load(f)
-                        
-                        # Convert back to ModelMetadata
-                        metadata = ModelMetadata(
-                            model_id=metadata_dict['model_id'],
-                            name=metadata_dict['name'],
-                            version=metadata_dict['version'],
-                            model_type=ModelType(metadata_dict['model_type']),
-                            status=ModelStatus(metadata_dict['status']),
-                            created_at=datetime.fromisoformat(metadata_dict['created_at']),
-                            updated_at=datetime.fromisoformat(metadata_dict['updated_at']),
-                            performance_metrics=metadata_dict['performance_metrics'],
-                            feature_importance=metadata_dict['feature_importance'],
-                            training_data_hash=metadata_dict['training_data_hash'],
-                            model_hash=metadata_dict['model_hash'],
-                            dependencies=metadata_dict['dependencies'],
-                            tags=metadata_dict['tags'],
-                            description=metadata_dict.get('description', '')
-                        )
-                        
-                        self.model_metadata[metadata.model_id] = metadata
-                        
-                        # Load model if deployed
-                        if metadata.status == ModelStatus.DEPLOYED:
-                            model = await self._load_model_from_path(model_dir)
-                            if model:
-                                self.deployed_models[metadata.model_id] = {
-                                    'model': model,
-                                    'metadata': metadata,
-                                    'deployed_at': metadata.updated_at
-                                }
-            
+            model_dirs = await self._run_io(self._list_model_dirs)
+            
+            # Read metadata in parallel on the I/O pool
+            results = await asyncio.gather(
+                *(self._run_io(self._read_metadata_sync, model_dir) for model_dir in model_dirs),
+                return_exceptions=True
+            )
+            
+            # Merge on the event loop thread so the registry dicts aren't shared
+            deployed = []
+            for model_dir, result in zip(model_dirs, results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"Error loading model from {model_dir}: {result}")
+                    continue
+                
+                self._add_metadata(result)
+                self._id_to_path[result.model_id] = model_dir
+                if result.status == ModelStatus.DEPLOYED:
+                    deployed.append((model_dir, result))
+            
+            # Warm the page cache for every deployed model file at once, so
+            # the loads below (GIL-bound unpickling) don't wait on the disk
+            await self._prefetch_paths([
+                model_dir / name for model_dir, _ in deployed
+                for name in ("model.pkl", _WEIGHTS_FILE)
+                if (model_dir / name).exists()
+            ])
+            
+            # Load deployed models
+            models = await asyncio.gather(
+                *(self._run_io(self._load_model_file, model_dir) for model_dir, _ in deployed)
+            )
+            for (_, metadata), model in zip(deployed, models):
+                if model is not None:
+                    self.deployed_models[metadata.model_id] = {
+                        'model': model,
+                        'metadata': metadata,
+                        'deployed_at': metadata.updated_at
+                    }
+            
+            self._registry_version += 1
             self.logger.info(f"Loaded {len(self.model_metadata)} models")
             
         except Exception as e:
             self.logger.error(f"Error loading models: {e}")
     
+    def _list_model_dirs(self) -> List[Path]:
+        """Model directories under storage_path that have metadata"""
+        return [
+            model_dir for model_dir in self.storage_path.iterdir()
+            if model_dir.is_dir() and (model_dir / "metadata.json").exists()
+        ]
+    
+    def _read_metadata_sync(self, model_dir: Path) -> ModelMetadata:
+        """Read one model directory's metadata"""
+        if MSGSPEC_AVAILABLE:
+            with open(model_dir / "metadata.json", 'rb') as f:
+                data = f.read()
+            try:
+                return _metadata_decoder.decode(data)
+            except msgspec.DecodeError:
+                # NaN metrics (null, or NaN from stdlib json); parsed leniently below
+                pass
+            metadata_dict = json.loads(data)
+        else:
+            with open(model_dir / "metadata.json", 'r') as f:
+                metadata_dict = json.load(f)
+        
+        # Convert back to ModelMetadata
+        return ModelMetadata(
+            model_id=metadata_dict['model_id'],
+            name=metadata_dict['name'],
+            version=metadata_dict['version'],
+            model_type=ModelType(metadata_dict['model_type']),
+            status=ModelStatus(metadata_dict['status']),
+            created_at=datetime.fromisoformat(metadata_dict['created_at']),
+            updated_at=datetime.fromisoformat(metadata_dict['updated_at']),
+            performance_metrics=_nan_for_null(metadata_dict['performance_metrics']),
+            feature_importance=_nan_for_null(metadata_dict['feature_importance']),
+            training_data_hash=metadata_dict['training_data_hash'],
+            model_hash=metadata_dict['model_hash'],
+            dependencies=metadata_dict['dependencies'],
+            tags=metadata_dict['tags'],
+            description=metadata_dict.get('description', '')
+        )
+    
+    async def _prefetch_paths(self, paths: List[Path]) -> None:
+        """Read files into the page cache concurrently"""
+        await asyncio.gather(
+            *(self._run_io(_prefetch_file, path) for path in paths),
+            return_exceptions=True
+        )
+    
     async def _load_model_from_path(self, model_path: Path) -> Optional[Any]:
         """Load model from path"""
+        return await self._run_io(self._load_model_file, model_path)
+    
+    async def _run_io(self, func, *args) -> Any:
+        """Run a blocking disk call on the I/O pool"""
+        return await asyncio.get_running_loop().run_in_executor(self._io_pool, func, *args)
+    
+    def _load_model_file(self, model_path: Path) -> Optional[Any]:
+        """Load a model directory's safetensors weights or model.pkl"""
         try:
+            if SAFETENSORS_AVAILABLE and (model_path / _WEIGHTS_FILE).exists():
+                return _load_model_safetensors(model_path)
+            
             model_file = model_path / "model.pkl"
             if model_file.exists():
-                return joblib.load(model_file)
+                return joblib.load(model_file, mmap_mode='r')
             return None
             
         except Exception as e:
@@ -533,55 +959,75 @@ class ModelRegistry:
     
     def _find_model_path(self, model_id: str) -> Optional[Path]:
         """Find model path by ID"""
-        try:
-            for model_dir in self.storage_path.iterdir():
-                if model_dir.is_dir() and model_id in model_dir.name:
-                    return model_dir
-            return None
-            
-        except Exception as e:
-            self.logger.error(f"Error finding model path: {e}")
-            return None
+        return self._id_to_path.get(model_id)
     
-    async def _cleanup_loop(self) -> None:
-        """Periodic cleanup of old models"""
+    async def _scheduler_loop(self) -> None:
+        """Run the periodic maintenance steps from a single task"""
+        # Min-heap of (next_run, step index); every step runs once at startup
+        now = time.monotonic()
+        heap = [(now, index) for index in range(len(self._MAINTENANCE_STEPS))]
+        heapq.heapify(heap)
+        
         while self.is_running:
             try:
-                if self.config.auto_cleanup:
-                    await self._cleanup_old_models()
+                await asyncio.sleep(max(0.0, heap[0][0] - time.monotonic()))
+                if not self.is_running:
+                    break
                 
-                await asyncio.sleep(3600)  # Run every hour
+                _, index = heapq.heappop(heap)
+                name, interval = self._MAINTENANCE_STEPS[index]
+                try:
+                    await getattr(self, name)()
+                finally:
+                    heapq.heappush(heap, (time.monotonic() + interval, index))
                 
             except Exception as e:
-                self.logger.error(f"Error in cleanup loop: {e}")
-                await asyncio.sleep(3600)
+                self.logger.error(f"Error in scheduler loop: {e}")
+    
+    async def _cleanup_step(self) -> None:
+        """Periodic cleanup of old models"""
+        if self.config.auto_cleanup:
+            await self._cleanup_old_models()
     
     async def _cleanup_old_models(self) -> None:
         """Clean up old models"""
         try:
-            # Group models by type
-            models_by_type = {}
-            for model_id, metadata in self.model_metadata.items():
-                model_type = metadata.model_type.value
-                if model_type not in models_by_type:
-                    models_by_type[model_type] = []
-                models_by_type[model_type].append((model_id, metadata))
-            
-            # Clean up excess models
-            for model_type, model_list in models_by_type.items():
-                if len(model_list) > self.config.max_models_per_type:
-                    # Sort by creation date (oldest first)
-                    model_list.sort(key=lambda x: x[1].created_at)
-                    
-                    # Remove oldest models
-                    excess_count = len(model_list) - self.config.max_models_per_type
-                    for i in range(excess_count):
-                        model_id, metadata = model_list[i]
+            max_models = self.config.max_models_per_type
+            for model_type, model_ids in list(self._models_by_type.items()):
+                heap = self._per_type_heap[model_type]
+                
+                # Remove oldest models
+                while len(model_ids) > max_models and heap:
+                    created_at, model_id = heapq.heappop(heap)
+                    if self._is_live_entry(model_type, created_at, model_id):
                         await self._remove_model(model_id)
+                
+                # Drop stale entries once they outnumber live ones
+                if len(heap) > 2 * len(model_ids):
+                    heap[:] = [entry for entry in heap if self._is_live_entry(model_type, *entry)]
+                    heapq.heapify(heap)
             
         except Exception as e:
             self.logger.error(f"Error cleaning up old models: {e}")
     
+    def _add_metadata(self, metadata: ModelMetadata) -> None:
+        """Add or replace a model's metadata and index it by type and age"""
+        previous = self.model_metadata.get(metadata.model_id)
+        if previous is not None:
+            self._models_by_type[previous.model_type.value].discard(metadata.model_id)
+        
+        model_type = metadata.model_type.value
+        self.model_metadata[metadata.model_id] = metadata
+        self._models_by_type[model_type].add(metadata.model_id)
+        heapq.heappush(self._per_type_heap[model_type], (metadata.created_at, metadata.model_id))
+        self._registry_version += 1
+    
+    def _is_live_entry(self, model_type: str, created_at: datetime, model_id: str) -> bool:
+        """Whether a per-type heap entry still matches a registered model"""
+        metadata = self.model_metadata.get(model_id)
+        return (metadata is not None and metadata.created_at == created_at
+                and metadata.model_type.value == model_type)
+    
     async def _remove_model(self, model_id: str) -> None:
         """Remove a model"""
         try:
@@ -589,54 +1035,60 @@ class ModelRegistry:
             if model_id in self.models:
                 del self.models[model_id]
             
-            if model_id in self.model_metadata:
-                del self.model_metadata[model_id]
+            pending = model_id in self._pending_writes
+            self._pending_writes.discard(model_id)
+            self._failed_writes.pop(model_id, None)
+            metadata = self.model_metadata.pop(model_id, None)
+            if metadata is not None:
+                self._models_by_type[metadata.model_type.value].discard(model_id)
             
             if model_id in self.deployed_models:
                 del self.deployed_models[model_id]
             
-            # Remove from storage
-            model_path = self._find_model_path(model_id)
-            if model_path and model_path.exists():
-                import shutil
-                shutil.rmtree(model_path)
+            self._registry_version += 1
+            
+            # Remove from storage (_writer_loop cleans up models still being written)
+            model_path = self._id_to_path.pop(model_id, None)
+            if model_path and not pending and model_path.exists():
+                await self._run_io(self._remove_model_dir, model_path)
             
             self.logger.info(f"Model removed: {model_id}")
             
         except Exception as e:
             self.logger.error(f"Error removing model {model_id}: {e}")
     
-    async def _performance_monitoring_loop(self) -> None:
+    async def _performance_monitoring_step(self) -> None:
         """Monitor model performance"""
-        while self.is_running:
-            try:
-                # Check deployed models performance
-                for model_id, model_info in self.deployed_models.items():
-                    if model_id in self.model_performance:
-                        performance = self.model_performance[model_id]
-                        
-                        # Check if performance degraded
-                        if 'accuracy' in performance and performance['accuracy'] < self.config.validation_threshold:
-                            self.logger.warning(f"Model performance degraded: {model_id}")
-                            # Could trigger model retraining or fallback
-                
-                await asyncio.sleep(1800)  # Check every 30 minutes
-                
-            except Exception as e:
-                self.logger.error(f"Error in performance monitoring loop: {e}")
-                await asyncio.sleep(1800)
+        try:
+            # Check deployed models performance
+            for model_id, model_info in self.deployed_models.items():
+                if model_id in self.model_performance:
+                    performance = self.model_performance[model_id]
+                    
+                    # Check if performance degraded
+                    if 'accuracy' in performance and performance['accuracy'] < self.config.validation_threshold:
+                        self.logger.warning(f"Model performance degraded: {model_id}")
+                        # Could trigger model retraining or fallback
+            
+        except Exception as e:
+            self.logger.error(f"Error in performance monitoring: {e}")
     
     def get_status(self) -> Dict[str, Any]:
         """Get model registry status"""
-        return {
-            'total_models': len(self.model_metadata),
-            'deployed_models': len(self.deployed_models),
-            'models_by_type': {
-                model_type.value: len([
-                    m for m in self.model_metadata.values() 
-                    if m.model_type == model_type
-                ]) for model_type in ModelType
-            },
-            'deployment_history_count': len(self.deployment_history),
-            'config': self.config.__dict__
-        }
+        if self._status_cache[0] != self._registry_version:
+            models_by_type = {
+                model_type.value: len(self._models_by_type.get(model_type.value, ()))
+                for model_type in ModelType
+            }
+            
+            self._status_cache = (self._registry_version, {
+                'total_models': len(self.model_metadata),
+                'deployed_models': len(self.deployed_models),
+                'models_by_type': models_by_type,
+                'deployment_history_count': len(self.deployment_history),
+                'config': self.config.__dict__
+            })
+        
+        status = dict(self._status_cache[1])
+        status['models_by_type'] = dict(status['models_by_type'])
+        return status
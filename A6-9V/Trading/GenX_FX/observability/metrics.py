@@ -298,6 +298,22 @@ class MetricsCollector:
             self.logger.error(f"Error getting total trades: {e}")
             return 0
     
+    async def get_perf_snapshot(self) -> np.ndarray:
+        """Get return, Sharpe ratio, max drawdown, win rate and total trades from one query"""
+        try:
+            recent_metrics = await self._get_recent_metrics(hours=24)
+            return np.array([
+                self._get_metric_sum(recent_metrics, 'trade_pnl'),
+                self._calculate_sharpe_ratio(recent_metrics),
+                self._calculate_max_drawdown(recent_metrics),
+                self._calculate_win_rate(recent_metrics),
+                self._get_metric_sum(recent_metrics, 'trades_executed')
+            ], dtype=np.float64)
+            
+        except Exception as e:
+            self.logger.error(f"Error getting performance snapshot: {e}")
+            return np.zeros(5)
+    
     async def get_recent_trades(self) -> List[Dict[str, Any]]:
         """Get recent trades"""
         try:
@@ -0,0 +1,23 @@
+"""
+Optional Cython build for native trading kernels
+
+Builds core/_corr_ext.pyx, the single-pass BTC/Gold correlation kernel;
+crypto_gold_trader uses a NumPy fallback when it is not built.
+
+Usage:
+    python setup_cython.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="genx-fx-native",
+    ext_modules=cythonize(
+        ["core/_corr_ext.pyx"],
+        compiler_directives={
+            "language_level": "3",
+            "boundscheck": False,
+        },
+    ),
+)
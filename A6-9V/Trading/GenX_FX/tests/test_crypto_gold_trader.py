@@ -0,0 +1,106 @@
+"""Tests for the crypto/gold trader's bar store and indicator cache"""
+
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.crypto_gold_trader import BarStore, CryptoGoldTrader
+from core.forex_indicators import ForexIndicators
+
+
+def _frame(n_bars: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, n_bars))
+    return pd.DataFrame({
+        'open': close + rng.normal(0, 0.1, n_bars),
+        'high': close + rng.uniform(0.1, 1.0, n_bars),
+        'low': close - rng.uniform(0.1, 1.0, n_bars),
+        'close': close,
+        'volume': rng.uniform(100, 1000, n_bars),
+    })
+
+
+def _fill(store: BarStore, frame: pd.DataFrame) -> None:
+    for i, row in enumerate(frame.itertuples(index=False)):
+        store.append(row.open, row.high, row.low, row.close, row.volume, timestamp_ns=i)
+
+
+def test_bar_store_window_matches_frame_after_wrapping():
+    capacity = 64
+    frame = _frame(2 * capacity + 37)
+    store = BarStore(capacity)
+    _fill(store, frame)
+    
+    tail = frame.iloc[-capacity:]
+    high, low, close, volume, current_price = store.ohlcv()
+    assert len(store) == capacity
+    np.testing.assert_array_equal(high, tail['high'].to_numpy(dtype=np.float32))
+    np.testing.assert_array_equal(low, tail['low'].to_numpy(dtype=np.float32))
+    np.testing.assert_array_equal(close, tail['close'].to_numpy(dtype=np.float32))
+    np.testing.assert_array_equal(volume, tail['volume'].to_numpy(dtype=np.float32))
+    assert current_price == frame['close'].iat[-1]
+
+
+def test_bar_store_indicators_match_frame_recompute():
+    capacity = 64
+    frame = _frame(3 * capacity + 5, seed=1)
+    store = BarStore(capacity)
+    _fill(store, frame)
+    
+    indicators = ForexIndicators()
+    from_store = indicators.calculate_all_indicators(*store.ohlcv()[:4])
+    from_frame = indicators.calculate_all_indicators(
+        *CryptoGoldTrader._extract_ohlcv(frame.iloc[-capacity:])[:4]
+    )
+    assert from_store.keys() == from_frame.keys()
+    for name in from_frame:
+        np.testing.assert_allclose(from_store[name], from_frame[name], equal_nan=True, err_msg=name)
+
+
+def test_bar_store_reads_are_not_affected_by_later_appends():
+    capacity = 64
+    frame = _frame(2 * capacity + 10, seed=2)
+    store = BarStore(capacity)
+    _fill(store, frame.iloc[:2 * capacity])
+    
+    high, low, close, volume, _ = store.ohlcv()
+    snapshot = [column.copy() for column in (high, low, close, volume)]
+    
+    # The next append slides the columns back to the start
+    _fill(store, frame.iloc[2 * capacity:])
+    for column, expected in zip((high, low, close, volume), snapshot):
+        np.testing.assert_array_equal(column, expected)
+
+
+def test_signal_timestamp_property_matches_timestamp_ns():
+    trader = CryptoGoldTrader()
+    signal = asyncio.run(trader.analyze_pair('BTCUSD', _frame(120, seed=3)))
+    
+    assert signal.timestamp.timestamp() == pytest.approx(signal.timestamp_ns / 1e9, abs=1e-5)
+    assert signal.timestamp.tzinfo is None
+
+
+def test_indicator_cache_hits_on_unchanged_bars_and_misses_on_config_change():
+    trader = CryptoGoldTrader()
+    frame = _frame(120, seed=4)
+    cache = trader.indicator_cache
+    assert cache.maxsize == len(trader.pair_configs)
+    
+    asyncio.run(trader.analyze_pair('BTCUSD', frame))
+    asyncio.run(trader.analyze_pair('BTCUSD', frame))
+    assert (cache.hits, cache.misses) == (1, 1)
+    
+    # A new bar changes the key
+    asyncio.run(trader.analyze_pair('BTCUSD', _frame(121, seed=4)))
+    assert (cache.hits, cache.misses) == (1, 2)
+    
+    # So does a changed indicator config
+    trader.indicators.config.rsi_period = 7
+    signal = asyncio.run(trader.analyze_pair('BTCUSD', frame))
+    assert (cache.hits, cache.misses) == (1, 3)
+    expected = trader.indicators.calculate_all_indicators(
+        *CryptoGoldTrader._extract_ohlcv(frame)[:4]
+    )['rsi'][-1]
+    assert signal.indicators['rsi'] == pytest.approx(float(expected))
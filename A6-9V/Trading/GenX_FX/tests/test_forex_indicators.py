@@ -0,0 +1,94 @@
+"""Tests for the forex indicator calculator"""
+
+import numpy as np
+import pytest
+
+import core.forex_indicators as forex_indicators
+from core.forex_indicators import ForexIndicators, IndicatorConfig, calculate_forex_indicators
+
+
+def _ohlcv(n_bars: int = 300, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, n_bars))
+    high = close + rng.uniform(0.1, 1.0, n_bars)
+    low = close - rng.uniform(0.1, 1.0, n_bars)
+    volume = rng.uniform(100, 1000, n_bars)
+    return high, low, close, volume
+
+
+def test_default_dtype_is_float64():
+    results = calculate_forex_indicators(*_ohlcv())
+    for name, values in results.items():
+        if isinstance(values, np.ndarray) and values.dtype.kind == 'f':
+            assert values.dtype == np.float64, name
+
+
+def test_float32_opt_in_matches_float64():
+    data = _ohlcv()
+    full = ForexIndicators().calculate_all_indicators(*data)
+    single = ForexIndicators(IndicatorConfig(dtype=np.float32)).calculate_all_indicators(*data)
+    
+    assert single['rsi'].dtype == np.float32
+    for name in ('rsi', 'ema_21', 'atr', 'bb_upper', 'macd'):
+        np.testing.assert_allclose(single[name], full[name], rtol=1e-3, atol=1e-3,
+                                   equal_nan=True, err_msg=name)
+
+
+# Indicators that go through TA-Lib when it is installed
+_TALIB_INDICATORS = ('sma_20', 'sma_200', 'ema_9', 'ema_200', 'bb_upper', 'bb_middle',
+                     'bb_lower', 'cci', 'obv', 'macd', 'macd_signal', 'macd_histogram')
+
+
+@pytest.mark.skipif(not forex_indicators.TALIB_AVAILABLE, reason="TA-Lib not installed")
+def test_talib_and_fallback_backends_agree(monkeypatch):
+    data = _ohlcv(seed=1)
+    with_talib = calculate_forex_indicators(*data)
+    monkeypatch.setattr(forex_indicators, "TALIB_AVAILABLE", False)
+    fallback = calculate_forex_indicators(*data)
+    
+    for name in _TALIB_INDICATORS:
+        np.testing.assert_allclose(with_talib[name], fallback[name], rtol=1e-8, atol=1e-8,
+                                   equal_nan=True, err_msg=name)
+
+
+@pytest.mark.parametrize("use_talib", [True, False])
+def test_emas_of_nan_headed_series_are_seeded(monkeypatch, use_talib):
+    if use_talib and not forex_indicators.TALIB_AVAILABLE:
+        pytest.skip("TA-Lib not installed")
+    monkeypatch.setattr(forex_indicators, "TALIB_AVAILABLE", use_talib)
+    results = calculate_forex_indicators(*_ohlcv(seed=2))
+    
+    # MACD signal/histogram and ADX are EMAs of series with leading NaNs
+    for name in ('macd_signal', 'macd_histogram', 'adx'):
+        assert np.isfinite(results[name][-100:]).all(), name
+
+
+def _reference_rsi(prices: np.ndarray, period: int) -> np.ndarray:
+    """Wilder RSI loop the vectorized recurrence replaced"""
+    deltas = np.diff(prices)
+    gains = np.where(deltas > 0, deltas, 0)
+    losses = np.where(deltas < 0, -deltas, 0)
+    rsi = np.full(len(prices), np.nan)
+    avg_gain = np.mean(gains[:period])
+    avg_loss = np.mean(losses[:period])
+    for i in range(period, len(prices) - 1):
+        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
+        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+        rsi[i + 1] = 100.0 if avg_loss == 0 else 100 - 100 / (1 + avg_gain / avg_loss)
+    return rsi
+
+
+def test_rsi_matches_wilder_loop_and_fills_first_value():
+    _, _, close, _ = _ohlcv(seed=3)
+    period = 14
+    rsi = ForexIndicators().calculate_rsi(close, period)
+    
+    assert np.isnan(rsi[:period]).all()
+    np.testing.assert_allclose(rsi[period + 1:], _reference_rsi(close, period)[period + 1:],
+                               rtol=1e-12, atol=1e-10)
+    
+    # rsi[period] comes straight from the seed averages
+    deltas = np.diff(close[:period + 1])
+    avg_gain = deltas.clip(min=0).mean()
+    avg_loss = (-deltas).clip(min=0).mean()
+    assert rsi[period] == pytest.approx(100 - 100 / (1 + avg_gain / avg_loss))
@@ -0,0 +1,186 @@
+"""Tests for the model registry's storage paths"""
+
+import asyncio
+import math
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+
+import ml.model_registry as model_registry
+from ml.model_registry import (
+    ModelMetadata, ModelRegistry, ModelRegistryConfig, ModelStatus, ModelType
+)
+
+X = np.random.RandomState(0).randn(200, 4)
+y = (X[:, 0] > 0).astype(int)
+
+
+class _Metrics:
+    async def record_model_registration(self, metadata):
+        pass
+    
+    async def record_model_deployment(self, metadata):
+        pass
+
+
+def _metadata(model_id: str, day: int = 0, metrics=None) -> ModelMetadata:
+    return ModelMetadata(
+        model_id, "test", "v1", ModelType.CLASSIFICATION, ModelStatus.VALIDATED,
+        datetime(2024, 1, 1) + timedelta(days=day), datetime(2024, 1, 1),
+        metrics or {'accuracy': 0.9}, {}, "data", "hash", [], []
+    )
+
+
+def _classifier() -> LogisticRegression:
+    return LogisticRegression().fit(X, y)
+
+
+def _forest(n_estimators: int = 3) -> RandomForestClassifier:
+    # Trees aren't decomposable into safetensors, so forests are pickled
+    return RandomForestClassifier(n_estimators, random_state=0).fit(X, y)
+
+
+def _blob_links(storage_path):
+    """Link count of every blob, by digest"""
+    blobs = storage_path / model_registry._BLOBS_DIR
+    if not blobs.exists():
+        return {}
+    return {blob.name: (blob / "model.pkl").stat().st_nlink for blob in blobs.iterdir() if blob.is_dir()}
+
+
+async def _registry(storage_path, **config) -> ModelRegistry:
+    registry = ModelRegistry(ModelRegistryConfig(storage_path=str(storage_path), **config))
+    assert await registry.initialize(_Metrics())
+    return registry
+
+
+async def _close(registry: ModelRegistry) -> None:
+    registry.is_running = False
+    registry._writer_task.cancel()
+    await asyncio.gather(registry._writer_task, return_exceptions=True)
+
+
+def test_flush_reports_failed_background_writes(tmp_path):
+    async def run():
+        registry = await _registry(tmp_path)
+        try:
+            # Lambdas can't be pickled, so the background write fails
+            assert await registry.register_model(lambda x: x, _metadata("bad"))
+            assert await registry.register_model(_classifier(), _metadata("good"))
+            
+            failed = await registry.flush()
+            assert list(failed) == ["bad"]
+            assert registry.model_metadata["bad"].status is ModelStatus.FAILED
+            assert registry.model_metadata["good"].status is ModelStatus.VALIDATED
+            assert await registry.flush() == {}
+        finally:
+            await _close(registry)
+    
+    asyncio.run(run())
+
+
+def test_identical_pickles_share_a_blob_until_the_last_is_removed(tmp_path):
+    async def run():
+        registry = await _registry(tmp_path)
+        try:
+            forest = _forest()
+            for model_id in ("a", "b"):
+                assert await registry.register_model(forest, _metadata(model_id))
+            assert await registry.flush() == {}
+            
+            # One blob, linked from the blob directory and both models
+            assert list(_blob_links(tmp_path).values()) == [3]
+            
+            await registry._remove_model("a")
+            assert list(_blob_links(tmp_path).values()) == [2]
+            registry.models.clear()
+            loaded = await registry.load_model("b")
+            np.testing.assert_array_equal(loaded.predict(X), forest.predict(X))
+            
+            await registry._remove_model("b")
+            assert _blob_links(tmp_path) == {}
+        finally:
+            await _close(registry)
+    
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize("use_safetensors", [True, False])
+def test_models_round_trip_through_safetensors_or_pickle(tmp_path, use_safetensors):
+    if use_safetensors and not model_registry.SAFETENSORS_AVAILABLE:
+        pytest.skip("safetensors not installed")
+    
+    async def run():
+        registry = await _registry(tmp_path, use_safetensors=use_safetensors)
+        try:
+            linear, forest = _classifier(), _forest()
+            assert await registry.register_model(linear, _metadata("linear"))
+            assert await registry.register_model(forest, _metadata("forest"))
+            assert await registry.flush() == {}
+        finally:
+            await _close(registry)
+        
+        linear_path = registry._find_model_path("linear")
+        assert (linear_path / model_registry._WEIGHTS_FILE).exists() == use_safetensors
+        assert (linear_path / "model.pkl").exists() != use_safetensors
+        # Forests always fall back to a pickle
+        assert (registry._find_model_path("forest") / "model.pkl").exists()
+        
+        reloaded = await _registry(tmp_path)
+        try:
+            for model_id, model in (("linear", linear), ("forest", forest)):
+                loaded = await reloaded.load_model(model_id)
+                np.testing.assert_array_equal(loaded.predict(X), model.predict(X))
+        finally:
+            await _close(reloaded)
+    
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize("use_msgspec", [True, False])
+def test_nan_metrics_survive_a_metadata_round_trip(tmp_path, monkeypatch, use_msgspec):
+    if use_msgspec and not model_registry.MSGSPEC_AVAILABLE:
+        pytest.skip("msgspec not installed")
+    monkeypatch.setattr(model_registry, "MSGSPEC_AVAILABLE", use_msgspec)
+    
+    async def run():
+        registry = await _registry(tmp_path)
+        try:
+            metadata = _metadata("m", metrics={'accuracy': float('nan'), 'f1_score': 0.8})
+            assert await registry.register_model(_classifier(), metadata)
+            assert await registry.flush() == {}
+        finally:
+            await _close(registry)
+        
+        reloaded = await _registry(tmp_path)
+        try:
+            metrics = reloaded.model_metadata["m"].performance_metrics
+            assert math.isnan(metrics['accuracy'])
+            assert metrics['f1_score'] == 0.8
+        finally:
+            await _close(reloaded)
+    
+    asyncio.run(run())
+
+
+def test_removing_a_pending_model_leaves_nothing_on_disk(tmp_path):
+    async def run():
+        registry = await _registry(tmp_path)
+        try:
+            assert await registry.register_model(_forest(), _metadata("m"))
+            model_path = registry._find_model_path("m")
+            assert "m" in registry._pending_writes
+            
+            await registry._remove_model("m")
+            assert await registry.flush() == {}
+            
+            assert "m" not in registry.model_metadata
+            assert not model_path.exists()
+            assert _blob_links(tmp_path) == {}
+        finally:
+            await _close(registry)
+    
+    asyncio.run(run())
@@ -0,0 +1,114 @@
+"""Tests for the trading scheduler"""
+
+import asyncio
+import json
+import logging
+from datetime import datetime, time, timedelta, timezone
+
+import numpy as np
+
+from core.trading_scheduler import SessionConfig, TradingScheduler, TradingSession
+
+
+def test_session_overlap_info_is_plain_json():
+    scheduler = TradingScheduler()
+    info = scheduler.get_session_overlap_info()
+    
+    assert json.loads(json.dumps(info)) == info
+    assert info['london_new_york']['pairs'] == ['EURUSD', 'GBPUSD', 'USDJPY']
+    
+    # Each call returns a fresh copy
+    info['tokyo_london']['pairs'].append('XXXYYY')
+    assert scheduler.get_session_overlap_info()['tokyo_london']['pairs'] == ['EURJPY', 'GBPJPY']
+
+
+def test_scheduler_restarts_under_a_new_event_loop(caplog):
+    scheduler = TradingScheduler()
+    
+    async def run_once():
+        await scheduler.start()
+        await asyncio.sleep(0.05)
+        await scheduler.stop()
+        await asyncio.sleep(0.05)
+    
+    # Each asyncio.run() creates a new loop; the second start must not fail
+    # with "bound to a different event loop"
+    with caplog.at_level(logging.ERROR):
+        asyncio.run(run_once())
+        asyncio.run(run_once())
+    assert not scheduler.is_running
+    assert not caplog.records
+
+
+def test_disabled_tasks_leave_the_heap_until_enabled():
+    scheduler = TradingScheduler()
+    runs = []
+    
+    async def callback():
+        runs.append(datetime.now(timezone.utc))
+    
+    async def run():
+        await scheduler.start()
+        try:
+            scheduler.add_scheduled_task("job", "1m", callback, enabled=False)
+            scheduler.scheduled_tasks[0].next_run = datetime.now(timezone.utc)
+            await asyncio.sleep(0.05)
+            assert runs == [] and scheduler._task_heap == []
+            
+            # Already due, so it runs as soon as it is enabled
+            assert scheduler.enable_task("job")
+            await asyncio.sleep(0.05)
+            assert len(runs) == 1 and len(scheduler._task_heap) == 1
+            
+            # Disabled tasks are dropped when they next come due
+            assert scheduler.disable_task("job")
+            scheduler.scheduled_tasks[0].next_run = datetime.now(timezone.utc)
+            scheduler._task_heap[0] = (0, 0)  # make the queued entry due now
+            scheduler._wake()
+            await asyncio.sleep(0.05)
+            assert len(runs) == 1 and scheduler._task_heap == []
+            assert not scheduler.enable_task("missing")
+        finally:
+            await scheduler.stop()
+    
+    asyncio.run(run())
+
+
+def _reference_active(session: SessionConfig, dt: datetime) -> bool:
+    """Per-minute session check the minute-of-week bitmasks replaced"""
+    if dt.weekday() not in session.active_days:
+        return False
+    now = time(dt.hour, dt.minute)
+    if session.open_time > session.close_time:
+        return now >= session.open_time or now <= session.close_time
+    return session.open_time <= now <= session.close_time
+
+
+def test_session_bitmasks_match_per_minute_schedule():
+    scheduler = TradingScheduler()
+    start = datetime(2026, 10, 12, tzinfo=timezone.utc)  # a Monday
+    instants = [start + timedelta(minutes=m, seconds=30) for m in range(7 * 24 * 60)]
+    
+    batch = scheduler.get_active_sessions_batch(
+        np.array([dt.replace(tzinfo=None) for dt in instants], dtype='datetime64[s]')
+    )
+    for row, dt in zip(batch, instants):
+        expected = [
+            session_type for session_type, session in scheduler.sessions.items()
+            if _reference_active(session, dt)
+        ]
+        assert scheduler.get_active_sessions(dt) == expected, dt
+        assert [s for s, active in zip(scheduler.sessions, row) if active] == expected, dt
+
+
+def test_close_boundary_follows_the_whole_close_minute():
+    scheduler = TradingScheduler()
+    wednesday = datetime(2026, 10, 14, tzinfo=timezone.utc)
+    scheduler._build_boundary_heap(wednesday)
+    closes = {session_type: at for at, _, session_type, kind in scheduler._boundary_heap if kind == 'close'}
+    
+    london = scheduler.sessions[TradingSession.LONDON]
+    close_at = datetime.combine(wednesday.date(), london.close_time, tzinfo=timezone.utc)
+    assert closes[TradingSession.LONDON] == close_at + timedelta(minutes=1)
+    assert TradingSession.LONDON in scheduler.get_active_sessions(close_at + timedelta(seconds=59))
+    assert TradingSession.LONDON not in scheduler.get_active_sessions(closes[TradingSession.LONDON])